@@ -0,0 +1 @@
+"""Benchmarks that measure the performance of the simulation pipeline."""
@@ -0,0 +1,138 @@
+# Importing EdgeSimPy components
+from edge_sim_py import *
+
+# Importing customized EdgeSimPy components
+from simulation.custom_component_methods import component_manager_find_by_id
+
+# Importing helper methods
+from simulation.helper_methods import load_dataset
+
+# Importing Python libraries
+from time import perf_counter
+import subprocess
+import argparse
+import resource
+import tempfile
+import json
+import sys
+import os
+
+# Number of copies of the base dataset stacked to create larger scenarios
+SCALES = [1, 10, 100]
+
+# Attributes of users indexed by application IDs
+USER_ATTRIBUTES_BY_APPLICATION = ["delays", "delay_slas", "communication_paths", "making_requests"]
+
+
+def scale_dataset(data: dict, copies: int) -> dict:
+    """Creates a larger dataset by stacking copies of a dataset whose component IDs are shifted to avoid clashes.
+
+    Args:
+        data (dict): Contents of the base dataset.
+        copies (int): Number of copies of the base dataset.
+
+    Returns:
+        scaled_data (dict): Contents of the scaled dataset.
+    """
+    id_offsets = {key: max([item["attributes"]["id"] for item in items], default=0) for key, items in data.items()}
+
+    def shift_reference(value: object, copy: int) -> object:
+        if isinstance(value, dict) and "class" in value and "id" in value and value["class"] in id_offsets:
+            return {**value, "id": value["id"] + copy * id_offsets[value["class"]]}
+        if isinstance(value, list):
+            return [shift_reference(item, copy) for item in value]
+        if isinstance(value, dict):
+            return {key: shift_reference(item, copy) for key, item in value.items()}
+        return value
+
+    scaled_data = {key: [] for key in data.keys()}
+    for copy in range(copies):
+        application_offset = copy * id_offsets.get("Application", 0)
+        for key, items in data.items():
+            for item in items:
+                attributes = {**item["attributes"], "id": item["attributes"]["id"] + copy * id_offsets[key]}
+                relationships = {name: shift_reference(value, copy) for name, value in item["relationships"].items()}
+
+                # Users refer to their applications through dictionary keys
+                if key == "User":
+                    for name in USER_ATTRIBUTES_BY_APPLICATION:
+                        attributes[name] = {str(int(app_id) + application_offset): v for app_id, v in attributes[name].items()}
+                    relationships["access_patterns"] = {
+                        str(int(app_id) + application_offset): value for app_id, value in relationships["access_patterns"].items()
+                    }
+
+                scaled_data[key].append({"attributes": attributes, "relationships": relationships})
+
+    return scaled_data
+
+
+def measure(dataset: str, binary: bool) -> dict:
+    """Measures the time and peak memory usage of loading a dataset in the current process.
+
+    Args:
+        dataset (str): Path of the dataset file.
+        binary (bool): Whether the dataset is loaded as done by the simulation (i.e., from its binary cache, using indexed lookups to
+            resolve relationships) or parsed from JSON by EdgeSimPy.
+
+    Returns:
+        measurements (dict): Load time (in seconds) and peak resident set size (in megabytes) before and after loading the dataset.
+    """
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 1,
+        dump_interval=1,
+        logs_directory=tempfile.gettempdir(),
+    )
+    initial_peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    start = perf_counter()
+    if binary:
+        ComponentManager.find_by_id = classmethod(component_manager_find_by_id)
+        simulator.initialize(input_file=load_dataset(dataset=dataset))
+    else:
+        simulator.initialize(input_file=dataset)
+    load_time = perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {"load_time": load_time, "initial_peak_rss": initial_peak_rss, "peak_rss": peak_rss}
+
+
+def main(dataset: str):
+    """Compares the JSON and binary loading paths on scaled copies of a dataset, measuring each one in a fresh process.
+
+    Args:
+        dataset (str): Path of the base dataset file.
+    """
+    with open(dataset, "r", encoding="UTF-8") as json_file:
+        data = json.load(json_file)
+
+    print(f"{'Scale':>6} {'Path':>7} {'Load time (s)':>14} {'Peak RSS (MB)':>14} {'Baseline RSS (MB)':>18}")
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in SCALES:
+            scaled_dataset = os.path.join(directory, f"dataset_x{scale}.json")
+            with open(scaled_dataset, "w", encoding="UTF-8") as json_file:
+                json.dump(scale_dataset(data=data, copies=scale), json_file)
+
+            # Writing the binary cache before measuring it
+            load_dataset(dataset=scaled_dataset)
+
+            for path in ["json", "binary"]:
+                command = [sys.executable, "-B", "-m", "benchmarks.dataset_loading", "--measure", path, "--dataset", scaled_dataset]
+                measurements = json.loads(subprocess.run(command, check=True, capture_output=True, text=True).stdout.splitlines()[-1])
+                print(
+                    f"{scale:>5}x {path:>7} {measurements['load_time']:>14.3f} {measurements['peak_rss']:>14.1f} "
+                    f"{measurements['initial_peak_rss']:>18.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dataset", "-d", help="Dataset file", default="datasets/dataset1.json")
+    parser.add_argument("--measure", help="Measures a single loading path ('json' or 'binary') in the current process")
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(dataset=args.dataset, binary=args.measure == "binary")))
+    else:
+        main(dataset=args.dataset)
@@ -0,0 +1,88 @@
+# Importing EdgeSimPy components
+from edge_sim_py import *
+
+# Importing customized EdgeSimPy components
+from simulation.custom_component_methods import component_manager_find_by_id
+
+# Importing benchmark helpers
+from benchmarks.dataset_loading import scale_dataset
+
+# Importing Python libraries
+from time import perf_counter
+import argparse
+import tempfile
+import random
+import json
+
+# Number of copies of the base dataset stacked to create larger scenarios
+SCALES = [1, 10, 100]
+
+# Number of lookups measured per component class
+NUMBER_OF_LOOKUPS = 20000
+
+
+def measure_lookups(component_class: type, number_of_lookups: int) -> float:
+    """Measures the average time of looking up components of a given class by their IDs.
+
+    Args:
+        component_class (type): Component class.
+        number_of_lookups (int): Number of lookups performed.
+
+    Returns:
+        lookup_time (float): Average time of a lookup (in microseconds).
+    """
+    ids = [random.choice(component_class.all()).id for _ in range(number_of_lookups)]
+
+    start = perf_counter()
+    for obj_id in ids:
+        component_class.find_by_id(obj_id)
+    lookup_time = (perf_counter() - start) / number_of_lookups * 1e6
+
+    return lookup_time
+
+
+def main(dataset: str):
+    """Compares EdgeSimPy's linear "find_by_id" with the indexed lookups used by the simulation on scaled copies of a dataset.
+
+    Args:
+        dataset (str): Path of the base dataset file.
+    """
+    random.seed(1)
+    original_find_by_id = ComponentManager.__dict__["find_by_id"]
+    indexed_find_by_id = classmethod(component_manager_find_by_id)
+
+    with open(dataset, "r", encoding="UTF-8") as json_file:
+        data = json.load(json_file)
+
+    print(f"{'Scale':>6} {'Component':>14} {'Instances':>10} {'Linear (us)':>12} {'Indexed (us)':>13} {'Speedup':>8}")
+    for scale in SCALES:
+        simulator = Simulator(
+            tick_duration=1,
+            tick_unit="seconds",
+            stopping_criterion=lambda model: model.schedule.steps == 1,
+            dump_interval=1,
+            logs_directory=tempfile.gettempdir(),
+        )
+        simulator.initialize(input_file=scale_dataset(data=data, copies=scale))
+
+        for component_class in [Service, EdgeServer, NetworkSwitch]:
+            ComponentManager.find_by_id = original_find_by_id
+            linear_time = measure_lookups(component_class=component_class, number_of_lookups=NUMBER_OF_LOOKUPS)
+
+            ComponentManager.find_by_id = indexed_find_by_id
+            indexed_time = measure_lookups(component_class=component_class, number_of_lookups=NUMBER_OF_LOOKUPS)
+
+            print(
+                f"{scale:>5}x {component_class.__name__:>14} {component_class.count():>10} {linear_time:>12.3f} "
+                f"{indexed_time:>13.3f} {linear_time / indexed_time:>7.1f}x"
+            )
+
+    ComponentManager.find_by_id = original_find_by_id
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dataset", "-d", help="Dataset file", default="datasets/dataset1.json")
+    args = parser.parse_args()
+
+    main(dataset=args.dataset)
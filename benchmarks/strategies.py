@@ -0,0 +1,308 @@
+# Importing the simulation entry point
+from simulation.__main__ import main as run_simulation
+
+# Importing the scenario generator
+from generate_dataset import generate_dataset
+
+# Importing Python libraries
+from contextlib import redirect_stdout
+from time import perf_counter
+import subprocess
+import argparse
+import resource
+import tempfile
+import platform
+import random
+import json
+import sys
+import os
+
+# Ladder of generated scenarios (edge servers grow with services to keep the occupation of "dataset1", whereas chain lengths
+# and trust patterns follow the generator defaults)
+SCENARIO_SIZES = {
+    "small": {"map_size": 9, "servers_per_model": [1, 1, 4], "applications": 2},
+    "medium": {"map_size": 18, "servers_per_model": [4, 4, 16], "applications": 8},
+    "large": {"map_size": 36, "servers_per_model": [16, 16, 64], "applications": 32},
+}
+
+# Strategies being benchmarked and their parameters
+ALGORITHMS = {
+    "thea": {},
+    "argos": {},
+    "faticanti2020": {},
+    "nsgaii": {"pop_size": 100, "n_gen": 20, "cross_prob": 1, "mut_prob": 0.1},
+}
+
+# Seed values used to generate scenarios and to run the simulations
+GENERATOR_SEED = 1
+SIMULATION_SEED = 1
+
+# Metrics used as objectives and penalties by the placement strategies
+OBJECTIVES = [
+    "overloaded_edge_servers",
+    "overall_occupation",
+    "overall_power_consumption",
+    "delay_sla_violations",
+    "privacy_sla_violations",
+]
+
+# Number of executions of each strategy on each scenario (the fastest one is reported, reducing the noise of wall times)
+REPETITIONS = 3
+
+# Stored objectives against which the objectives of new results are compared (wall times and memory usage depend on the host, so
+# they are only compared against results obtained on the same host)
+BASELINE_FILE = "benchmarks/baseline.json"
+
+
+def create_scenario(size: str, directory: str) -> str:
+    """Generates a scenario of the benchmark ladder.
+
+    Args:
+        size (str): Name of the scenario size.
+        directory (str): Directory where the dataset file is written.
+
+    Returns:
+        dataset (str): Path of the dataset file.
+    """
+    specification = SCENARIO_SIZES[size]
+
+    random.seed(GENERATOR_SEED)
+    data = generate_dataset(
+        map_size=specification["map_size"],
+        servers_per_model=specification["servers_per_model"],
+        application_specifications=[
+            {"number_of_objects": specification["applications"], "number_of_services": chain_length} for chain_length in [1, 2, 4, 8]
+        ],
+    )
+
+    dataset = os.path.join(directory, f"{size}.json")
+    with open(dataset, "w", encoding="UTF-8") as dataset_file:
+        json.dump(data, dataset_file)
+
+    return dataset
+
+
+def measure(algorithm: str, dataset: str) -> dict:
+    """Runs a strategy over a dataset in the current process, measuring its wall time, peak memory usage, and the number of
+    solutions it evaluates.
+
+    Args:
+        algorithm (str): Strategy being executed.
+        dataset (str): Path of the dataset file.
+
+    Returns:
+        measurements (dict): Wall time (in seconds), number of evaluations and evaluations per second (of evaluation time), peak
+            resident set size (in megabytes), and objectives.
+    """
+    # Counting the solutions evaluated by NSGA-II and the time spent evaluating them (solutions served by the fitness cache are not
+    # evaluated)
+    evaluations = 0
+    evaluation_time = 0
+    if algorithm == "nsgaii":
+        from simulation.strategies.nsgaii import PlacementProblem
+
+        evaluate_population = PlacementProblem.evaluate_population
+
+        def counting_evaluate_population(self, x):
+            nonlocal evaluations, evaluation_time
+            start = perf_counter()
+            output = evaluate_population(self, x)
+            evaluation_time += perf_counter() - start
+            evaluations += len(x)
+            return output
+
+        PlacementProblem.evaluate_population = counting_evaluate_population
+
+    # Running the simulation inside a temporary directory that receives its logs, discarding its output
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as logs_directory, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        os.chdir(logs_directory)
+        try:
+            start = perf_counter()
+            metrics = run_simulation(
+                seed_value=SIMULATION_SEED, algorithm=algorithm, dataset=dataset, parameters=dict(ALGORITHMS[algorithm])
+            )
+            wall_time = perf_counter() - start
+        finally:
+            os.chdir(working_directory)
+
+    measurements = {
+        "wall_time": wall_time,
+        "evaluations": evaluations,
+        "evaluations_per_second": evaluations / evaluation_time if evaluations > 0 else None,
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "objectives": {objective: metrics[objective] for objective in OBJECTIVES},
+    }
+    return measurements
+
+
+def get_host() -> dict:
+    """Describes the host running the benchmark, which identifies the results whose wall times and memory usage are comparable.
+
+    Returns:
+        host (dict): Host name, machine type, processor, number of CPUs, and Python version.
+    """
+    host = {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+    return host
+
+
+def compare(results: dict, baseline: dict, reference: dict = {}) -> dict:
+    """Compares benchmark results against the stored baseline objectives and (optionally) against the wall times and memory usage of
+    reference results obtained on the same host.
+
+    Args:
+        results (dict): Benchmark results, indexed by scenario size and algorithm.
+        baseline (dict): Baseline objectives, indexed by scenario size and algorithm.
+        reference (dict, optional): Reference results, indexed by scenario size and algorithm. Defaults to {}.
+
+    Returns:
+        comparison (dict): Objectives that changed, speedups, and memory ratios (or None without reference results), indexed by
+            scenario size and algorithm.
+    """
+    comparison = {}
+    for size, algorithms in results.items():
+        for algorithm, measurements in algorithms.items():
+            baseline_objectives = baseline.get(size, {}).get(algorithm)
+            reference_measurements = reference.get(size, {}).get(algorithm)
+            if baseline_objectives is None and reference_measurements is None:
+                continue
+
+            changed_objectives = None
+            if baseline_objectives is not None:
+                changed_objectives = {
+                    objective: {"baseline": baseline_objectives[objective], "current": value}
+                    for objective, value in measurements["objectives"].items()
+                    if baseline_objectives.get(objective) != value
+                }
+
+            comparison.setdefault(size, {})[algorithm] = {
+                "speedup": reference_measurements["wall_time"] / measurements["wall_time"] if reference_measurements else None,
+                "peak_rss_ratio": measurements["peak_rss"] / reference_measurements["peak_rss"] if reference_measurements else None,
+                "changed_objectives": changed_objectives,
+            }
+
+    return comparison
+
+
+def main(
+    sizes: list, algorithms: list, repetitions: int, output: str, baseline_file: str, update_baseline: bool, reference_file: str = None
+):
+    """Runs the strategies on the ladder of scenario sizes (each execution in a fresh process), writes the results, and compares
+    their objectives against the stored baseline. Speedups and memory ratios are only reported against reference results (e.g., the
+    results file of a run over another version of the code) obtained on the same host.
+
+    Args:
+        sizes (list): Scenario sizes to benchmark.
+        algorithms (list): Strategies to benchmark.
+        repetitions (int): Number of executions of each strategy on each scenario.
+        output (str): Path of the results file.
+        baseline_file (str): Path of the baseline file.
+        update_baseline (bool): Whether the objectives of the results replace the stored baseline.
+        reference_file (str, optional): Path of the reference results file. Defaults to None.
+    """
+    baseline = {}
+    if os.path.exists(baseline_file):
+        with open(baseline_file, "r", encoding="UTF-8") as json_file:
+            baseline = json.load(json_file).get("objectives", {})
+
+    host = get_host()
+    reference = {}
+    if reference_file is not None:
+        with open(reference_file, "r", encoding="UTF-8") as json_file:
+            reference_report = json.load(json_file)
+        if reference_report.get("host") == host:
+            reference = reference_report["results"]
+        else:
+            print(f"Reference results were obtained on another host ({reference_report.get('host')}), so speedups are not reported")
+
+    results = {}
+    print(
+        f"{'Size':>7} {'Algorithm':>14} {'Wall time (s)':>14} {'Evals/s':>10} {'Peak RSS (MB)':>14} {'Speedup':>8} {'Objectives':>11}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            dataset = create_scenario(size=size, directory=directory)
+
+            # Running the cheapest strategy once, so that the binary cache and shortest paths of the dataset are not measured
+            command = [sys.executable, "-B", "-m", "benchmarks.strategies", "--measure", "argos", "--dataset", dataset]
+            subprocess.run(command, check=True, capture_output=True)
+
+            for algorithm in algorithms:
+                command = [sys.executable, "-B", "-m", "benchmarks.strategies", "--measure", algorithm, "--dataset", dataset]
+                executions = []
+                for _ in range(repetitions):
+                    output_lines = subprocess.run(command, check=True, capture_output=True, text=True).stdout.splitlines()
+                    executions.append(json.loads(output_lines[-1]))
+                measurements = min(executions, key=lambda execution: execution["wall_time"])
+                results.setdefault(size, {})[algorithm] = measurements
+
+                comparison = compare(results={size: {algorithm: measurements}}, baseline=baseline, reference=reference)
+                comparison = comparison.get(size, {}).get(algorithm, {})
+                speedup = f"{comparison['speedup']:.2f}x" if comparison.get("speedup") is not None else "-"
+                changed_objectives = comparison.get("changed_objectives")
+                objectives = ("changed" if changed_objectives else "same") if changed_objectives is not None else "-"
+                evaluations_per_second = measurements["evaluations_per_second"]
+                print(
+                    f"{size:>7} {algorithm:>14} {measurements['wall_time']:>14.3f} "
+                    f"{f'{evaluations_per_second:.0f}' if evaluations_per_second else '-':>10} {measurements['peak_rss']:>14.1f} "
+                    f"{speedup:>8} {objectives:>11}"
+                )
+
+    report = {
+        "scenario_sizes": {size: SCENARIO_SIZES[size] for size in sizes},
+        "algorithms": {algorithm: ALGORITHMS[algorithm] for algorithm in algorithms},
+        "seeds": {"generator": GENERATOR_SEED, "simulation": SIMULATION_SEED},
+        "repetitions": repetitions,
+        "host": host,
+        "results": results,
+        "comparison": compare(results=results, baseline=baseline, reference=reference),
+    }
+    with open(output, "w", encoding="UTF-8") as json_file:
+        json.dump(report, json_file, indent=4)
+
+    # Storing only the objectives of the results as the baseline, as they do not depend on the host
+    if update_baseline:
+        stored_baseline = {
+            "scenario_sizes": report["scenario_sizes"],
+            "algorithms": report["algorithms"],
+            "seeds": report["seeds"],
+            "objectives": {
+                size: {algorithm: measurements["objectives"] for algorithm, measurements in algorithms.items()}
+                for size, algorithms in results.items()
+            },
+        }
+        with open(baseline_file, "w", encoding="UTF-8") as json_file:
+            json.dump(stored_baseline, json_file, indent=4)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", help="Scenario sizes", nargs="+", default=list(SCENARIO_SIZES.keys()))
+    parser.add_argument("--algorithms", help="Strategies", nargs="+", default=list(ALGORITHMS.keys()))
+    parser.add_argument("--repetitions", "-r", help="Executions of each strategy on each scenario", type=int, default=REPETITIONS)
+    parser.add_argument("--output", "-o", help="Results file", default="benchmark.json")
+    parser.add_argument("--baseline", help="Baseline file", default=BASELINE_FILE)
+    parser.add_argument("--update_baseline", help="Stores the objectives of the results as the new baseline", action="store_true")
+    parser.add_argument("--reference", help="Results file obtained on the same host against which speedups are reported")
+    parser.add_argument("--measure", help="Measures a single strategy in the current process")
+    parser.add_argument("--dataset", "-d", help="Dataset file (used with --measure)")
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(algorithm=args.measure, dataset=args.dataset)))
+    else:
+        main(
+            sizes=args.sizes,
+            algorithms=args.algorithms,
+            repetitions=args.repetitions,
+            output=args.output,
+            baseline_file=args.baseline,
+            update_baseline=args.update_baseline,
+            reference_file=args.reference,
+        )
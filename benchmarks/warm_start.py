@@ -0,0 +1,155 @@
+# Importing the simulation entry point
+from simulation.__main__ import main as run_simulation
+
+# Importing benchmark helpers
+from benchmarks.strategies import SCENARIO_SIZES, SIMULATION_SEED, create_scenario
+
+# Importing Pymoo components
+from pymoo.indicators.hv import Hypervolume
+
+# Importing Python libraries
+from contextlib import redirect_stdout
+from time import time
+import numpy as np
+import subprocess
+import argparse
+import tempfile
+import json
+import sys
+import os
+
+# NSGA-II parameters shared by all initial population mixes
+NSGAII_PARAMETERS = {"pop_size": 100, "n_gen": 100, "cross_prob": 1, "mut_prob": 0.1}
+
+# Initial population mixes being compared (the cold start samples the whole population)
+MIXES = {
+    "cold": {},
+    "warm_10": {"warm_start": ["thea", "argos", "faticanti2020"], "warm_start_ratio": 0.1, "perturbation_rate": 0.1},
+    "warm_50": {"warm_start": ["thea", "argos", "faticanti2020"], "warm_start_ratio": 0.5, "perturbation_rate": 0.1},
+}
+
+# Share of the hypervolume reached by the cold start at its last generation that defines the target front
+TARGET = 1.0
+
+# Reference point of the hypervolume, defined over objectives normalized by the bounds of the fronts of all mixes
+HYPERVOLUME_REFERENCE_POINT = 1.1
+
+
+def measure(mix: str, dataset: str) -> dict:
+    """Runs NSGA-II with an initial population mix in the current process, recording its Pareto front at each generation.
+
+    Args:
+        mix (str): Initial population mix.
+        dataset (str): Path of the dataset file.
+
+    Returns:
+        history (dict): Objectives of the Pareto front, penalty of its least overloaded solution, and elapsed time (in seconds) at
+            each generation.
+    """
+    from simulation.strategies.nsgaii import ConvergenceTermination
+
+    history = {"fronts": [], "penalties": [], "times": []}
+
+    # Recording the Pareto front whenever the termination criterion is checked (i.e., once per generation)
+    do_continue = ConvergenceTermination._do_continue
+
+    def recording_do_continue(self, algorithm):
+        history["fronts"].append(algorithm.opt.get("F").tolist())
+        history["penalties"].append(float(algorithm.opt.get("CV").min()))
+        history["times"].append(time() - algorithm.start_time)
+        return do_continue(self, algorithm)
+
+    ConvergenceTermination._do_continue = recording_do_continue
+
+    # Running the simulation inside a temporary directory that receives its logs, discarding its output
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as logs_directory, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        os.chdir(logs_directory)
+        try:
+            run_simulation(
+                seed_value=SIMULATION_SEED, algorithm="nsgaii", dataset=dataset, parameters={**NSGAII_PARAMETERS, **MIXES[mix]}
+            )
+        finally:
+            os.chdir(working_directory)
+
+    return history
+
+
+def get_hypervolumes(histories: dict) -> dict:
+    """Calculates the hypervolume of the Pareto front of each mix at each generation. Objectives are normalized by the ideal and
+    nadir points of the fronts of all mixes, so that hypervolumes are comparable. Fronts with overloaded servers have no hypervolume.
+
+    Args:
+        histories (dict): Pareto fronts of each mix at each generation.
+
+    Returns:
+        hypervolumes (dict): Hypervolume of the Pareto front of each mix at each generation.
+    """
+    objectives = np.concatenate(
+        [
+            np.array(front)
+            for history in histories.values()
+            for front, penalty in zip(history["fronts"], history["penalties"])
+            if penalty <= 0
+        ]
+    )
+    ideal = objectives.min(axis=0)
+    ranges = np.where(objectives.max(axis=0) > ideal, objectives.max(axis=0) - ideal, 1)
+    indicator = Hypervolume(ref_point=np.full(objectives.shape[1], HYPERVOLUME_REFERENCE_POINT))
+
+    hypervolumes = {
+        mix: [
+            indicator.do((np.array(front) - ideal) / ranges) if penalty <= 0 else 0
+            for front, penalty in zip(history["fronts"], history["penalties"])
+        ]
+        for mix, history in histories.items()
+    }
+    return hypervolumes
+
+
+def main(size: str, dataset: str, mixes: list):
+    """Compares the number of generations (and the time) NSGA-II takes to reach a target Pareto front when its initial population
+    is seeded by heuristics against the cold start. The target is the front reached by the cold start at its last generation.
+
+    Args:
+        size (str): Name of the generated scenario size (used when no dataset is given).
+        dataset (str): Path of the dataset file.
+        mixes (list): Initial population mixes being compared.
+    """
+    mixes = ["cold"] + [mix for mix in mixes if mix != "cold"]
+
+    histories = {}
+    with tempfile.TemporaryDirectory() as directory:
+        # Simulations run inside temporary directories, so the dataset path must not be relative
+        dataset = os.path.abspath(dataset) if dataset is not None else create_scenario(size=size, directory=directory)
+
+        # Running each mix in a fresh process
+        for mix in mixes:
+            command = [sys.executable, "-B", "-m", "benchmarks.warm_start", "--measure", mix, "--dataset", dataset]
+            output_lines = subprocess.run(command, check=True, capture_output=True, text=True).stdout.splitlines()
+            histories[mix] = json.loads(output_lines[-1])
+
+    hypervolumes = get_hypervolumes(histories=histories)
+    target = TARGET * hypervolumes["cold"][-1]
+
+    print(f"NSGA-II: {NSGAII_PARAMETERS}. Target hypervolume: {target:.4f}")
+    print(f"{'Mix':>8} {'Initial HV':>11} {'Final HV':>9} {'Generations to target':>22} {'Time to target (s)':>19}")
+    for mix in mixes:
+        generation = next((index for index, hypervolume in enumerate(hypervolumes[mix]) if hypervolume >= target), None)
+        generations_to_target = generation + 1 if generation is not None else "-"
+        time_to_target = f"{histories[mix]['times'][generation]:.2f}" if generation is not None else "-"
+        print(f"{mix:>8} {hypervolumes[mix][0]:>11.4f} {hypervolumes[mix][-1]:>9.4f} {generations_to_target:>22} {time_to_target:>19}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", help="Generated scenario size", choices=list(SCENARIO_SIZES.keys()), default="small")
+    parser.add_argument("--dataset", "-d", help="Dataset file (replaces the generated scenario)")
+    parser.add_argument("--mixes", help="Initial population mixes", nargs="+", default=list(MIXES.keys()))
+    parser.add_argument("--measure", help="Measures a single mix in the current process")
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(mix=args.measure, dataset=args.dataset)))
+    else:
+        main(size=args.size, dataset=args.dataset, mixes=args.mixes)
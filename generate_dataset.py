@@ -0,0 +1,554 @@
+# Importing helper methods
+from simulation.helper_methods import uniform
+
+# Importing Python libraries
+from collections import deque
+from time import perf_counter
+import argparse
+import random
+import json
+import math
+
+# Specifications of the edge server models (CPU in cores, RAM memory in megabytes, disk in megabytes, and power in Watts)
+EDGE_SERVER_MODELS = {
+    "SGI": {"cpu": 32, "memory": 32768, "disk": 1048576, "static_power_consumption": 265, "max_power_consumption": 1387},
+    "HPE": {"cpu": 36, "memory": 65536, "disk": 1048576, "static_power_consumption": 45, "max_power_consumption": 276},
+    "Acer": {"cpu": 48, "memory": 65536, "disk": 1048576, "static_power_consumption": 127, "max_power_consumption": 559},
+}
+
+# Power consumption specifications of network switches (as in EdgeSimPy's "sample_switch()" generator)
+NETWORK_SWITCH_POWER_MODEL_PARAMETERS = {"chassis_power": 60, "ports_power_consumption": {"125": 1, "12.5": 0.3}}
+
+# Specifications of the container images stored by container registries (services are created from the "alpine" image)
+CONTAINER_IMAGE_SPECIFICATIONS = [
+    {
+        "name": "registry",
+        "tag": "latest",
+        "digest": "sha256:6060f78eda124040cfeb19d2fcc9af417f5ee23dc05d0894fcfe21f24c9cbf9a",
+        "layers": [
+            {
+                "digest": "sha256:df9b9388f04ad6279a7410b85cedfdcb2208c0a003da7ab5613af71079148139",
+                "size": 2,
+                "instruction": "ADD file:5d673d25da3a14ce1f6cf",
+            },
+            {
+                "digest": "sha256:b6846b9db566bc2ea5e2b0056c49772152c9b7c8f06343efb1ef764b23bb9d96",
+                "size": 5,
+                "instruction": "/bin/sh -c set -eux; \tversion=",
+            },
+        ],
+    },
+    {
+        "name": "alpine",
+        "tag": "latest",
+        "digest": "sha256:a777c9c66ba177ccfea23f2a216ff6721e78a662cd17019488c417135299cd89",
+        "layers": [
+            {
+                "digest": "sha256:df9b9388f04ad6279a7410b85cedfdcb2208c0a003da7ab5613af71079148139",
+                "size": 2,
+                "instruction": "ADD file:5d673d25da3a14ce1f6cf",
+            }
+        ],
+    },
+]
+
+# Demands of services (CPU in cores and RAM memory in megabytes)
+SERVICE_DEMAND_VALUES = [
+    {"cpu": 2, "memory": 2 * 1024},
+    {"cpu": 4, "memory": 4 * 1024},
+    {"cpu": 8, "memory": 8 * 1024},
+    {"cpu": 16, "memory": 16 * 1024},
+]
+
+# Order in which components are listed in dataset files
+COMPONENT_CLASSES = [
+    "NetworkSwitch",
+    "NetworkLink",
+    "BaseStation",
+    "User",
+    "ContainerLayer",
+    "ContainerImage",
+    "Service",
+    "ContainerRegistry",
+    "Application",
+    "EdgeServer",
+    "RandomDurationAndIntervalAccessPattern",
+    "CircularDurationAndIntervalAccessPattern",
+]
+
+
+def add_component(data: dict, component_class: str, attributes: dict, relationships: dict) -> dict:
+    """Adds a component to the dataset, assigning it the next ID of its class.
+
+    Args:
+        data (dict): Dataset contents.
+        component_class (str): Name of the component class.
+        attributes (dict): Component attributes (except its ID).
+        relationships (dict): Component relationships.
+
+    Returns:
+        component (dict): Dataset entry of the component.
+    """
+    component = {"attributes": {"id": len(data[component_class]) + 1, **attributes}, "relationships": relationships}
+    data[component_class].append(component)
+    return component
+
+
+def get_reference(component_class: str, component: dict) -> dict:
+    """Creates a reference to a component, used to describe relationships.
+
+    Args:
+        component_class (str): Name of the component class.
+        component (dict): Dataset entry of the component.
+
+    Returns:
+        reference (dict): Class and ID of the component.
+    """
+    return {"class": component_class, "id": component["attributes"]["id"]}
+
+
+def create_network(data: dict, map_size: int, link_delay: int, link_bandwidth: int) -> list:
+    """Creates a hexagonal grid of base stations (each one with its own network switch) connected by a mesh of links between
+    neighboring network switches, as done by EdgeSimPy's "hexagonal_grid" and "partially_connected_hexagonal_mesh" methods.
+
+    Args:
+        data (dict): Dataset contents.
+        map_size (int): Number of rows and columns of the grid.
+        link_delay (int): Delay of network links.
+        link_bandwidth (int): Bandwidth of network links.
+
+    Returns:
+        base_stations (list): Created base stations, sorted by their coordinates (row by row).
+    """
+    base_stations = []
+    switches_by_coordinates = {}
+    for y in range(map_size):
+        for x in range(y % 2, map_size * 2 + y % 2, 2):
+            network_switch = add_component(
+                data=data,
+                component_class="NetworkSwitch",
+                attributes={"coordinates": [x, y], "active": True, "power_model_parameters": NETWORK_SWITCH_POWER_MODEL_PARAMETERS},
+                relationships={"power_model": "ConteratoNetworkPowerModel", "edge_servers": [], "links": []},
+            )
+            base_station = add_component(
+                data=data,
+                component_class="BaseStation",
+                attributes={"coordinates": [x, y], "wireless_delay": 0},
+                relationships={"users": [], "edge_servers": [], "network_switch": get_reference("NetworkSwitch", network_switch)},
+            )
+            network_switch["relationships"]["base_station"] = get_reference("BaseStation", base_station)
+
+            base_stations.append(base_station)
+            switches_by_coordinates[(x, y)] = network_switch
+
+    # Connecting each network switch to its neighbors on the row below and on its right
+    for (x, y), network_switch in switches_by_coordinates.items():
+        for neighbor_coordinates in [(x - 1, y + 1), (x + 1, y + 1), (x + 2, y)]:
+            neighbor = switches_by_coordinates.get(neighbor_coordinates)
+            if neighbor is not None:
+                add_component(
+                    data=data,
+                    component_class="NetworkLink",
+                    attributes={"delay": link_delay, "bandwidth": link_bandwidth, "bandwidth_demand": 0, "active": True},
+                    relationships={
+                        "topology": {"class": "Topology", "id": 1},
+                        "active_flows": [],
+                        "applications": [],
+                        "nodes": [get_reference("NetworkSwitch", network_switch), get_reference("NetworkSwitch", neighbor)],
+                    },
+                )
+
+    return base_stations
+
+
+def create_edge_servers(data: dict, base_stations: list, servers_per_model: list):
+    """Creates the edge servers of each infrastructure provider, spreading them evenly over the map. Base stations are picked at
+    regular intervals of a serpentine walk over the grid rows (an alternative to clustering base stations, whose cost grows with
+    the product of the numbers of base stations and edge servers), and then shuffled among edge servers.
+
+    Args:
+        data (dict): Dataset contents.
+        base_stations (list): Base stations, sorted by their coordinates (row by row).
+        servers_per_model (list): Number of edge servers of each model owned by each infrastructure provider.
+    """
+    number_of_edge_servers = sum(servers_per_model) * len(EDGE_SERVER_MODELS)
+
+    # Walking over the grid rows in alternating directions, so that consecutive base stations are always neighbors
+    rows = {}
+    for base_station in base_stations:
+        rows.setdefault(base_station["attributes"]["coordinates"][1], []).append(base_station)
+    walk = [base_station for y, row in sorted(rows.items()) for base_station in (row if y % 2 == 0 else reversed(row))]
+
+    hosts = [walk[int((index + 0.5) * len(walk) / number_of_edge_servers)] for index in range(number_of_edge_servers)]
+    hosts = random.sample(hosts, len(hosts))
+
+    for provider_index, number_of_servers in enumerate(servers_per_model):
+        for model_name, model in EDGE_SERVER_MODELS.items():
+            for _ in range(number_of_servers):
+                base_station = hosts[len(data["EdgeServer"])]
+                network_switch = data["NetworkSwitch"][base_station["relationships"]["network_switch"]["id"] - 1]
+
+                edge_server = add_component(
+                    data=data,
+                    component_class="EdgeServer",
+                    attributes={
+                        "available": True,
+                        "model_name": model_name,
+                        "cpu": model["cpu"],
+                        "memory": model["memory"],
+                        "disk": model["disk"],
+                        "cpu_demand": 0,
+                        "memory_demand": 0,
+                        "disk_demand": 0,
+                        "coordinates": base_station["attributes"]["coordinates"],
+                        "max_concurrent_layer_downloads": 3,
+                        "active": True,
+                        "power_model_parameters": {
+                            "static_power_percentage": model["static_power_consumption"] / model["max_power_consumption"],
+                            "max_power_consumption": model["max_power_consumption"],
+                        },
+                        "infrastructure_provider": provider_index + 1,
+                    },
+                    relationships={
+                        "power_model": "LinearServerPowerModel",
+                        "base_station": get_reference("BaseStation", base_station),
+                        "network_switch": get_reference("NetworkSwitch", network_switch),
+                        "services": [],
+                        "container_layers": [],
+                        "container_images": [],
+                        "container_registries": [],
+                    },
+                )
+                base_station["relationships"]["edge_servers"].append(get_reference("EdgeServer", edge_server))
+                network_switch["relationships"]["edge_servers"].append(get_reference("EdgeServer", edge_server))
+
+
+def create_container_registries(data: dict, number_of_registries: int):
+    """Creates container registries (with all container images and their layers) on the edge servers with the largest capacity.
+
+    Args:
+        data (dict): Dataset contents.
+        number_of_registries (int): Number of container registries.
+    """
+    edge_servers = sorted(
+        data["EdgeServer"], key=lambda s: (-math.sqrt(s["attributes"]["cpu"] * s["attributes"]["memory"]), s["attributes"]["id"])
+    )
+
+    for edge_server in edge_servers[:number_of_registries]:
+        server_reference = get_reference("EdgeServer", edge_server)
+
+        # Creating the layers of container images (layers shared by multiple images are stored only once)
+        layers = {}
+        for image_spec in CONTAINER_IMAGE_SPECIFICATIONS:
+            for layer_spec in image_spec["layers"]:
+                if layer_spec["digest"] not in layers:
+                    layers[layer_spec["digest"]] = add_component(
+                        data=data,
+                        component_class="ContainerLayer",
+                        attributes=dict(layer_spec),
+                        relationships={"server": server_reference},
+                    )
+
+        images = []
+        for image_spec in CONTAINER_IMAGE_SPECIFICATIONS:
+            attributes = {
+                "name": image_spec["name"],
+                "tag": image_spec["tag"],
+                "digest": image_spec["digest"],
+                "layers_digests": [layer_spec["digest"] for layer_spec in image_spec["layers"]],
+                "architecture": "",
+            }
+            images.append(
+                add_component(
+                    data=data, component_class="ContainerImage", attributes=attributes, relationships={"server": server_reference}
+                )
+            )
+
+        registry = add_component(
+            data=data,
+            component_class="ContainerRegistry",
+            attributes={"cpu_demand": 0, "memory_demand": 0},
+            relationships={"server": server_reference},
+        )
+
+        # Updating the edge server's disk demand and its relationships with the registry, images, and layers
+        edge_server["attributes"]["disk_demand"] += sum([layer["attributes"]["size"] for layer in layers.values()])
+        edge_server["relationships"]["container_layers"].extend([get_reference("ContainerLayer", layer) for layer in layers.values()])
+        edge_server["relationships"]["container_images"].extend([get_reference("ContainerImage", image) for image in images])
+        edge_server["relationships"]["container_registries"].append(get_reference("ContainerRegistry", registry))
+
+
+def create_applications(data: dict, base_stations: list, application_specifications: list, trust_patterns: list, delay_slas: list):
+    """Creates applications (each one accessed by its own user) for each combination of trust pattern and application specification.
+
+    Args:
+        data (dict): Dataset contents.
+        base_stations (list): Base stations where users can be placed.
+        application_specifications (list): Number of applications and number of services (chain length) of each application type.
+        trust_patterns (list): Trust degree of users on each infrastructure provider.
+        delay_slas (list): Delay SLA values assigned to users.
+    """
+    number_of_applications = sum([app_spec["number_of_objects"] for app_spec in application_specifications]) * len(trust_patterns)
+    number_of_services = sum(
+        [app_spec["number_of_objects"] * app_spec["number_of_services"] for app_spec in application_specifications]
+    ) * len(trust_patterns)
+    user_delay_slas = uniform(n_items=number_of_applications, valid_values=delay_slas, shuffle_distribution=True)
+    service_demands = uniform(n_items=number_of_services, valid_values=SERVICE_DEMAND_VALUES, shuffle_distribution=True)
+
+    # Services are created from the "alpine" container image
+    image_digest = next(spec["digest"] for spec in CONTAINER_IMAGE_SPECIFICATIONS if spec["name"] == "alpine")
+
+    for trust_pattern in trust_patterns:
+        for app_spec in application_specifications:
+            for _ in range(app_spec["number_of_objects"]):
+                app_id = str(len(data["Application"]) + 1)
+                app = add_component(
+                    data=data,
+                    component_class="Application",
+                    attributes={"label": "", "provisioned": False},
+                    relationships={"services": [], "users": []},
+                )
+
+                # Creating the user that accesses the application and placing it on a random base station
+                base_station = random.choice(base_stations)
+                coordinates = base_station["attributes"]["coordinates"]
+                user = add_component(
+                    data=data,
+                    component_class="User",
+                    attributes={
+                        "coordinates": coordinates,
+                        "coordinates_trace": [coordinates, coordinates, coordinates],
+                        "delays": {app_id: None},
+                        "delay_slas": {app_id: user_delay_slas[len(data["User"])]},
+                        "communication_paths": {app_id: None},
+                        "making_requests": {app_id: {"1": True}},
+                        "providers_trust": {str(provider + 1): trust for provider, trust in enumerate(trust_pattern)},
+                    },
+                    relationships={
+                        "access_patterns": {},
+                        "mobility_model": "random_mobility",
+                        "applications": [get_reference("Application", app)],
+                        "base_station": get_reference("BaseStation", base_station),
+                    },
+                )
+                base_station["relationships"]["users"].append(get_reference("User", user))
+                app["relationships"]["users"].append(get_reference("User", user))
+
+                # Defining the user's access pattern
+                access_pattern = add_component(
+                    data=data,
+                    component_class="CircularDurationAndIntervalAccessPattern",
+                    attributes={
+                        "duration_values": [float("inf")],
+                        "interval_values": [0],
+                        "history": [
+                            {
+                                "start": 1,
+                                "end": float("inf"),
+                                "duration": float("inf"),
+                                "waiting_time": 0,
+                                "access_time": 0,
+                                "interval": 0,
+                                "next_access": float("inf"),
+                            }
+                        ],
+                    },
+                    relationships={"user": get_reference("User", user), "app": get_reference("Application", app)},
+                )
+                user["relationships"]["access_patterns"][app_id] = get_reference(
+                    "CircularDurationAndIntervalAccessPattern", access_pattern
+                )
+
+                # Creating the services that compose the application (sorted by their privacy requirements)
+                privacy_requirements = sorted(
+                    uniform(n_items=app_spec["number_of_services"], valid_values=[0, 1, 2], shuffle_distribution=False)
+                )
+                for privacy_requirement in privacy_requirements:
+                    demand = service_demands[len(data["Service"])]
+                    service = add_component(
+                        data=data,
+                        component_class="Service",
+                        attributes={
+                            "label": "Alpine",
+                            "state": 0,
+                            "_available": True,
+                            "cpu_demand": demand["cpu"],
+                            "memory_demand": demand["memory"],
+                            "image_digest": image_digest,
+                            "privacy_requirement": privacy_requirement,
+                        },
+                        relationships={"application": get_reference("Application", app), "server": None},
+                    )
+                    app["relationships"]["services"].append(get_reference("Service", service))
+
+
+def get_distances_to_edge_servers(data: dict) -> list:
+    """Calculates the number of hops between each network switch and its closest edge server through a breadth-first search that
+    starts from all network switches with edge servers at once (instead of searching the shortest path of each user-server pair).
+
+    Args:
+        data (dict): Dataset contents.
+
+    Returns:
+        distances (list): Number of hops between each network switch (indexed by ID - 1) and its closest edge server.
+    """
+    neighbors = [[] for _ in data["NetworkSwitch"]]
+    for link in data["NetworkLink"]:
+        origin, target = [node["id"] - 1 for node in link["relationships"]["nodes"]]
+        neighbors[origin].append(target)
+        neighbors[target].append(origin)
+
+    distances = [None] * len(data["NetworkSwitch"])
+    queue = deque()
+    for edge_server in data["EdgeServer"]:
+        index = edge_server["relationships"]["network_switch"]["id"] - 1
+        if distances[index] is None:
+            distances[index] = 0
+            queue.append(index)
+
+    while queue:
+        index = queue.popleft()
+        for neighbor in neighbors[index]:
+            if distances[neighbor] is None:
+                distances[neighbor] = distances[index] + 1
+                queue.append(neighbor)
+
+    return distances
+
+
+def generate_dataset(
+    map_size: int = 9,
+    servers_per_model: list = [1, 1, 4],
+    application_specifications: list = [
+        {"number_of_objects": 2, "number_of_services": 1},
+        {"number_of_objects": 2, "number_of_services": 2},
+        {"number_of_objects": 2, "number_of_services": 4},
+        {"number_of_objects": 2, "number_of_services": 8},
+    ],
+    trust_patterns: list = [[2, 1, 0], [1, 2, 0]],
+    delay_slas: list = [3, 6],
+    number_of_registries: int = 1,
+    link_delay: int = 1,
+    link_bandwidth: int = 10,
+) -> dict:
+    """Generates the contents of a dataset file without instantiating EdgeSimPy components. Default values produce a scenario with
+    the same specifications as the one created by "create_dataset.py" (81 base stations, 18 edge servers, and 60 services).
+
+    Args:
+        map_size (int, optional): Number of rows and columns of the hexagonal grid of base stations. Defaults to 9.
+        servers_per_model (list, optional): Number of edge servers of each model owned by each infrastructure provider. Defaults to
+            [1, 1, 4].
+        application_specifications (list, optional): Number of applications and number of services of each application type, which
+            are created once for each trust pattern. Defaults to two applications with 1, 2, 4, and 8 services.
+        trust_patterns (list, optional): Trust degree of users on each infrastructure provider. Defaults to [[2, 1, 0], [1, 2, 0]].
+        delay_slas (list, optional): Delay SLA values assigned to users. Defaults to [3, 6].
+        number_of_registries (int, optional): Number of container registries. Defaults to 1.
+        link_delay (int, optional): Delay of network links. Defaults to 1.
+        link_bandwidth (int, optional): Bandwidth of network links. Defaults to 10.
+
+    Raises:
+        Exception: Invalid scenario specifications.
+
+    Returns:
+        data (dict): Dataset contents.
+    """
+    number_of_edge_servers = sum(servers_per_model) * len(EDGE_SERVER_MODELS)
+    if number_of_edge_servers > map_size**2:
+        raise Exception(f"The map has {map_size**2} base stations, which cannot accommodate {number_of_edge_servers} edge servers.")
+    if any(len(trust_pattern) != len(servers_per_model) for trust_pattern in trust_patterns):
+        raise Exception("Trust patterns must define the trust degree of users on each of the infrastructure providers.")
+    if number_of_registries > number_of_edge_servers:
+        raise Exception(f"There are not enough edge servers to host {number_of_registries} container registries.")
+
+    data = {component_class: [] for component_class in COMPONENT_CLASSES}
+
+    base_stations = create_network(data=data, map_size=map_size, link_delay=link_delay, link_bandwidth=link_bandwidth)
+    create_edge_servers(data=data, base_stations=base_stations, servers_per_model=servers_per_model)
+    create_container_registries(data=data, number_of_registries=number_of_registries)
+    create_applications(
+        data=data,
+        base_stations=base_stations,
+        application_specifications=application_specifications,
+        trust_patterns=trust_patterns,
+        delay_slas=delay_slas,
+    )
+
+    return data
+
+
+def display_overview(data: dict, link_delay: int):
+    """Prints an overview of the infrastructure occupation and of the delay SLAs of a generated dataset.
+
+    Args:
+        data (dict): Dataset contents.
+        link_delay (int): Delay of network links.
+    """
+    edge_servers = [edge_server["attributes"] for edge_server in data["EdgeServer"]]
+    services = [service["attributes"] for service in data["Service"]]
+
+    # Checking if delay SLAs are achievable (i.e., if there is an edge server close enough to each user)
+    distances = get_distances_to_edge_servers(data=data)
+    unachievable_slas = 0
+    for user in data["User"]:
+        base_station = data["BaseStation"][user["relationships"]["base_station"]["id"] - 1]
+        minimum_delay = distances[base_station["relationships"]["network_switch"]["id"] - 1] * link_delay
+        unachievable_slas += sum([1 for delay_sla in user["attributes"]["delay_slas"].values() if minimum_delay > delay_sla])
+
+    edge_server_cpu_capacity = sum([edge_server["cpu"] for edge_server in edge_servers])
+    edge_server_memory_capacity = sum([edge_server["memory"] for edge_server in edge_servers])
+    service_cpu_demand = sum([service["cpu_demand"] for service in services])
+    service_memory_demand = sum([service["memory_demand"] for service in services])
+
+    print("==== DATASET OVERVIEW ====")
+    print(f"Base Stations: {len(data['BaseStation'])}. Network Links: {len(data['NetworkLink'])}")
+    print(f"Edge Servers: {len(edge_servers)}")
+    print(f"\tCPU Capacity: {edge_server_cpu_capacity}")
+    print(f"\tRAM Capacity: {edge_server_memory_capacity}")
+    print(f"Applications: {len(data['Application'])}. Services: {len(services)}")
+    print(f"\tCPU Demand: {service_cpu_demand}")
+    print(f"\tRAM Demand: {service_memory_demand}")
+    print(f"Overall Occupation")
+    print(f"\tCPU: {round(service_cpu_demand / edge_server_cpu_capacity * 100, 1)}%")
+    print(f"\tRAM: {round(service_memory_demand / edge_server_memory_capacity * 100, 1)}%")
+    print(f"Unachievable Delay SLAs: {unachievable_slas}")
+
+
+if __name__ == "__main__":
+    # Parsing named arguments from the command line
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", "-s", help="Seed value", type=int, default=1)
+    parser.add_argument("--output", "-o", help="Dataset file name (without extension)", default="datasets/generated")
+    parser.add_argument("--map_size", help="Number of rows and columns of the map", type=int, default=9)
+    parser.add_argument("--servers_per_model", help="Edge servers of each model per provider", type=int, nargs="+", default=[1, 1, 4])
+    parser.add_argument("--applications", help="Applications per chain length and trust pattern", type=int, default=2)
+    parser.add_argument("--chain_lengths", help="Number of services of applications", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--trust_patterns", help="Trust degrees of users on each provider (e.g., 2,1,0)", nargs="+", default=["2,1,0", "1,2,0"]
+    )
+    parser.add_argument("--delay_slas", help="Delay SLA values of users", type=int, nargs="+", default=[3, 6])
+    parser.add_argument("--registries", help="Number of container registries", type=int, default=1)
+    parser.add_argument("--link_delay", help="Delay of network links", type=int, default=1)
+    args = parser.parse_args()
+
+    # Defining a seed value to enable reproducibility
+    random.seed(args.seed)
+
+    start = perf_counter()
+    data = generate_dataset(
+        map_size=args.map_size,
+        servers_per_model=args.servers_per_model,
+        application_specifications=[
+            {"number_of_objects": args.applications, "number_of_services": chain_length} for chain_length in args.chain_lengths
+        ],
+        trust_patterns=[[int(trust) for trust in trust_pattern.split(",")] for trust_pattern in args.trust_patterns],
+        delay_slas=args.delay_slas,
+        number_of_registries=args.registries,
+        link_delay=args.link_delay,
+    )
+
+    # Exporting the scenario
+    with open(f"{args.output}.json", "w", encoding="UTF-8") as dataset_file:
+        json.dump(data, dataset_file, indent=4)
+
+    display_overview(data=data, link_delay=args.link_delay)
+    print(f"Dataset '{args.output}.json' generated in {perf_counter() - start:.2f} seconds")
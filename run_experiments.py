@@ -1,96 +1,272 @@
-# Importing Python libraries
-from subprocess import Popen, DEVNULL, TimeoutExpired
+# Importing the simulation entry point (imported before worker processes are created, so that they share its dependencies)
+from simulation.__main__ import main, load_scenario
+
+# Importing helper methods
+from simulation.helper_methods import get_dataset_hash
 
+# Importing Python libraries
+from contextlib import redirect_stdout
+from multiprocessing import Pool
+from datetime import datetime
+from time import perf_counter
 import itertools
+import traceback
+import hashlib
+import sqlite3
+import json
 import os
 
 NUMBER_OF_PARALLEL_PROCESSES = os.cpu_count()
 
-def run_simulation(dataset: str, algorithm: str, n_gen: int, pop_size: int, cross_prob: float, mut_prob: float):
-    """Executes the simulation with the specified parameters.
+# SQLite database that stores the manifest of the campaign and the results of finished executions
+RESULTS_DATABASE = "results.db"
+
+# Scenario loaded by the current process (dataset path and the simulator holding it), reused by consecutive executions over the
+# same dataset. Only one scenario is kept, as loading a dataset discards the components of the previously loaded one
+LOADED_SCENARIO = {"dataset": None, "simulator": None}
+
+
+def open_result_store(database: str) -> sqlite3.Connection:
+    """Opens (creating it if needed) the database that keeps track of the executions of the campaign.
 
     Args:
-        dataset (str): Dataset being read.
+        database (str): Path of the SQLite database file.
+
+    Returns:
+        connection (sqlite3.Connection): Connection to the database.
+    """
+    connection = sqlite3.connect(database)
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS executions (
+            job_key TEXT PRIMARY KEY,
+            dataset TEXT NOT NULL,
+            dataset_hash TEXT NOT NULL,
+            algorithm TEXT NOT NULL,
+            seed INTEGER NOT NULL,
+            parameters TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            execution_time REAL,
+            metrics TEXT,
+            error TEXT,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    connection.commit()
+    return connection
+
+
+def get_job_key(dataset_hash: str, algorithm: str, seed_value: int, parameters: dict) -> str:
+    """Identifies an execution by the contents of its dataset, its algorithm, its seed value, and its parameters.
+
+    Args:
+        dataset_hash (str): Hash of the dataset file contents.
         algorithm (str): Algorithm being executed.
-        n_gen (int): Number of generations of the NSGA-II algorithm.
-        pop_size (int): Number of chromosomes in the NSGA-II's population.
-        cross_prob (float): NSGA-II's crossover probability.
-        mut_prob (float): NSGA-II's mutation probability.
+        seed_value (int): Seed value of the execution.
+        parameters (dict): Algorithm parameters.
+
+    Returns:
+        job_key (str): Hexadecimal SHA-256 hash that identifies the execution.
     """
-    # Running the simulation based on the parameters and gathering its execution time
-    cmd = f"python3 -B -m simulation -d {dataset} -a {algorithm} -p {pop_size} -g {n_gen} -c {cross_prob} -m {mut_prob}"
-    # print(f"    cmd = {cmd}")
-
-    return Popen(cmd.split(" "), stdout=DEVNULL, stderr=DEVNULL)
-
-
-# Parameters
-datasets = ["datasets/dataset1.json"]
-algorithms = ["nsgaii"]
-
-population_sizes = [300]
-number_of_generations = [i for i in range(100, 4001, 100)]
-crossover_probabilities = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]
-mutation_probabilities = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]
-
-print(f"Datasets: {datasets}")
-print(f"Algorithms: {algorithms}")
-print(f"Population sizes: {population_sizes}")
-print(f"Number of generations: {number_of_generations}")
-print(f"Crossover probabilities: {crossover_probabilities}")
-print(f"Mutation probabilities: {mutation_probabilities}")
-print()
-
-# Generating list of combinations with the parameters specified
-combinations = list(
-    itertools.product(
-        datasets,
-        algorithms,
-        population_sizes,
-        number_of_generations,
-        crossover_probabilities,
-        mutation_probabilities,
+    description = json.dumps([dataset_hash, algorithm, seed_value, parameters], sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+def update_manifest(connection: sqlite3.Connection, jobs: list):
+    """Registers the executions of the campaign that are not yet in the result store as pending executions.
+
+    Args:
+        connection (sqlite3.Connection): Connection to the result store.
+        jobs (list): Executions of the campaign.
+    """
+    now = datetime.now().isoformat()
+    connection.executemany(
+        "INSERT OR IGNORE INTO executions (job_key, dataset, dataset_hash, algorithm, seed, parameters, status, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, 'pending', ?)",
+        [
+            (job_key, dataset, dataset_hash, algorithm, seed_value, json.dumps(parameters, sort_keys=True), now)
+            for job_key, dataset, dataset_hash, algorithm, seed_value, parameters in jobs
+        ],
     )
-)
-
-processes = []
-
-# Executing simulations and collecting results
-print(f"EXECUTING {len(combinations)} COMBINATIONS")
-for i, parameters in enumerate(combinations, 1):
-    # Parsing parameters
-    dataset = parameters[0]
-    algorithm = parameters[1]
-    pop_size = parameters[2]
-    n_gen = parameters[3]
-    cross_prob = parameters[4]
-    mut_prob = parameters[5]
-
-    print(f"\t[Execution {i}]")
-    print(f"\t\t[{algorithm}] dataset={dataset}. pop_size={pop_size}. n_gen={n_gen}. cross_prob={cross_prob}. mut_prob={mut_prob}")
-
-    # Executing algorithm
-    proc = run_simulation(
-        dataset=dataset,
-        algorithm=algorithm,
-        pop_size=pop_size,
-        n_gen=n_gen,
-        cross_prob=cross_prob,
-        mut_prob=mut_prob,
+    connection.commit()
+
+
+def store_result(connection: sqlite3.Connection, job_key: str, execution_time: float, metrics: dict, error: str):
+    """Records the outcome of an execution in the result store.
+
+    Args:
+        connection (sqlite3.Connection): Connection to the result store.
+        job_key (str): Execution identifier.
+        execution_time (float): Execution time (in seconds).
+        metrics (dict): Metrics collected at the end of the execution (or None if the execution failed).
+        error (str): Error message (or None if the execution succeeded).
+    """
+    status = "finished" if error is None else "failed"
+    metrics = json.dumps(metrics, default=lambda value: value.item() if hasattr(value, "item") else str(value)) if metrics else None
+    connection.execute(
+        "UPDATE executions SET status = ?, attempts = attempts + 1, execution_time = ?, metrics = ?, error = ?, updated_at = ? "
+        "WHERE job_key = ?",
+        (status, execution_time, metrics, error, datetime.now().isoformat(), job_key),
     )
+    connection.commit()
+
+
+def spawns_processes(parameters: dict) -> bool:
+    """Checks whether an execution creates processes of its own (parallel fitness evaluation or island model). Such executions
+    cannot run inside the worker processes of the pool, as daemonic processes are not allowed to have children.
+
+    Args:
+        parameters (dict): Algorithm parameters.
+
+    Returns:
+        spawns_processes (bool): Whether the execution creates processes.
+    """
+    return parameters.get("workers", 1) > 1 or parameters.get("islands", 1) > 1
+
+
+def run_simulation(job: tuple) -> tuple:
+    """Executes the simulation with the specified parameters inside a long-lived worker process.
+
+    Each process loads a dataset once and reuses it for consecutive executions over the same dataset, which restore the initial
+    placement state of the scenario before running.
+
+    Args:
+        job (tuple): Execution identifier, dataset being read, dataset hash, algorithm being executed, seed value, and parameters.
+
+    Returns:
+        result (tuple): Execution identifier, execution time (in seconds), collected metrics, and error message (if any).
+    """
+    job_key, dataset, _, algorithm, seed_value, parameters = job
+
+    start = perf_counter()
+    metrics = None
+    error = None
+    try:
+        # Running the simulation in the worker process, discarding its output
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            # Loading the dataset if the process holds no scenario or the scenario of another dataset
+            if LOADED_SCENARIO["dataset"] != dataset:
+                LOADED_SCENARIO["dataset"] = None
+                LOADED_SCENARIO["simulator"] = load_scenario(dataset=dataset)
+                LOADED_SCENARIO["dataset"] = dataset
+
+            metrics = main(
+                seed_value=seed_value,
+                algorithm=algorithm,
+                dataset=dataset,
+                parameters=dict(parameters),
+                simulator=LOADED_SCENARIO["simulator"],
+            )
+    except Exception:
+        # Discarding the scenario, which may have been left in an inconsistent state
+        LOADED_SCENARIO["dataset"] = None
+        error = traceback.format_exc()
+
+    return job_key, perf_counter() - start, metrics, error
+
+
+def report_result(connection: sqlite3.Connection, job: tuple, result: tuple, finished: int, total: int) -> bool:
+    """Stores the outcome of an execution and reports it.
+
+    Args:
+        connection (sqlite3.Connection): Connection to the result store.
+        job (tuple): Execution identifier, dataset being read, dataset hash, algorithm being executed, seed value, and parameters.
+        result (tuple): Execution identifier, execution time (in seconds), collected metrics, and error message (if any).
+        finished (int): Number of finished executions (including this one).
+        total (int): Number of executions.
+
+    Returns:
+        failed (bool): Whether the execution failed.
+    """
+    job_key, execution_time, metrics, error = result
+    store_result(connection=connection, job_key=job_key, execution_time=execution_time, metrics=metrics, error=error)
+
+    _, dataset, _, algorithm, seed_value, parameters = job
+    parameters_string = ". ".join(f"{key}={value}" for key, value in parameters.items())
+
+    print(f"\t[Execution {finished}/{total}] {execution_time:.2f} seconds")
+    print(f"\t\t[{algorithm}] dataset={dataset}. seed={seed_value}. {parameters_string}")
+    if error is not None:
+        print(f"\t\tFAILED:\n{error}")
+
+    return error is not None
+
+
+if __name__ == "__main__":
+    # Parameters
+    datasets = ["datasets/dataset1.json"]
+    algorithms = ["nsgaii"]
+    seeds = [1]
+
+    population_sizes = [300]
+    number_of_generations = [i for i in range(100, 4001, 100)]
+    crossover_probabilities = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]
+    mutation_probabilities = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]
+
+    print(f"Datasets: {datasets}")
+    print(f"Algorithms: {algorithms}")
+    print(f"Seeds: {seeds}")
+    print(f"Population sizes: {population_sizes}")
+    print(f"Number of generations: {number_of_generations}")
+    print(f"Crossover probabilities: {crossover_probabilities}")
+    print(f"Mutation probabilities: {mutation_probabilities}")
+    print()
+
+    # Generating list of combinations with the parameters specified
+    combinations = list(
+        itertools.product(
+            datasets,
+            algorithms,
+            seeds,
+            population_sizes,
+            number_of_generations,
+            crossover_probabilities,
+            mutation_probabilities,
+        )
+    )
+
+    # Describing each combination as a job identified by its dataset contents, algorithm, seed value, and parameters
+    dataset_hashes = {dataset: get_dataset_hash(dataset=dataset) for dataset in datasets}
+    jobs = []
+    for dataset, algorithm, seed_value, pop_size, n_gen, cross_prob, mut_prob in combinations:
+        parameters = {"pop_size": pop_size, "n_gen": n_gen, "cross_prob": cross_prob, "mut_prob": mut_prob}
+        job_key = get_job_key(dataset_hash=dataset_hashes[dataset], algorithm=algorithm, seed_value=seed_value, parameters=parameters)
+        jobs.append((job_key, dataset, dataset_hashes[dataset], algorithm, seed_value, parameters))
+
+    # Registering new combinations in the result store and skipping the ones that already finished (failed ones are retried)
+    connection = open_result_store(database=RESULTS_DATABASE)
+    update_manifest(connection=connection, jobs=jobs)
+    finished_jobs = {row[0] for row in connection.execute("SELECT job_key FROM executions WHERE status = 'finished'")}
+    pending_jobs = [job for job in jobs if job[0] not in finished_jobs]
 
-    processes.append(proc)
+    # Executing simulations and collecting results. Executions that create processes of their own run in the main process after the
+    # ones executed by the pool, as worker processes of the pool cannot have children
+    pooled_jobs = [job for job in pending_jobs if not spawns_processes(parameters=job[5])]
+    exclusive_jobs = [job for job in pending_jobs if spawns_processes(parameters=job[5])]
 
-    while len(processes) > NUMBER_OF_PARALLEL_PROCESSES:
-        for proc in processes:
-            try:
-                proc.wait(timeout=1)
+    print(f"EXECUTING {len(pending_jobs)} OF {len(jobs)} COMBINATIONS WITH {NUMBER_OF_PARALLEL_PROCESSES} WORKER PROCESSES")
+    jobs_by_key = {job[0]: job for job in pending_jobs}
+    start = perf_counter()
+    finished = 0
+    failures = 0
+    with Pool(processes=NUMBER_OF_PARALLEL_PROCESSES) as pool:
+        for result in pool.imap_unordered(run_simulation, pooled_jobs):
+            finished += 1
+            failures += report_result(
+                connection=connection, job=jobs_by_key[result[0]], result=result, finished=finished, total=len(pending_jobs)
+            )
 
-            except TimeoutExpired:
-                pass
+    for job in exclusive_jobs:
+        finished += 1
+        failures += report_result(
+            connection=connection, job=job, result=run_simulation(job), finished=finished, total=len(pending_jobs)
+        )
 
-            else:
-                processes.remove(proc)
-                print(f"PID {proc.pid} finished")
+    connection.close()
 
-    print(f"{len(processes)} processes running in parallel")
+    elapsed_time = perf_counter() - start
+    print(f"FINISHED {len(pending_jobs)} COMBINATIONS ({failures} FAILURES) IN {elapsed_time:.2f} SECONDS")
+    if len(pending_jobs) > 0:
+        print(f"Experiments per hour: {len(pending_jobs) / elapsed_time * 3600:.2f}")
@@ -4,50 +4,154 @@ from edge_sim_py import *
 # Importing customized EdgeSimPy components
 from .custom_component_methods import *
 
-# Importing placement strategies
-from .strategies import *
+# Importing the placement model
+from .placement_model import get_placement_model
+
+# Importing the instrumentation of strategies and helper methods
+from .instrumentation import INSTRUMENTATION
+
+# Importing the placement strategy registry (strategies are imported only when selected)
+from .strategies import get_strategy
 
 # Importing Python libraries
 from random import seed
 import argparse
 
-
-def main(seed_value: int, algorithm: str, dataset: str, parameters: dict = {}):
-    # Setting a seed value to enable reproducibility
-    seed(seed_value)
-
-    # Parsing NSGA-II parameters string
-    parameters_string = ""
-    if algorithm == "nsgaii":
-        for key, value in parameters.items():
-            parameters_string += f"{key}={value};"
-
-    # Creating a Simulator object
+# Parameters that only affect how an algorithm is executed (not its results), and thus are not part of the logs directory name
+EXECUTION_PARAMETERS = ["workers", "delta_evaluation", "fitness_cache_size"]
+
+# Optional parameters (termination criteria, island model, and warm start) and their default values. Parameters set to their
+# default values are not part of the logs directory name (keeping the names of the logs of runs that do not use them)
+OPTIONAL_PARAMETERS = {
+    "patience": 0,
+    "hv_tolerance": 0,
+    "max_time": 0,
+    "islands": 1,
+    "migration_interval": 10,
+    "migrants": 5,
+    "island_cross_probs": [],
+    "island_mut_probs": [],
+    "warm_start": [],
+    "warm_start_ratio": 0.5,
+    "perturbation_rate": 0.1,
+}
+
+
+def load_scenario(dataset: str) -> Simulator:
+    """Loads a dataset into a new simulator, preparing the structures shared by the placement strategies and capturing the initial
+    placement state of the scenario. Loading a dataset discards the components of any previously loaded scenario.
+
+    Args:
+        dataset (str): Path of the dataset file.
+
+    Returns:
+        simulator (Simulator): Simulator holding the loaded scenario.
+    """
+    # Creating a Simulator object (the algorithm and the logs directory are set by each execution)
     simulator = Simulator(
         tick_duration=1,
         tick_unit="seconds",
         stopping_criterion=lambda model: model.schedule.steps == 1,
-        resource_management_algorithm=eval(algorithm),
-        resource_management_algorithm_parameters=parameters,
         dump_interval=1,
-        logs_directory=f"logs/algorithm={algorithm};{parameters_string}",
     )
 
     # Loading custom EdgeSimPy components and methods
     User.set_communication_path = user_set_communication_path
     Topology.collect = topology_collect
+    ComponentManager.find_by_id = classmethod(component_manager_find_by_id)
+    EdgeServer.has_capacity_to_host = edge_server_has_capacity_to_host
+
+    # Loading the dataset (from its binary cache after the first run)
+    simulator.initialize(input_file=load_dataset(dataset=dataset))
+
+    # Loading the shortest paths between network switches (computed only at the first run over the dataset)
+    load_shortest_paths(dataset=dataset)
+
+    # Building the struct-of-arrays description of the scenario shared by the placement strategies
+    get_placement_model()
+
+    # Creating the layer residency bitsets used by capacity checks and the running aggregates of the objectives, which are kept up
+    # to date as services are provisioned
+    get_layer_residency()
+    get_objective_aggregates()
+
+    # Capturing the initial placement state of the scenario, which strategies restore to undo the placement schemes they try
+    take_snapshot()
+
+    return simulator
+
+
+def main(
+    seed_value: int,
+    algorithm: str,
+    dataset: str,
+    parameters: dict = {},
+    instrumentation: bool = False,
+    simulator: Simulator = None,
+) -> dict:
+    """Executes a placement strategy over a dataset, reporting the metrics collected at the end of the simulation.
+
+    Args:
+        seed_value (int): Seed value of the execution.
+        algorithm (str): Algorithm that will be executed.
+        dataset (str): Path of the dataset file.
+        parameters (dict, optional): Algorithm parameters. Defaults to {}.
+        instrumentation (bool, optional): Whether timers and counters of the strategies are collected. Defaults to False.
+        simulator (Simulator, optional): Simulator holding the scenario of the dataset loaded by "load_scenario", which is restored
+            to its initial placement state and reused. Defaults to None (the dataset is loaded into a new simulator).
+
+    Returns:
+        metrics (dict): Metrics collected at the end of the simulation.
+    """
+    # Setting a seed value to enable reproducibility
+    seed(seed_value)
 
-    # Loading a sample dataset from GitHub
-    simulator.initialize(input_file=dataset)
+    # Enabling (or disabling) the timers and counters of strategies and helper methods, discarding those of previous simulations
+    INSTRUMENTATION.reset(enabled=instrumentation)
+
+    # Parsing NSGA-II parameters string
+    parameters_string = ""
+    if algorithm == "nsgaii":
+        for key, value in parameters.items():
+            if key not in EXECUTION_PARAMETERS and not (key in OPTIONAL_PARAMETERS and value == OPTIONAL_PARAMETERS[key]):
+                # Lists are written as comma-separated values (e.g., "warm_start=thea,argos;")
+                value = ",".join(str(item) for item in value) if isinstance(value, list) else value
+                parameters_string += f"{key}={value};"
+
+    if simulator is None:
+        simulator = load_scenario(dataset=dataset)
+    else:
+        # Undoing the placement scheme and discarding the logs and the termination details of the previous execution
+        restore_snapshot()
+        simulator.schedule.steps = 0
+        simulator.agent_metrics = {}
+        if hasattr(Topology.first(), "termination"):
+            del Topology.first().termination
+
+    simulator.resource_management_algorithm = get_strategy(name=algorithm)
+    simulator.resource_management_algorithm_parameters = {**parameters, "seed": seed_value}
+    simulator.logs_directory = f"logs/algorithm={algorithm};{parameters_string}"
 
     # Executing the simulation
     simulator.run_model()
 
-    metrics = Topology.first().collect()
+    metrics = Topology.first().collect(level="full")
+
+    # Gathering the generation at which iterative strategies stopped searching and the reason why
+    if hasattr(Topology.first(), "termination"):
+        metrics.update(Topology.first().termination)
+
     print(f"==== {algorithm} ====")
     for metric, value in metrics.items():
         print(f"{metric}: {value}")
 
+    # Storing the instrumentation measurements next to the simulation logs and summarizing them
+    if instrumentation:
+        INSTRUMENTATION.dump(logs_directory=simulator.logs_directory)
+        INSTRUMENTATION.print_summary()
+
+    return metrics
+
 
 if __name__ == "__main__":
     # Parsing named arguments from the command line
@@ -57,12 +161,31 @@ if __name__ == "__main__":
     parser.add_argument("--seed", "-s", help="Seed value for EdgeSimPy", default="1")
     parser.add_argument("--dataset", "-d", help="Dataset file")
     parser.add_argument("--algorithm", "-a", help="Algorithm that will be executed")
+    parser.add_argument("--instrumentation", help="Collect and report timers and counters of the strategies", action="store_true")
 
     # NSGA-II arguments
     parser.add_argument("--pop_size", "-p", help="Population size", default="0")
     parser.add_argument("--n_gen", "-g", help="Number of generations", default="0")
     parser.add_argument("--cross_prob", "-c", help="Crossover probability (0.0 to 1.0)", default="1")
     parser.add_argument("--mut_prob", "-m", help="Mutation probability (0.0 to 1.0)", default="0")
+    parser.add_argument("--workers", "-w", help="Number of processes used to evaluate solutions in parallel", default="1")
+    parser.add_argument("--delta_evaluation", help="Evaluate offspring based on the state of their parents", action="store_true")
+    parser.add_argument("--fitness_cache_size", help="Memory (in megabytes) used to cache fitness scores (0 disables it)", default="0")
+    parser.add_argument(
+        "--patience", help="Generations without improving the Pareto front before stopping (0 disables it)", default="0"
+    )
+    parser.add_argument("--hv_tolerance", help="Minimum hypervolume growth regarded as an improvement", default="0")
+    parser.add_argument("--max_time", help="Wall-clock budget of the search in seconds (0 disables it)", default="0")
+    parser.add_argument("--islands", help="Number of populations evolved in parallel processes (island model)", default="1")
+    parser.add_argument("--migration_interval", help="Generations between migrations of elite solutions among islands", default="10")
+    parser.add_argument("--migrants", help="Number of elite solutions sent by each island at each migration", default="5")
+    parser.add_argument(
+        "--island_cross_probs", help="Crossover probability of each island (cycled over islands)", nargs="*", default=[]
+    )
+    parser.add_argument("--island_mut_probs", help="Mutation probability of each island (cycled over islands)", nargs="*", default=[])
+    parser.add_argument("--warm_start", help="Heuristics whose placements seed the initial population", nargs="*", default=[])
+    parser.add_argument("--warm_start_ratio", help="Share of the initial population seeded by heuristics", default="0.5")
+    parser.add_argument("--perturbation_rate", help="Share of the services moved by perturbations of seeded solutions", default="0.1")
 
     args = parser.parse_args()
 
@@ -71,6 +194,26 @@ if __name__ == "__main__":
         "n_gen": int(args.n_gen),
         "cross_prob": float(args.cross_prob),
         "mut_prob": float(args.mut_prob),
+        "workers": int(args.workers),
+        "delta_evaluation": args.delta_evaluation,
+        "fitness_cache_size": float(args.fitness_cache_size),
+        "patience": int(args.patience),
+        "hv_tolerance": float(args.hv_tolerance),
+        "max_time": float(args.max_time),
+        "islands": int(args.islands),
+        "migration_interval": int(args.migration_interval),
+        "migrants": int(args.migrants),
+        "island_cross_probs": [float(probability) for probability in args.island_cross_probs],
+        "island_mut_probs": [float(probability) for probability in args.island_mut_probs],
+        "warm_start": args.warm_start,
+        "warm_start_ratio": float(args.warm_start_ratio),
+        "perturbation_rate": float(args.perturbation_rate),
     }
 
-    main(seed_value=int(args.seed), algorithm=args.algorithm, dataset=args.dataset, parameters=parameters)
+    main(
+        seed_value=int(args.seed),
+        algorithm=args.algorithm,
+        dataset=args.dataset,
+        parameters=parameters,
+        instrumentation=args.instrumentation,
+    )
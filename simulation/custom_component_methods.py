@@ -3,6 +3,121 @@ from edge_sim_py import *
 
 # Importing helper methods
 from .helper_methods import *
+from .objective_aggregates import get_objective_aggregates
+from .layer_residency import get_layer_residency
+from .instrumentation import INSTRUMENTATION
+
+
+class IndexedInstances(list):
+    """List of instances of a component class that keeps an index of the instances by ID. Any change to the list invalidates the
+    index, which is rebuilt at the next lookup (IDs are assigned right after instances are appended to the list, so the index
+    cannot be updated on the fly).
+    """
+
+    def __init__(self, instances: list):
+        """Creates the list of instances.
+
+        Args:
+            instances (list): Instances of the component class.
+        """
+        super().__init__(instances)
+        self.index = None
+
+    def get(self, obj_id: int) -> object:
+        """Finds the instance with a given ID.
+
+        Args:
+            obj_id (int): Instance ID.
+
+        Returns:
+            obj (object): First instance in the list with the given ID (or None if there is no such instance).
+        """
+        if self.index is None:
+            # Iterating over instances in reverse order so that the first instance with a given ID is kept
+            self.index = {obj.id: obj for obj in reversed(self)}
+
+        return self.index.get(obj_id)
+
+
+def invalidate_index(method_name: str) -> object:
+    """Wraps a list method that changes the list, so that it invalidates the index of instances by ID.
+
+    Args:
+        method_name (str): Name of the list method.
+
+    Returns:
+        method (object): Wrapped method.
+    """
+    list_method = getattr(list, method_name)
+
+    def method(self, *args, **kwargs):
+        self.index = None
+        return list_method(self, *args, **kwargs)
+
+    return method
+
+
+for method_name in [
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+]:
+    setattr(IndexedInstances, method_name, invalidate_index(method_name=method_name))
+
+
+def component_manager_find_by_id(cls, obj_id: int) -> object:
+    """Finds a component by its ID in constant time, using an index of instances by ID.
+
+    The list of instances of each component class is turned into an indexed list at the first lookup, which happens while the
+    relationships of the components described in the dataset are resolved. EdgeSimPy replaces these lists when a dataset is loaded.
+
+    Args:
+        obj_id (int): Component ID.
+
+    Returns:
+        obj (object): Component with the given ID (or None if there is no such component).
+    """
+    # Finding the class that holds the list of instances (classes may share the list of their base classes)
+    owner = cls if "_instances" in cls.__dict__ else next(c for c in cls.__mro__ if "_instances" in c.__dict__)
+
+    instances = owner._instances
+    if type(instances) is not IndexedInstances:
+        instances = owner._instances = IndexedInstances(instances)
+
+    return instances.get(obj_id)
+
+
+def edge_server_has_capacity_to_host(self, service: object) -> bool:
+    """Checks if the edge server has enough free resources to host a given service, calculating the disk demand of the layers it
+    lacks from the layer residency bitsets.
+
+    Args:
+        service (object): Service object that we are trying to host on the edge server.
+
+    Returns:
+        can_host (bool): Information of whether the edge server has capacity to host the service or not.
+    """
+    INSTRUMENTATION.count("capacity_probes")
+
+    # Calculating the additional disk demand that would be incurred to the edge server
+    additional_disk_demand = get_layer_residency().get_additional_disk_demand(edge_server=self, service=service)
+
+    # Calculating the edge server's free resources
+    free_cpu = self.cpu - self.cpu_demand
+    free_memory = self.memory - self.memory_demand
+    free_disk = self.disk - self.disk_demand
+
+    # Checking if the edge server would have resources to host the service
+    can_host = free_cpu >= service.cpu_demand and free_memory >= service.memory_demand and free_disk >= additional_disk_demand
+    return can_host
 
 
 def user_set_communication_path(self, app: object, communication_path: list = []) -> list:
@@ -54,14 +169,22 @@ def user_set_communication_path(self, app: object, communication_path: list = []
     # Computing application's delay
     self._compute_delay(app=app, metric="latency")
 
+    # Refreshing the objective aggregates (if they are kept) based on the application's new delay
+    aggregates = getattr(topology, "objective_aggregates", None)
+    if aggregates is not None:
+        aggregates.update_application(user=self, app=app, delay=self.delays[str(app.id)])
+
     communication_path = self.communication_paths[str(app.id)]
     return communication_path
 
 
-def topology_collect(self) -> dict:
+def topology_collect(self, level: str = "full") -> dict:
     """Method that collects a set of metrics for the object.
 
-    The network topology aggregates the following metrics from the simulation:
+    The "objectives" level (used when evaluating placement schemes) reads the number of overloaded edge servers, the overall
+    occupation and power consumption, and the number of SLA violations from the objective aggregates, which are kept up to date as
+    services are provisioned. The "full" level (used by the periodic dumps of the simulator, whose logs are read by the analysis of
+    results) aggregates the following metrics from the simulation:
         1. Infrastructure Usage
             - Overall Occupation
             - Occupation per Infrastructure Provider
@@ -78,9 +201,17 @@ def topology_collect(self) -> dict:
             - Privacy Violations per Application Delay SLA
             - Privacy Violations per Service Privacy Requirement
 
+    Args:
+        level (str, optional): Level of detail of the collected metrics ("objectives" or "full"). Defaults to "full".
+
     Returns:
         metrics (dict): Object metrics.
     """
+    if level == "objectives":
+        return get_objective_aggregates().get_metrics()
+    elif level != "full":
+        raise Exception(f"Invalid metrics level '{level}'. Valid levels: objectives, full.")
+
     # Declaring infrastructure metrics
     overloaded_edge_servers = 0
     overall_occupation = 0
@@ -1,15 +1,28 @@
 # Importing EdgeSimPy components
 from edge_sim_py.components.topology import Topology
 from edge_sim_py.components.network_switch import NetworkSwitch
+from edge_sim_py.components.network_link import NetworkLink
 from edge_sim_py.components.edge_server import EdgeServer
 from edge_sim_py.components.user import User
 from edge_sim_py.components.application import Application
 from edge_sim_py.components.container_layer import ContainerLayer
 from edge_sim_py.components.service import Service
 
+# Importing the instrumentation of strategies and helper methods
+from simulation.instrumentation import INSTRUMENTATION
+
 # Importing Python libraries
 import networkx as nx
+import numpy as np
+import tempfile
+import hashlib
+import msgpack
 import random
+import json
+import os
+
+# Prefixes of the names of files derived from datasets, indexed by the path, modification time, and size of the dataset files
+DATASET_CACHE_PREFIXES = {}
 
 
 def uniform(n_items: int, valid_values: list, shuffle_distribution: bool = True) -> list:
@@ -62,6 +75,8 @@ def provision(user: object, application: object, service: object, edge_server: o
         service (object): Service to be provisioned.
         edge_server (object): Edge server that will host the edge server.
     """
+    INSTRUMENTATION.count("provision.calls")
+
     # Updating the host's resource usage
     edge_server.cpu_demand += service.cpu_demand
     edge_server.memory_demand += service.memory_demand
@@ -70,21 +85,168 @@ def provision(user: object, application: object, service: object, edge_server: o
     service.server = edge_server
     edge_server.services.append(service)
 
-    for layer_metadata in edge_server._get_uncached_layers(service=service):
-        layer = ContainerLayer(
-            digest=layer_metadata.digest,
-            size=layer_metadata.size,
-            instruction=layer_metadata.instruction,
+    with INSTRUMENTATION.timer("provision.container_layers"):
+        for layer_metadata in edge_server._get_uncached_layers(service=service):
+            layer = ContainerLayer(
+                digest=layer_metadata.digest,
+                size=layer_metadata.size,
+                instruction=layer_metadata.instruction,
+            )
+
+            # Updating host's resource usage based on the layer size
+            edge_server.disk_demand += layer.size
+
+            # Creating relationship between the host and the layer
+            layer.server = edge_server
+            edge_server.container_layers.append(layer)
+
+    topology = Topology.first()
+
+    # Flagging the service's layers as residing on the host (if layer residency bitsets are kept)
+    residency = getattr(topology, "layer_residency", None)
+    if residency is not None:
+        residency.add_service(edge_server=edge_server, service=service)
+
+    # Refreshing the objective aggregates (if they are kept) based on the new state of the host and the service
+    aggregates = getattr(topology, "objective_aggregates", None)
+    if aggregates is not None:
+        aggregates.update_edge_server(edge_server=edge_server)
+        aggregates.update_service(service=service)
+
+    with INSTRUMENTATION.timer("provision.communication_path"):
+        user.set_communication_path(app=application)
+
+
+def get_dataset_hash(dataset: str) -> str:
+    """Calculates a hash of the dataset file contents, used to identify files derived from the dataset.
+
+    Args:
+        dataset (str): Path of the dataset file.
+
+    Returns:
+        dataset_hash (str): Hexadecimal SHA-256 hash of the dataset file.
+    """
+    sha256 = hashlib.sha256()
+    with open(dataset, "rb") as dataset_file:
+        for chunk in iter(lambda: dataset_file.read(1 << 20), b""):
+            sha256.update(chunk)
+
+    dataset_hash = sha256.hexdigest()
+    return dataset_hash
+
+
+def compute_shortest_paths(topology: object) -> tuple:
+    """Computes the delay of the shortest paths (delay used as weight) between all pairs of network switches.
+
+    Args:
+        topology (object): Network topology.
+
+    Returns:
+        shortest_paths (tuple): Matrix with the delay between each pair of network switches (indexed by their position in
+            "NetworkSwitch.all()") and matrix with the predecessor of each target network switch in the shortest path from each
+            origin network switch (-1 if there is no such predecessor), used to reconstruct the paths.
+    """
+    network_switches = NetworkSwitch.all()
+    switch_indices = {network_switch: index for index, network_switch in enumerate(network_switches)}
+
+    delays = np.full((len(network_switches), len(network_switches)), np.inf)
+    predecessors = np.full((len(network_switches), len(network_switches)), -1, dtype=np.int32)
+
+    for origin_index, origin_network_switch in enumerate(network_switches):
+        origin_predecessors, origin_delays = nx.dijkstra_predecessor_and_distance(
+            G=topology, source=origin_network_switch, weight="delay"
         )
+        for target_network_switch, delay in origin_delays.items():
+            target_index = switch_indices[target_network_switch]
+            delays[origin_index, target_index] = delay
+            if len(origin_predecessors[target_network_switch]) > 0:
+                predecessors[origin_index, target_index] = switch_indices[origin_predecessors[target_network_switch][0]]
+
+    shortest_paths = (delays, predecessors)
+    return shortest_paths
+
+
+def get_dataset_cache_prefix(dataset: str) -> str:
+    """Gets the prefix of the names of files derived from a dataset, which are placed next to it and identified by the hash of
+    its contents (the hash is only recalculated when the dataset file changes).
 
-        # Updating host's resource usage based on the layer size
-        edge_server.disk_demand += layer.size
+    Args:
+        dataset (str): Path of the dataset file.
+
+    Returns:
+        file_prefix (str): Prefix of the names of files derived from the dataset.
+    """
+    status = os.stat(dataset)
+    key = (os.path.abspath(dataset), status.st_mtime_ns, status.st_size)
+    if key not in DATASET_CACHE_PREFIXES:
+        DATASET_CACHE_PREFIXES[key] = f"{os.path.splitext(dataset)[0]}.{get_dataset_hash(dataset=dataset)[:16]}"
 
-        # Creating relationship between the host and the layer
-        layer.server = edge_server
-        edge_server.container_layers.append(layer)
+    return DATASET_CACHE_PREFIXES[key]
 
-    user.set_communication_path(app=application)
+
+def load_dataset(dataset: str) -> dict:
+    """Loads the contents of a dataset. The first load parses the JSON file and stores its contents in a MessagePack file placed
+    next to it (identified by the hash of the dataset contents), which is read by further loads instead of the JSON file.
+
+    Args:
+        dataset (str): Path of the dataset file.
+
+    Returns:
+        data (dict): Dataset contents.
+    """
+    cache_file = f"{get_dataset_cache_prefix(dataset=dataset)}.msgpack"
+
+    if os.path.exists(cache_file):
+        with open(cache_file, "rb") as binary_file:
+            return msgpack.unpackb(binary_file.read(), strict_map_key=False)
+
+    with open(dataset, "r", encoding="UTF-8") as json_file:
+        data = json.load(json_file)
+
+    # The file is written under a temporary name and then renamed, avoiding clashes between simulations running in parallel
+    file_descriptor, temporary_file_name = tempfile.mkstemp(dir=os.path.dirname(cache_file) or ".", suffix=".msgpack")
+    with os.fdopen(file_descriptor, "wb") as temporary_file:
+        temporary_file.write(msgpack.packb(data))
+    os.replace(temporary_file_name, cache_file)
+
+    return data
+
+
+def load_shortest_paths(dataset: str = None):
+    """Loads the all-pairs shortest paths of the network topology. Shortest paths are stored in files placed next to the
+    dataset (identified by the hash of its contents), so that only the first run over a dataset needs to compute them and
+    further runs just memory-map the stored matrices. When no dataset is informed, shortest paths are computed in memory.
+
+    Args:
+        dataset (str, optional): Path of the dataset file that describes the simulated scenario. Defaults to None.
+    """
+    topology = Topology.first()
+
+    shortest_paths = None
+    if dataset is not None:
+        file_prefix = get_dataset_cache_prefix(dataset=dataset)
+        delays_file = f"{file_prefix}.delays.npy"
+        predecessors_file = f"{file_prefix}.predecessors.npy"
+
+        if os.path.exists(delays_file) and os.path.exists(predecessors_file):
+            shortest_paths = (np.load(delays_file, mmap_mode="r"), np.load(predecessors_file, mmap_mode="r"))
+            INSTRUMENTATION.count("shortest_paths.cache_hits")
+
+    if shortest_paths is None:
+        INSTRUMENTATION.count("shortest_paths.cache_misses")
+        with INSTRUMENTATION.timer("shortest_paths.computation"):
+            shortest_paths = compute_shortest_paths(topology=topology)
+
+        # Files are written under temporary names and then renamed, avoiding clashes between simulations running in parallel
+        if dataset is not None:
+            for file_name, matrix in zip([delays_file, predecessors_file], shortest_paths):
+                file_descriptor, temporary_file_name = tempfile.mkstemp(dir=os.path.dirname(file_name) or ".", suffix=".npy")
+                with os.fdopen(file_descriptor, "wb") as temporary_file:
+                    np.save(temporary_file, matrix)
+                os.replace(temporary_file_name, file_name)
+
+    topology.switch_indices = {network_switch: index for index, network_switch in enumerate(NetworkSwitch.all())}
+    topology.delay_matrix, topology.predecessor_matrix = shortest_paths
 
 
 def find_shortest_path(origin_network_switch: object, target_network_switch: object) -> int:
@@ -98,18 +260,24 @@ def find_shortest_path(origin_network_switch: object, target_network_switch: obj
         path (list): Shortest path between the origin and target network switches.
     """
     topology = origin_network_switch.model.topology
-    path = []
 
-    if not hasattr(topology, "delay_shortest_paths"):
-        topology.delay_shortest_paths = {}
+    if not hasattr(topology, "delay_matrix"):
+        load_shortest_paths()
 
-    key = (origin_network_switch, target_network_switch)
+    INSTRUMENTATION.count("shortest_paths.path_lookups")
 
-    if key in topology.delay_shortest_paths.keys():
-        path = topology.delay_shortest_paths[key]
-    else:
-        path = nx.shortest_path(G=topology, source=origin_network_switch, target=target_network_switch, weight="delay")
-        topology.delay_shortest_paths[key] = path
+    origin_index = topology.switch_indices[origin_network_switch]
+    network_switches = NetworkSwitch.all()
+
+    # Walking the predecessors from the target network switch back to the origin network switch
+    path = [target_network_switch]
+    index = topology.switch_indices[target_network_switch]
+    while index != origin_index:
+        index = topology.predecessor_matrix[origin_index, index]
+        if index < 0:
+            raise nx.NetworkXNoPath(f"No path between {origin_network_switch} and {target_network_switch}.")
+        path.append(network_switches[index])
+    path.reverse()
 
     return path
 
@@ -126,8 +294,14 @@ def calculate_path_delay(origin_network_switch: object, target_network_switch: o
     """
     topology = origin_network_switch.model.topology
 
-    path = find_shortest_path(origin_network_switch=origin_network_switch, target_network_switch=target_network_switch)
-    delay = topology.calculate_path_delay(path=path)
+    if not hasattr(topology, "delay_matrix"):
+        load_shortest_paths()
+
+    INSTRUMENTATION.count("shortest_paths.delay_lookups")
+
+    delay = topology.delay_matrix[
+        topology.switch_indices[origin_network_switch], topology.switch_indices[target_network_switch]
+    ].item()
 
     return delay
 
@@ -245,37 +419,100 @@ def apply_placement(solution: list):
         provision(user=user, application=app, service=service, edge_server=edge_server)
 
 
-def reset_placement():
-    """Resets the placement scheme suggested by the chromosome."""
-    for edge_server in EdgeServer.all():
-        # Resetting the demand
-        edge_server.cpu_demand = 0
-        edge_server.memory_demand = 0
-        edge_server.disk_demand = 0
+def take_snapshot() -> dict:
+    """Captures the mutable placement state of the scenario (edge servers, services, container layers, applications, users, network
+    links, layer residency bitsets, and objective aggregates), so that placement schemes can be undone by "restore_snapshot". The
+    snapshot is stored within the network topology.
+
+    Returns:
+        snapshot (dict): Placement state of the scenario.
+    """
+    snapshot = {
+        "edge_servers": [
+            (
+                edge_server,
+                edge_server.cpu_demand,
+                edge_server.memory_demand,
+                edge_server.disk_demand,
+                list(edge_server.services),
+                list(edge_server.container_layers),
+            )
+            for edge_server in EdgeServer.all()
+        ],
+        "services": [(service, service.server) for service in Service.all()],
+        "container_layers": (ContainerLayer.count(), ContainerLayer._object_count),
+        "applications": [(app, app.provisioned) for app in Application.all()],
+        "users": [(user, dict(user.delays), dict(user.communication_paths)) for user in User.all()],
+        "network_links": [(link, link["bandwidth_demand"], list(link["applications"])) for link in NetworkLink.all()],
+    }
+
+    topology = Topology.first()
+    residency = getattr(topology, "layer_residency", None)
+    snapshot["layer_residency"] = residency.get_state() if residency is not None else None
+    aggregates = getattr(topology, "objective_aggregates", None)
+    snapshot["objective_aggregates"] = aggregates.get_state() if aggregates is not None else None
 
-        # Deprovisioning services
-        for service in edge_server.services:
-            service.server = None
-        edge_server.services = []
+    topology.snapshot = snapshot
 
-        # Removing layers from edge servers not initially set as hosts for container registries
-        if len(edge_server.container_registries) == 0:
-            layers = list(edge_server.container_layers)
-            edge_server.container_layers = []
-            for layer in layers:
-                layer.server = None
-                ContainerLayer.remove(layer)
+    return snapshot
 
-    for user in User.all():
-        for app in user.applications:
-            user.delays[str(app.id)] = 0
-            user.communication_paths[str(app.id)] = []
+
+def restore_snapshot(snapshot: dict = None):
+    """Restores the placement state captured by "take_snapshot", undoing placement schemes applied after it was taken.
+
+    Args:
+        snapshot (dict, optional): Placement state of the scenario. Defaults to None (the snapshot stored within the topology is used).
+    """
+    topology = Topology.first()
+    if snapshot is None:
+        snapshot = topology.snapshot
+
+    for edge_server, cpu_demand, memory_demand, disk_demand, services, container_layers in snapshot["edge_servers"]:
+        edge_server.cpu_demand = cpu_demand
+        edge_server.memory_demand = memory_demand
+        edge_server.disk_demand = disk_demand
+        edge_server.services = list(services)
+        edge_server.container_layers = list(container_layers)
+
+    for service, server in snapshot["services"]:
+        service.server = server
+
+    # Discarding the container layers created after the snapshot (they are appended to the list of instances when created)
+    number_of_layers, object_count = snapshot["container_layers"]
+    del ContainerLayer.all()[number_of_layers:]
+    ContainerLayer._object_count = object_count
+
+    # Restoring the provisioning flags of applications (set by strategies once all the services of an application are hosted)
+    for app, provisioned in snapshot["applications"]:
+        app.provisioned = provisioned
+
+    for user, delays, communication_paths in snapshot["users"]:
+        user.delays = dict(delays)
+        user.communication_paths = dict(communication_paths)
+
+    for link, bandwidth_demand, applications in snapshot["network_links"]:
+        link["bandwidth_demand"] = bandwidth_demand
+        link["applications"] = list(applications)
+
+    # Restoring the layer residency bitsets (bitsets created after the snapshot are discarded and recreated when needed)
+    if hasattr(topology, "layer_residency"):
+        if snapshot["layer_residency"] is not None:
+            topology.layer_residency.set_state(state=snapshot["layer_residency"])
+        else:
+            del topology.layer_residency
+
+    # Restoring the objective aggregates (aggregates created after the snapshot are discarded and recreated when needed)
+    if hasattr(topology, "objective_aggregates"):
+        if snapshot["objective_aggregates"] is not None:
+            topology.objective_aggregates.set_state(state=snapshot["objective_aggregates"])
+        else:
+            del topology.objective_aggregates
 
 
 def evaluate_placement() -> tuple:
     """Evaluates a placement scheme based on the normalized number of SLA violations (delay and privacy) and power consumption."""
     # Gathering metrics
-    metrics = Topology.first().collect()
+    metrics = Topology.first().collect(level="objectives")
 
     # Gathering the number of overloaded edge servers
     overloaded_edge_servers = metrics["overloaded_edge_servers"]
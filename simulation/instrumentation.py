@@ -0,0 +1,115 @@
+# Importing Python libraries
+from contextlib import nullcontext
+from time import perf_counter
+import json
+import os
+
+
+class Timer:
+    """Context manager that accumulates the number of calls and the elapsed time of a named phase."""
+
+    __slots__ = ["timers", "name", "start"]
+
+    def __init__(self, timers: dict, name: str):
+        """Creates the timer.
+
+        Args:
+            timers (dict): Number of calls and elapsed time (in seconds) of each named phase.
+            name (str): Name of the phase being timed.
+        """
+        self.timers = timers
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        elapsed_time = perf_counter() - self.start
+        calls, total_time = self.timers.get(self.name, (0, 0))
+        self.timers[self.name] = (calls + 1, total_time + elapsed_time)
+
+
+class Instrumentation:
+    """Opt-in named timers and counters used to find out where strategies spend their time (e.g., candidate generation, sorting,
+    capacity probes, and provisioning). Instrumentation is disabled by default: while disabled, "count" returns right away and
+    "timer" returns a shared no-op context manager, so instrumented code pays only for a method call.
+
+    Timers are inclusive (i.e., the time of a phase includes the time of the phases nested in it).
+    """
+
+    def __init__(self):
+        """Creates the instrumentation (disabled)."""
+        self.enabled = False
+        self.timers = {}
+        self.counters = {}
+        self.null_timer = nullcontext()
+
+    def reset(self, enabled: bool):
+        """Discards the collected measurements, enabling or disabling the instrumentation.
+
+        Args:
+            enabled (bool): Whether measurements are collected.
+        """
+        self.enabled = enabled
+        self.timers = {}
+        self.counters = {}
+
+    def count(self, name: str, value: int = 1):
+        """Increments a named counter.
+
+        Args:
+            name (str): Counter name.
+            value (int, optional): Increment. Defaults to 1.
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def timer(self, name: str) -> object:
+        """Creates a context manager that times a named phase.
+
+        Args:
+            name (str): Phase name.
+
+        Returns:
+            timer (object): Context manager that times the phase (or does nothing if instrumentation is disabled).
+        """
+        if self.enabled:
+            return Timer(timers=self.timers, name=name)
+        return self.null_timer
+
+    def get_summary(self) -> dict:
+        """Gathers the collected measurements.
+
+        Returns:
+            summary (dict): Number of calls and elapsed time (in seconds) of each phase, and value of each counter.
+        """
+        summary = {
+            "timers": {name: {"calls": calls, "time": total_time} for name, (calls, total_time) in sorted(self.timers.items())},
+            "counters": dict(sorted(self.counters.items())),
+        }
+        return summary
+
+    def dump(self, logs_directory: str):
+        """Writes the collected measurements into the simulation logs, next to the metrics of the simulated components.
+
+        Args:
+            logs_directory (str): Directory of the simulation logs.
+        """
+        os.makedirs(logs_directory, exist_ok=True)
+        with open(os.path.join(logs_directory, "Instrumentation.json"), "w", encoding="UTF-8") as json_file:
+            json.dump(self.get_summary(), json_file, indent=4)
+
+    def print_summary(self):
+        """Prints the collected measurements, sorting phases by their elapsed time."""
+        summary = self.get_summary()
+
+        print("==== instrumentation ====")
+        for name, timer in sorted(summary["timers"].items(), key=lambda item: -item[1]["time"]):
+            print(f"{name}: {timer['time']:.4f} seconds ({timer['calls']} calls)")
+        for name, value in summary["counters"].items():
+            print(f"{name}: {value}")
+
+
+# Instrumentation shared by the strategies and helper methods (reset by each simulation)
+INSTRUMENTATION = Instrumentation()
@@ -0,0 +1,126 @@
+# Importing EdgeSimPy components
+from edge_sim_py.components.topology import Topology
+from edge_sim_py.components.edge_server import EdgeServer
+from edge_sim_py.components.service import Service
+
+# Importing the placement model
+from simulation.placement_model import get_placement_model
+
+# Importing Python libraries
+import numpy as np
+
+
+class LayerResidency:
+    """Bitsets of the container layers residing on each edge server, defined over the layers of the placement model (the i-th bit
+    refers to the i-th layer).
+
+    The layers an edge server lacks to host a service are given by a bitwise AND between the bitset of the service's image and the
+    complement of the server's bitset, and their overall size by the dot product between the resulting bits and the layer sizes
+    (memoized per combination of missing layers). It replaces the digest comparisons performed by "_get_uncached_layers". Bitsets
+    are refreshed by "provision" and restored alongside the scenario snapshot.
+    """
+
+    def __init__(self):
+        """Creates the bitsets based on the layers stored (or being downloaded) by edge servers."""
+        model = get_placement_model()
+        layer_index_by_digest = {digest: index for index, digest in enumerate(model.layer_digests)}
+
+        self.edge_server_indices = {edge_server: index for index, edge_server in enumerate(EdgeServer.all())}
+        self.layer_size = model.layer_size
+
+        # Gathering the layers of each container image and the image of each service
+        image_bitsets = [get_bitset(flags=image_layers) for image_layers in model.image_layers]
+        self.service_bitsets = {
+            service: image_bitsets[model.service_image[model.service_index_by_id[service.id]]] for service in Service.all()
+        }
+
+        # Gathering the layers of each edge server (as in "_get_uncached_layers", layers on download and waiting queues are included)
+        self.residency = []
+        for edge_server in self.edge_server_indices:
+            layers = (
+                list(edge_server.container_layers)
+                + [flow.metadata["object"] for flow in edge_server.download_queue]
+                + list(edge_server.waiting_queue)
+            )
+            bitset = 0
+            for layer in layers:
+                if layer.digest in layer_index_by_digest:
+                    bitset |= 1 << layer_index_by_digest[layer.digest]
+            self.residency.append(bitset)
+
+        # Declaring the memoized sizes of the combinations of missing layers
+        self.disk_demands = {0: 0}
+
+    def get_additional_disk_demand(self, edge_server: object, service: object) -> float:
+        """Calculates the disk demand that would be incurred to an edge server by the layers it lacks to host a service.
+
+        Args:
+            edge_server (object): Candidate host.
+            service (object): Service to be hosted.
+
+        Returns:
+            additional_disk_demand (float): Sum of the sizes of the service's layers that are not on the edge server.
+        """
+        uncached_layers = self.service_bitsets[service] & ~self.residency[self.edge_server_indices[edge_server]]
+
+        additional_disk_demand = self.disk_demands.get(uncached_layers)
+        if additional_disk_demand is None:
+            flags = np.array([uncached_layers >> index & 1 for index in range(len(self.layer_size))], dtype=bool)
+            additional_disk_demand = self.disk_demands[uncached_layers] = flags.dot(self.layer_size).item()
+
+        return additional_disk_demand
+
+    def add_service(self, edge_server: object, service: object):
+        """Flags the layers of a service that has just been provisioned on an edge server as residing on it.
+
+        Args:
+            edge_server (object): Host of the service.
+            service (object): Provisioned service.
+        """
+        self.residency[self.edge_server_indices[edge_server]] |= self.service_bitsets[service]
+
+    def get_state(self) -> list:
+        """Captures the bitsets, so that they can be restored alongside the scenario snapshot.
+
+        Returns:
+            state (list): Copy of the bitsets.
+        """
+        return list(self.residency)
+
+    def set_state(self, state: list):
+        """Restores bitsets captured by "get_state".
+
+        Args:
+            state (list): Copy of the bitsets.
+        """
+        self.residency = list(state)
+
+
+def get_bitset(flags: np.ndarray) -> int:
+    """Packs an array of flags into a bitset.
+
+    Args:
+        flags (np.ndarray): Boolean flags.
+
+    Returns:
+        bitset (int): Integer whose i-th bit is set if the i-th flag is set.
+    """
+    bitset = 0
+    for index in np.flatnonzero(flags).tolist():
+        bitset |= 1 << index
+
+    return bitset
+
+
+def get_layer_residency() -> LayerResidency:
+    """Gets the layer residency bitsets of the loaded scenario, which are created at the first call and stored within the network
+    topology (from then on, they are refreshed as services are provisioned).
+
+    Returns:
+        residency (LayerResidency): Layer residency bitsets of the loaded scenario.
+    """
+    topology = Topology.first()
+    if not hasattr(topology, "layer_residency"):
+        topology.layer_residency = LayerResidency()
+
+    return topology.layer_residency
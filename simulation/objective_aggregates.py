@@ -0,0 +1,178 @@
+# Importing EdgeSimPy components
+from edge_sim_py.components.topology import Topology
+from edge_sim_py.components.edge_server import EdgeServer
+from edge_sim_py.components.user import User
+from edge_sim_py.components.service import Service
+
+# Importing helper methods
+from simulation.helper_methods import *
+
+
+class ObjectiveAggregates:
+    """Running aggregates of the metrics used as objectives and penalties by the placement strategies.
+
+    Aggregates are kept per edge server (occupation, power consumption, and overload status), per application accessed by each user
+    (delay SLA violation), and per service accessed by each user (privacy SLA violation). They are refreshed by "provision" (edge
+    servers and services) and by "user_set_communication_path" (application delays), and restored alongside the scenario snapshot,
+    so collecting the objectives does not need to reroute applications. Totals are summed in the same order as "topology_collect"
+    does, yielding the same values.
+    """
+
+    def __init__(self):
+        """Creates the aggregates based on the current state of the scenario."""
+        edge_servers = EdgeServer.all()
+        services = Service.all()
+        pairs = [(user, app) for user in User.all() for app in user.applications]
+
+        self.edge_server_indices = {edge_server: index for index, edge_server in enumerate(edge_servers)}
+        self.pair_indices = {(user, app): index for index, (user, app) in enumerate(pairs)}
+        self.pair_service_indices = {}
+        for user, app in pairs:
+            for service in app.services:
+                self.pair_service_indices[(user, service)] = len(self.pair_service_indices)
+
+        # Declaring per-component aggregates
+        self.occupation = [0] * len(edge_servers)
+        self.power_consumption = [0] * len(edge_servers)
+        self.overloaded = [False] * len(edge_servers)
+        self.delay_violations = [False] * len(pairs)
+        self.privacy_violations = [False] * len(self.pair_service_indices)
+
+        # Declaring totals
+        self.overloaded_edge_servers = 0
+        self.delay_sla_violations = 0
+        self.privacy_sla_violations = 0
+
+        # Gathering the current state of the scenario
+        for edge_server in edge_servers:
+            self.update_edge_server(edge_server=edge_server)
+        for service in services:
+            self.update_service(service=service)
+        for user, app in pairs:
+            self.update_application(user=user, app=app, delay=get_application_delay(user=user, app=app))
+
+    def update_edge_server(self, edge_server: object):
+        """Refreshes the aggregates of an edge server whose demand has changed.
+
+        Args:
+            edge_server (object): Edge server whose demand has changed.
+        """
+        index = self.edge_server_indices[edge_server]
+
+        capacity = normalize_cpu_and_memory(cpu=edge_server.cpu, memory=edge_server.memory)
+        demand = normalize_cpu_and_memory(cpu=edge_server.cpu_demand, memory=edge_server.memory_demand)
+        self.occupation[index] = demand / capacity * 100
+        self.power_consumption[index] = edge_server.get_power_consumption()
+
+        overloaded = (
+            edge_server.cpu - edge_server.cpu_demand < 0
+            or edge_server.memory - edge_server.memory_demand < 0
+            or edge_server.disk - edge_server.disk_demand < 0
+        )
+        self.overloaded_edge_servers += overloaded - self.overloaded[index]
+        self.overloaded[index] = overloaded
+
+    def update_service(self, service: object):
+        """Refreshes the aggregates of a service whose host has changed.
+
+        Args:
+            service (object): Service whose host has changed.
+        """
+        for user in service.application.users:
+            index = self.pair_service_indices.get((user, service))
+            if index is not None:
+                provider = str(service.server.infrastructure_provider) if service.server else None
+                violation = bool(service.server) and service.privacy_requirement > user.providers_trust[provider]
+                self.privacy_sla_violations += violation - self.privacy_violations[index]
+                self.privacy_violations[index] = violation
+
+    def update_application(self, user: object, app: object, delay: float):
+        """Refreshes the aggregates of an application accessed by a user whose delay has changed.
+
+        Args:
+            user (object): User that accesses the application.
+            app (object): Application whose delay has changed.
+            delay (float): New delay of the application.
+        """
+        index = self.pair_indices[(user, app)]
+
+        violation = delay > user.delay_slas[str(app.id)]
+        self.delay_sla_violations += violation - self.delay_violations[index]
+        self.delay_violations[index] = violation
+
+    def get_state(self) -> dict:
+        """Captures the aggregates, so that they can be restored alongside the scenario snapshot.
+
+        Returns:
+            state (dict): Copy of the aggregates.
+        """
+        state = {
+            "occupation": list(self.occupation),
+            "power_consumption": list(self.power_consumption),
+            "overloaded": list(self.overloaded),
+            "delay_violations": list(self.delay_violations),
+            "privacy_violations": list(self.privacy_violations),
+            "overloaded_edge_servers": self.overloaded_edge_servers,
+            "delay_sla_violations": self.delay_sla_violations,
+            "privacy_sla_violations": self.privacy_sla_violations,
+        }
+        return state
+
+    def set_state(self, state: dict):
+        """Restores aggregates captured by "get_state".
+
+        Args:
+            state (dict): Copy of the aggregates.
+        """
+        for attribute, value in state.items():
+            setattr(self, attribute, list(value) if isinstance(value, list) else value)
+
+    def get_metrics(self) -> dict:
+        """Gets the metrics used as objectives and penalties by the placement strategies.
+
+        Returns:
+            metrics (dict): Number of overloaded edge servers, overall occupation and power consumption, and number of SLA violations.
+        """
+        metrics = {
+            "overloaded_edge_servers": self.overloaded_edge_servers,
+            "overall_occupation": sum(self.occupation) / len(self.occupation),
+            "overall_power_consumption": sum(self.power_consumption),
+            "delay_sla_violations": self.delay_sla_violations,
+            "privacy_sla_violations": self.privacy_sla_violations,
+        }
+        return metrics
+
+
+def get_application_delay(user: object, app: object) -> float:
+    """Calculates the delay of an application accessed by a user based on the current hosts of its services, without allocating
+    the communication path on the network links.
+
+    Args:
+        user (object): User that accesses the application.
+        app (object): Application whose delay will be calculated.
+
+    Returns:
+        delay (float): Delay of the application.
+    """
+    communication_chain = [user.base_station] + [service.server.base_station for service in app.services if service.server]
+
+    delay = user.base_station.wireless_delay
+    for origin, target in zip(communication_chain, communication_chain[1:]):
+        if origin != target:
+            delay += calculate_path_delay(origin_network_switch=origin.network_switch, target_network_switch=target.network_switch)
+
+    return delay
+
+
+def get_objective_aggregates() -> ObjectiveAggregates:
+    """Gets the objective aggregates of the loaded scenario, which are created at the first call and stored within the network
+    topology (from then on, they are refreshed as services are provisioned).
+
+    Returns:
+        aggregates (ObjectiveAggregates): Objective aggregates of the loaded scenario.
+    """
+    topology = Topology.first()
+    if not hasattr(topology, "objective_aggregates"):
+        topology.objective_aggregates = ObjectiveAggregates()
+
+    return topology.objective_aggregates
@@ -0,0 +1,188 @@
+# Importing EdgeSimPy components
+from edge_sim_py.components.topology import Topology
+from edge_sim_py.components.edge_server import EdgeServer
+from edge_sim_py.components.user import User
+from edge_sim_py.components.application import Application
+from edge_sim_py.components.container_image import ContainerImage
+from edge_sim_py.components.container_layer import ContainerLayer
+from edge_sim_py.components.service import Service
+
+# Importing helper methods
+from simulation.helper_methods import *
+
+# Importing Python libraries
+import numpy as np
+
+
+class PlacementModel:
+    """Struct-of-arrays description of the placement problem, built once from the loaded scenario.
+
+    Components are referred to by their indices in the arrays below: edge servers follow the order of "EdgeServer.all()", whereas
+    services, applications, and users are sorted by ID (so that the i-th gene of a chromosome refers to the i-th service). The model
+    only holds NumPy arrays and plain Python values, so it can be cheaply sent to other processes.
+    """
+
+    def __init__(self):
+        """Gathers the attributes of the scenario components into NumPy arrays."""
+        edge_servers = EdgeServer.all()
+        services = sorted(Service.all(), key=lambda service: service.id)
+        applications = sorted(Application.all(), key=lambda app: app.id)
+        users = sorted(User.all(), key=lambda user: user.id)
+
+        # Creating the mappings between component IDs and their indices in the model arrays
+        self.edge_server_ids = np.array([edge_server.id for edge_server in edge_servers], dtype=int)
+        self.service_ids = np.array([service.id for service in services], dtype=int)
+        self.application_ids = np.array([app.id for app in applications], dtype=int)
+        self.user_ids = np.array([user.id for user in users], dtype=int)
+        self.edge_server_index_by_id = get_index_by_id(ids=self.edge_server_ids)
+        self.service_index_by_id = get_index_by_id(ids=self.service_ids)
+        self.application_index_by_id = get_index_by_id(ids=self.application_ids)
+        self.user_index_by_id = get_index_by_id(ids=self.user_ids)
+
+        # Gathering infrastructure providers (users' trust degrees are defined per provider)
+        self.provider_ids = list(dict.fromkeys(edge_server.infrastructure_provider for edge_server in edge_servers))
+        provider_index_by_id = {provider: index for index, provider in enumerate(self.provider_ids)}
+
+        # Gathering the network switch of each edge server and user from the all-pairs shortest paths of the network topology
+        topology = Topology.first()
+        if not hasattr(topology, "delay_matrix"):
+            load_shortest_paths()
+        self.switch_delays = topology.delay_matrix
+
+        # Gathering edge server capacities, demands, providers, and network switches
+        self.edge_server_cpu = np.array([edge_server.cpu for edge_server in edge_servers])
+        self.edge_server_memory = np.array([edge_server.memory for edge_server in edge_servers])
+        self.edge_server_disk = np.array([edge_server.disk for edge_server in edge_servers])
+        self.edge_server_cpu_demand = np.array([edge_server.cpu_demand for edge_server in edge_servers])
+        self.edge_server_memory_demand = np.array([edge_server.memory_demand for edge_server in edge_servers])
+        self.edge_server_disk_demand = np.array([edge_server.disk_demand for edge_server in edge_servers])
+        self.edge_server_provider = np.array([provider_index_by_id[server.infrastructure_provider] for server in edge_servers])
+        self.edge_server_switch = np.array([topology.switch_indices[edge_server.network_switch] for edge_server in edge_servers])
+
+        # Gathering the parameters of the linear power model of edge servers (servers without power models or inactive are skipped)
+        self.edge_server_consumes_power = np.array(
+            [bool(edge_server.power_model and edge_server.active) for edge_server in edge_servers]
+        )
+        self.edge_server_static_power_percentage = np.array(
+            [edge_server.power_model_parameters["static_power_percentage"] for edge_server in edge_servers], dtype=float
+        )
+        self.edge_server_max_power_consumption = np.array(
+            [edge_server.power_model_parameters["max_power_consumption"] for edge_server in edge_servers], dtype=float
+        )
+        static_power = []
+        constant = []
+        for edge_server in edge_servers:
+            parameters = edge_server.power_model_parameters
+            static_power.append(parameters["static_power_percentage"] * parameters["max_power_consumption"])
+            constant.append((parameters["max_power_consumption"] - static_power[-1]) / 100)
+        self.edge_server_static_power = np.array(static_power, dtype=float)
+        self.edge_server_power_constant = np.array(constant, dtype=float)
+        self.max_power_consumption_possible = sum([server.power_model_parameters["max_power_consumption"] for server in edge_servers])
+
+        # Gathering service demands, privacy requirements, and positions in their application's service chains
+        self.service_cpu_demand = np.array([service.cpu_demand for service in services])
+        self.service_memory_demand = np.array([service.memory_demand for service in services])
+        self.service_privacy_requirement = np.array([service.privacy_requirement for service in services])
+        self.service_application = np.array([self.application_index_by_id[service.application.id] for service in services])
+        self.service_chain_position = np.array([service.application.services.index(service) for service in services])
+
+        # Gathering the service chain, the user (applications are accessed by their first user), and the delay SLA of applications
+        self.application_services = [
+            np.array([self.service_index_by_id[service.id] for service in app.services], dtype=int) for app in applications
+        ]
+        self.application_user = np.array([self.user_index_by_id[app.users[0].id] for app in applications])
+        self.application_delay_sla = np.array([app.users[0].delay_slas[str(app.id)] for app in applications])
+
+        # Gathering the trust degree of users on each infrastructure provider and the network switch of their base stations
+        self.user_trust = np.array([[user.providers_trust[str(provider)] for provider in self.provider_ids] for user in users])
+        self.user_switch = np.array([topology.switch_indices[user.base_station.network_switch] for user in users])
+        self.user_wireless_delay = np.array([user.base_station.wireless_delay for user in users])
+
+        # Gathering the applications accessed by each user (in the order used by EdgeSimPy to iterate over them) and their SLAs
+        self.pair_user, self.pair_application, self.pair_delay_sla = [], [], []
+        for user in User.all():
+            for app in user.applications:
+                self.pair_user.append(self.user_index_by_id[user.id])
+                self.pair_application.append(self.application_index_by_id[app.id])
+                self.pair_delay_sla.append(user.delay_slas[str(app.id)])
+        self.pair_user = np.array(self.pair_user, dtype=int)
+        self.pair_application = np.array(self.pair_application, dtype=int)
+        self.pair_delay_sla = np.array(self.pair_delay_sla)
+
+        # Gathering container images and layers. Layers are identified by their digests, as done by "_get_uncached_layers"
+        images = ContainerImage.all()
+        image_index_by_digest = {image.digest: index for index, image in enumerate(images)}
+        self.layer_digests = list(dict.fromkeys(digest for image in images for digest in image.layers_digests))
+        layer_index_by_digest = {digest: index for index, digest in enumerate(self.layer_digests)}
+
+        self.service_image = np.array([image_index_by_digest[service.image_digest] for service in services])
+        self.image_layers = np.zeros((len(images), len(self.layer_digests)), dtype=bool)
+        for image_index, image in enumerate(images):
+            for digest in image.layers_digests:
+                self.image_layers[image_index, layer_index_by_digest[digest]] = True
+        self.layer_size = np.array(
+            [ContainerLayer.find_by(attribute_name="digest", attribute_value=digest).size for digest in self.layer_digests],
+            dtype=float,
+        )
+
+        # Gathering the layers kept by "restore_snapshot" (i.e., those on servers that host container registries)
+        self.cached_layers = np.zeros((len(edge_servers), len(self.layer_digests)), dtype=bool)
+        for index, edge_server in enumerate(edge_servers):
+            if len(edge_server.container_registries) > 0:
+                for layer in edge_server.container_layers:
+                    if layer.digest in layer_index_by_digest:
+                        self.cached_layers[index, layer_index_by_digest[layer.digest]] = True
+
+    def read_placement(self) -> np.ndarray:
+        """Gathers the placement scheme currently applied on the simulated components.
+
+        Returns:
+            hosts (np.ndarray): Index of the edge server that hosts each service (-1 for services that are not provisioned).
+        """
+        hosts = np.full(len(self.service_ids), -1, dtype=int)
+        for service in Service.all():
+            if service.server is not None:
+                hosts[self.service_index_by_id[service.id]] = self.edge_server_index_by_id[service.server.id]
+
+        return hosts
+
+    def write_placement(self, hosts: np.ndarray):
+        """Applies a placement scheme on the simulated components, provisioning services following their IDs.
+
+        Args:
+            hosts (np.ndarray): Index of the edge server that hosts each service.
+        """
+        edge_servers = EdgeServer.all()
+        services = {service.id: service for service in Service.all()}
+
+        for service_index, edge_server_index in enumerate(hosts):
+            service = services[self.service_ids[service_index]]
+            app = service.application
+            provision(user=app.users[0], application=app, service=service, edge_server=edge_servers[edge_server_index])
+
+
+def get_index_by_id(ids: np.ndarray) -> np.ndarray:
+    """Creates a lookup table that translates component IDs into their indices in the model arrays.
+
+    Args:
+        ids (np.ndarray): Component IDs sorted by index.
+
+    Returns:
+        index_by_id (np.ndarray): Index of each component ID (-1 for IDs that do not refer to any component).
+    """
+    index_by_id = np.full(ids.max(initial=0) + 1, -1, dtype=int)
+    index_by_id[ids] = np.arange(len(ids))
+    return index_by_id
+
+
+def get_placement_model() -> PlacementModel:
+    """Gets the placement model of the loaded scenario, which is built at the first call and stored within the network topology.
+
+    Returns:
+        model (PlacementModel): Placement model of the loaded scenario.
+    """
+    topology = Topology.first()
+    if not hasattr(topology, "placement_model"):
+        topology.placement_model = PlacementModel()
+
+    return topology.placement_model
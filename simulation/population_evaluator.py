@@ -0,0 +1,527 @@
+# Importing the placement model
+from simulation.placement_model import PlacementModel, get_placement_model
+
+# Importing Python libraries
+from collections import OrderedDict
+import numpy as np
+import hashlib
+import sys
+
+
+class PopulationEvaluator:
+    """Array-backed counterpart of "evaluate_placement" that scores whole populations of placement schemes at once.
+
+    All scenario attributes used by the evaluation are copied into NumPy arrays when the evaluator is created, so that populations
+    can be evaluated without applying (and resetting) placements on the simulated components. The computation mirrors the state
+    reached by "apply_placement" right after "restore_snapshot" and the arithmetic of "topology_collect" (including the order of
+    floating-point sums), so its output matches "evaluate_placement" exactly.
+    """
+
+    def __init__(self, model: PlacementModel = None):
+        """Gathers the scenario attributes used to evaluate placement schemes.
+
+        Args:
+            model (PlacementModel, optional): Placement model of the scenario. Defaults to None (the model of the loaded scenario).
+        """
+        model = get_placement_model() if model is None else model
+
+        # Genes store edge server IDs, so we use a lookup table to translate them into edge server indices
+        self.edge_server_index_by_id = model.edge_server_index_by_id
+
+        # Gathering edge server capacities, demands before any service is placed (e.g., the layers of container registries), and
+        # power model parameters
+        self.edge_server_cpu = model.edge_server_cpu
+        self.edge_server_memory = model.edge_server_memory
+        self.edge_server_disk = model.edge_server_disk
+        self.edge_server_base_cpu_demand = model.edge_server_cpu_demand
+        self.edge_server_base_memory_demand = model.edge_server_memory_demand
+        self.edge_server_base_disk_demand = model.edge_server_disk_demand
+        self.edge_server_consumes_power = model.edge_server_consumes_power
+        self.edge_server_static_power = model.edge_server_static_power
+        self.edge_server_power_constant = model.edge_server_power_constant
+        self.max_power_consumption_possible = model.max_power_consumption_possible
+
+        # Gathering service demands and container images (layers kept by "restore_snapshot" never need to be downloaded)
+        self.service_cpu_demand = model.service_cpu_demand
+        self.service_memory_demand = model.service_memory_demand
+        self.service_image = model.service_image
+        self.image_layers = model.image_layers
+        self.layer_size = model.layer_size
+        self.cached_layers = model.cached_layers
+
+        # Gathering the delay between network switches from the all-pairs shortest paths of the network topology
+        self.edge_server_switch = model.edge_server_switch
+        self.switch_delays = model.switch_delays
+
+        # Describing each (user, application) pair as a sequence of hops that connect the items of the application's service chain
+        self.pair_delay_sla = model.pair_delay_sla
+        self.pair_wireless_delay = model.user_wireless_delay[model.pair_user]
+        hop_pair, hop_service, hop_previous_service, hop_origin_switch = [], [], [], []
+        for pair, (user, app) in enumerate(zip(model.pair_user, model.pair_application)):
+            for position, service in enumerate(model.application_services[app]):
+                hop_pair.append(pair)
+                hop_service.append(service)
+                hop_previous_service.append(model.application_services[app][position - 1] if position > 0 else -1)
+                hop_origin_switch.append(model.user_switch[user])
+
+        self.hop_pair = np.array(hop_pair, dtype=int)
+        self.hop_service = np.array(hop_service, dtype=int)
+        self.hop_previous_service = np.array(hop_previous_service, dtype=int)
+        self.hop_origin_switch = np.array(hop_origin_switch, dtype=int)
+
+        # Checking which edge servers would violate the privacy requirement of the service reached by each hop
+        hop_trust = model.user_trust[model.pair_user[self.hop_pair]][:, model.edge_server_provider]
+        self.hop_privacy_violation = model.service_privacy_requirement[self.hop_service][:, None] > hop_trust
+
+        # Grouping hops by their position in the service chains so that delays are accumulated in the same order as in the simulator
+        hop_position = np.zeros(len(hop_pair), dtype=int)
+        for hop in range(1, len(hop_pair)):
+            if hop_pair[hop] == hop_pair[hop - 1]:
+                hop_position[hop] = hop_position[hop - 1] + 1
+        self.hops_by_position = [np.flatnonzero(hop_position == position) for position in range(hop_position.max(initial=-1) + 1)]
+
+        self.number_of_applications = len(model.application_ids)
+        self.number_of_services = len(model.service_ids)
+
+    def evaluate(self, x: np.ndarray) -> tuple:
+        """Evaluates a population of placement schemes based on the normalized number of SLA violations (delay and privacy) and
+        power consumption.
+
+        Args:
+            x (np.ndarray): Population matrix (one placement scheme per row and one edge server ID per service).
+
+        Returns:
+            output (tuple): Objectives (one row per placement scheme) and penalties (overloaded edge servers) of the population.
+        """
+        state = self.get_state(hosts=self.edge_server_index_by_id[np.asarray(x, dtype=int)])
+        output = self.get_output(state=state)
+
+        return output
+
+    def get_state(self, hosts: np.ndarray) -> dict:
+        """Calculates the per-server and per-application state reached by each placement scheme of a population.
+
+        Args:
+            hosts (np.ndarray): Population matrix with the index of the edge server that hosts each service.
+
+        Returns:
+            state (dict): Arrays describing the state of each placement scheme (one row per placement scheme).
+        """
+        population_size, number_of_edge_servers = hosts.shape[0], len(self.edge_server_cpu)
+        edge_servers = np.arange(number_of_edge_servers)
+
+        # Aggregating the demand of the services placed on each edge server
+        cells = (np.arange(population_size)[:, None] * number_of_edge_servers + hosts).ravel()
+        cpu_demand = self.edge_server_base_cpu_demand + np.bincount(
+            cells, weights=np.tile(self.service_cpu_demand, population_size), minlength=population_size * number_of_edge_servers
+        ).reshape(population_size, number_of_edge_servers)
+        memory_demand = self.edge_server_base_memory_demand + np.bincount(
+            cells, weights=np.tile(self.service_memory_demand, population_size), minlength=population_size * number_of_edge_servers
+        ).reshape(population_size, number_of_edge_servers)
+        image_counts = np.bincount(
+            cells * self.image_layers.shape[0] + np.tile(self.service_image, population_size),
+            minlength=population_size * number_of_edge_servers * self.image_layers.shape[0],
+        ).reshape(population_size, number_of_edge_servers, -1)
+
+        # Calculating the disk demand, power consumption, and overload status of edge servers
+        disk_demand = self.get_disk_demand(image_counts=image_counts, edge_servers=edge_servers)
+        power_consumption = self.get_power_consumption(cpu_demand=cpu_demand, edge_servers=edge_servers)
+        overloaded = self.is_overloaded(
+            cpu_demand=cpu_demand, memory_demand=memory_demand, disk_demand=disk_demand, edge_servers=edge_servers
+        )
+
+        # Gathering the delay of each hop that connects the service chains
+        hop_delays = self.get_hop_delays(
+            hosts=hosts[:, self.hop_service], previous_hosts=hosts[:, self.hop_previous_service], hops=np.arange(len(self.hop_pair))
+        )
+        hop_privacy_violations = self.hop_privacy_violation[np.arange(len(self.hop_pair)), hosts[:, self.hop_service]]
+
+        # Gathering the delay of each application by accumulating the delay of the hops that connect its service chain
+        delays = np.tile(self.pair_wireless_delay, (population_size, 1)).astype(np.result_type(self.pair_wireless_delay, hop_delays))
+        for hops in self.hops_by_position:
+            delays[:, self.hop_pair[hops]] += hop_delays[:, hops]
+
+        state = {
+            "hosts": hosts,
+            "cpu_demand": cpu_demand,
+            "memory_demand": memory_demand,
+            "image_counts": image_counts,
+            "disk_demand": disk_demand,
+            "power_consumption": power_consumption,
+            "overloaded": overloaded,
+            "hop_delays": hop_delays,
+            "hop_privacy_violations": hop_privacy_violations,
+            "delays": delays,
+            "overloaded_edge_servers": np.sum(overloaded, axis=1),
+            "delay_sla_violations": np.sum(delays > self.pair_delay_sla, axis=1),
+            "privacy_sla_violations": np.sum(hop_privacy_violations, axis=1),
+        }
+
+        return state
+
+    def get_output(self, state: dict) -> tuple:
+        """Calculates the objectives and penalties of a population based on the state reached by its placement schemes.
+
+        Args:
+            state (dict): Arrays describing the state of each placement scheme (one row per placement scheme).
+
+        Returns:
+            output (tuple): Objectives (one row per placement scheme) and penalties (overloaded edge servers) of the population.
+        """
+        # Gathering the overall edge server power consumption (summed server by server as in "topology_collect")
+        overall_power_consumption = np.zeros(len(state["power_consumption"]))
+        for index in range(state["power_consumption"].shape[1]):
+            overall_power_consumption += state["power_consumption"][:, index]
+
+        # Aggregating the results
+        objectives = np.column_stack(
+            (
+                state["delay_sla_violations"] / self.number_of_applications * 100,
+                state["privacy_sla_violations"] / self.number_of_services * 100,
+                overall_power_consumption / self.max_power_consumption_possible * 100,
+            )
+        )
+        penalties = state["overloaded_edge_servers"].reshape(-1, 1)
+
+        output = (objectives, penalties)
+
+        return output
+
+    def get_disk_demand(self, image_counts: np.ndarray, edge_servers: np.ndarray) -> np.ndarray:
+        """Calculates the disk demand of edge servers, including the container layers they would have to download.
+
+        Args:
+            image_counts (np.ndarray): Number of services hosted by each edge server per container image.
+            edge_servers (np.ndarray): Indices of the edge servers (aligned with the second-to-last axis of "image_counts").
+
+        Returns:
+            disk_demand (np.ndarray): Disk demand of the edge servers.
+        """
+        needed_layers = (image_counts > 0).astype(int) @ self.image_layers.astype(int) > 0
+        disk_demand = (
+            self.edge_server_base_disk_demand[edge_servers] + (needed_layers & ~self.cached_layers[edge_servers]) @ self.layer_size
+        )
+        return disk_demand
+
+    def get_power_consumption(self, cpu_demand: np.ndarray, edge_servers: np.ndarray) -> np.ndarray:
+        """Calculates the power consumption of edge servers according to the linear power model.
+
+        Args:
+            cpu_demand (np.ndarray): CPU demand of the edge servers.
+            edge_servers (np.ndarray): Indices of the edge servers (aligned with the last axis of "cpu_demand").
+
+        Returns:
+            power_consumption (np.ndarray): Power consumption of the edge servers.
+        """
+        utilization = cpu_demand / self.edge_server_cpu[edge_servers]
+        power_consumption = np.where(
+            self.edge_server_consumes_power[edge_servers],
+            self.edge_server_static_power[edge_servers] + self.edge_server_power_constant[edge_servers] * utilization * 100,
+            0,
+        )
+        return power_consumption
+
+    def is_overloaded(self, cpu_demand: np.ndarray, memory_demand: np.ndarray, disk_demand: np.ndarray, edge_servers: np.ndarray):
+        """Checks whether edge servers have more demand than capacity in any of their resources.
+
+        Args:
+            cpu_demand (np.ndarray): CPU demand of the edge servers.
+            memory_demand (np.ndarray): Memory demand of the edge servers.
+            disk_demand (np.ndarray): Disk demand of the edge servers.
+            edge_servers (np.ndarray): Indices of the edge servers (aligned with the last axis of the demand arrays).
+
+        Returns:
+            overloaded (np.ndarray): Whether each edge server is overloaded.
+        """
+        overloaded = (
+            (self.edge_server_cpu[edge_servers] - cpu_demand < 0)
+            | (self.edge_server_memory[edge_servers] - memory_demand < 0)
+            | (self.edge_server_disk[edge_servers] - disk_demand < 0)
+        )
+        return overloaded
+
+    def get_hop_delays(self, hosts: np.ndarray, previous_hosts: np.ndarray, hops: np.ndarray) -> np.ndarray:
+        """Calculates the delay of hops that connect the items of service chains.
+
+        Args:
+            hosts (np.ndarray): Index of the edge server that hosts the service reached by each hop.
+            previous_hosts (np.ndarray): Index of the edge server that hosts the previous service in the chain (ignored for hops
+                that start at the user).
+            hops (np.ndarray): Indices of the hops (aligned with the last axis of "hosts" and "previous_hosts").
+
+        Returns:
+            hop_delays (np.ndarray): Delay of the hops.
+        """
+        origin_switches = np.where(
+            self.hop_previous_service[hops] >= 0, self.edge_server_switch[previous_hosts], self.hop_origin_switch[hops]
+        )
+        hop_delays = self.switch_delays[origin_switches, self.edge_server_switch[hosts]]
+        return hop_delays
+
+
+class DeltaPopulationEvaluator(PopulationEvaluator):
+    """Population evaluator that derives the state of offspring from the cached state of their parents.
+
+    Offspring usually differ from one of their parents in a few genes. Hence, instead of evaluating them from scratch, the evaluator
+    starts from the parent's cached state and only recomputes the edge servers and applications touched by the changed genes.
+    Offspring whose parents are unknown (or that differ too much from them) are evaluated from scratch. The overall power
+    consumption is still summed server by server to keep the results identical to those of a full evaluation.
+    """
+
+    def __init__(self, model: PlacementModel = None, max_cached_states: int = 1000, max_changed_genes: float = 0.25):
+        """Gathers the scenario attributes used to evaluate placement schemes.
+
+        Args:
+            model (PlacementModel, optional): Placement model of the scenario. Defaults to None (the model of the loaded scenario).
+            max_cached_states (int, optional): Maximum number of placement schemes whose states are kept. Defaults to 1000.
+            max_changed_genes (float, optional): Maximum fraction of changed genes for which offspring are evaluated from the state
+                of their parents. Defaults to 0.25.
+        """
+        super().__init__(model=model)
+        self.max_cached_states = max_cached_states
+        self.max_changed_genes = max_changed_genes
+
+        # Cached states (least recently used first) and parents of the offspring waiting to be evaluated
+        self.states = OrderedDict()
+        self.parents = {}
+
+        # Mapping each service to the hops it takes part in (as the service reached by the hop or as the previous service in the chain)
+        service_hops = [[] for _ in range(self.number_of_services)]
+        for hop in range(len(self.hop_pair)):
+            service_hops[self.hop_service[hop]].append(hop)
+            if self.hop_previous_service[hop] >= 0:
+                service_hops[self.hop_previous_service[hop]].append(hop)
+        width = max([len(hops) for hops in service_hops], default=0)
+        self.service_hops = np.array([hops + [-1] * (width - len(hops)) for hops in service_hops], dtype=int).reshape(-1, width)
+
+        # Mapping each (user, application) pair to its hops, sorted by their position in the service chain
+        pair_hops = [[] for _ in range(len(self.pair_delay_sla))]
+        for hop in range(len(self.hop_pair)):
+            pair_hops[self.hop_pair[hop]].append(hop)
+        width = max([len(hops) for hops in pair_hops], default=0)
+        self.pair_hops = np.array([hops + [-1] * (width - len(hops)) for hops in pair_hops], dtype=int).reshape(-1, width)
+
+    def register_parents(self, offspring: np.ndarray, candidates: np.ndarray):
+        """Registers the parent of each offspring as the candidate from which the offspring differs the least.
+
+        Args:
+            offspring (np.ndarray): Offspring matrix (one placement scheme per row).
+            candidates (np.ndarray): Parents of the mating that generated each offspring (offspring x parents x genes).
+        """
+        offspring = np.asarray(offspring, dtype=int)
+        candidates = np.asarray(candidates, dtype=int)
+        nearest = np.argmin(np.sum(candidates != offspring[:, None, :], axis=2), axis=1)
+
+        for child, parent in zip(offspring, candidates[np.arange(len(offspring)), nearest]):
+            self.parents[child.tobytes()] = parent.tobytes()
+
+    def evaluate(self, x: np.ndarray) -> tuple:
+        """Evaluates a population of placement schemes based on the normalized number of SLA violations (delay and privacy) and
+        power consumption.
+
+        Args:
+            x (np.ndarray): Population matrix (one placement scheme per row and one edge server ID per service).
+
+        Returns:
+            output (tuple): Objectives (one row per placement scheme) and penalties (overloaded edge servers) of the population.
+        """
+        x = np.asarray(x, dtype=int)
+        hosts = self.edge_server_index_by_id[x]
+        keys = [row.tobytes() for row in x]
+
+        # Selecting the placement schemes whose parent state is known and that differ from their parents in a few genes
+        delta_rows = []
+        parent_states = []
+        for row, key in enumerate(keys):
+            parent_key = self.parents.get(key)
+            if parent_key in self.states:
+                self.states.move_to_end(parent_key)
+                parent_state = self.states[parent_key]
+                if np.count_nonzero(parent_state["hosts"] != hosts[row]) <= self.max_changed_genes * hosts.shape[1]:
+                    delta_rows.append(row)
+                    parent_states.append(parent_state)
+        full_rows = np.setdiff1d(np.arange(len(x)), delta_rows)
+        self.parents.clear()
+
+        # Calculating the states of placement schemes (from scratch or based on the state of their parents)
+        partial_states = []
+        if len(full_rows) > 0:
+            partial_states.append((full_rows, self.get_state(hosts=hosts[full_rows])))
+        if len(delta_rows) > 0:
+            parent_state = {name: np.stack([state[name] for state in parent_states]) for name in parent_states[0]}
+            partial_states.append((delta_rows, self.get_delta_state(hosts=hosts[delta_rows], parent_state=parent_state)))
+
+        state = {}
+        for rows, partial_state in partial_states:
+            for name, array in partial_state.items():
+                if name not in state:
+                    state[name] = np.empty((len(x),) + array.shape[1:], dtype=array.dtype)
+                state[name][rows] = array
+
+        # Caching the states of the evaluated placement schemes (evicting the least recently used ones)
+        for row, key in enumerate(keys):
+            self.states[key] = {name: array[row].copy() for name, array in state.items()}
+            self.states.move_to_end(key)
+        while len(self.states) > self.max_cached_states:
+            self.states.popitem(last=False)
+
+        output = self.get_output(state=state)
+
+        return output
+
+    def get_delta_state(self, hosts: np.ndarray, parent_state: dict) -> dict:
+        """Calculates the state reached by placement schemes based on the state reached by their parents.
+
+        Args:
+            hosts (np.ndarray): Index of the edge server that hosts each service (one row per placement scheme).
+            parent_state (dict): State of the parent of each placement scheme (updated in place).
+
+        Returns:
+            state (dict): Arrays describing the state of each placement scheme (one row per placement scheme).
+        """
+        state = parent_state
+        number_of_edge_servers = len(self.edge_server_cpu)
+        number_of_hops = len(self.hop_pair)
+        number_of_pairs = len(self.pair_delay_sla)
+
+        # Moving the demand of the changed services from their previous hosts to their new hosts
+        rows, services = np.nonzero(hosts != state["hosts"])
+        previous_hosts = state["hosts"][rows, services]
+        new_hosts = hosts[rows, services]
+        state["hosts"] = hosts
+
+        for name, demand in [("cpu_demand", self.service_cpu_demand), ("memory_demand", self.service_memory_demand)]:
+            np.subtract.at(state[name], (rows, previous_hosts), demand[services])
+            np.add.at(state[name], (rows, new_hosts), demand[services])
+        np.subtract.at(state["image_counts"], (rows, previous_hosts, self.service_image[services]), 1)
+        np.add.at(state["image_counts"], (rows, new_hosts, self.service_image[services]), 1)
+
+        # Updating the disk demand, power consumption, and overload status of the edge servers touched by the changes
+        cells = np.unique(np.concatenate([rows * number_of_edge_servers + previous_hosts, rows * number_of_edge_servers + new_hosts]))
+        touched_rows, touched_edge_servers = np.divmod(cells, number_of_edge_servers)
+        touched = (touched_rows, touched_edge_servers)
+
+        state["disk_demand"][touched] = self.get_disk_demand(
+            image_counts=state["image_counts"][touched], edge_servers=touched_edge_servers
+        )
+        state["power_consumption"][touched] = self.get_power_consumption(
+            cpu_demand=state["cpu_demand"][touched], edge_servers=touched_edge_servers
+        )
+        overloaded = self.is_overloaded(
+            cpu_demand=state["cpu_demand"][touched],
+            memory_demand=state["memory_demand"][touched],
+            disk_demand=state["disk_demand"][touched],
+            edge_servers=touched_edge_servers,
+        )
+        np.add.at(state["overloaded_edge_servers"], touched_rows, overloaded.astype(int) - state["overloaded"][touched].astype(int))
+        state["overloaded"][touched] = overloaded
+
+        # Updating the hops that reach (or start from) the changed services
+        hops = self.service_hops[services]
+        valid = hops >= 0
+        cells = np.unique(np.repeat(rows, hops.shape[1])[valid.ravel()] * number_of_hops + hops[valid])
+        hop_rows, hops = np.divmod(cells, number_of_hops)
+        touched = (hop_rows, hops)
+
+        state["hop_delays"][touched] = self.get_hop_delays(
+            hosts=hosts[hop_rows, self.hop_service[hops]], previous_hosts=hosts[hop_rows, self.hop_previous_service[hops]], hops=hops
+        )
+        privacy_violations = self.hop_privacy_violation[hops, hosts[hop_rows, self.hop_service[hops]]]
+        np.add.at(
+            state["privacy_sla_violations"],
+            hop_rows,
+            privacy_violations.astype(int) - state["hop_privacy_violations"][touched].astype(int),
+        )
+        state["hop_privacy_violations"][touched] = privacy_violations
+
+        # Accumulating again the delay of the applications whose hops changed
+        cells = np.unique(hop_rows * number_of_pairs + self.hop_pair[hops])
+        pair_rows, pairs = np.divmod(cells, number_of_pairs)
+
+        delays = self.pair_wireless_delay[pairs].astype(state["delays"].dtype)
+        for position in range(self.pair_hops.shape[1]):
+            position_hops = self.pair_hops[pairs, position]
+            valid = position_hops >= 0
+            delays[valid] += state["hop_delays"][pair_rows[valid], position_hops[valid]]
+
+        violations = (delays > self.pair_delay_sla[pairs]).astype(int)
+        previous_violations = (state["delays"][pair_rows, pairs] > self.pair_delay_sla[pairs]).astype(int)
+        np.add.at(state["delay_sla_violations"], pair_rows, violations - previous_violations)
+        state["delays"][pair_rows, pairs] = delays
+
+        return state
+
+
+class FitnessCache:
+    """Memory-bounded cache of the fitness scores and penalties of placement schemes.
+
+    Entries are keyed by a compact digest of the placement scheme's genes. When the cache exceeds its memory bound, the least
+    recently used entries are evicted first.
+    """
+
+    def __init__(self, max_size: float):
+        """Creates an empty cache.
+
+        Args:
+            max_size (float): Maximum memory (in megabytes) occupied by the cached entries.
+        """
+        self.max_size = max_size * 1024 * 1024
+        self.size = 0
+        self.entries = OrderedDict()
+
+        # Counters reported at the end of the execution
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_key(solution: np.ndarray) -> bytes:
+        """Computes the cache key of a placement scheme.
+
+        Args:
+            solution (np.ndarray): Placement scheme.
+
+        Returns:
+            key (bytes): 128-bit digest of the placement scheme's genes.
+        """
+        return hashlib.blake2b(np.ascontiguousarray(solution, dtype=np.int64).tobytes(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> tuple:
+        """Retrieves a cached entry, marking it as the most recently used one.
+
+        Args:
+            key (bytes): Cache key of the placement scheme.
+
+        Returns:
+            entry (tuple): Fitness scores and penalties of the placement scheme (or None if it is not cached).
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[:2]
+
+    def put(self, key: bytes, objectives: np.ndarray, penalties: np.ndarray):
+        """Stores the fitness scores and penalties of a placement scheme, evicting least recently used entries if needed.
+
+        Args:
+            key (bytes): Cache key of the placement scheme.
+            objectives (np.ndarray): Fitness scores of the placement scheme.
+            penalties (np.ndarray): Penalties of the placement scheme.
+        """
+        if key in self.entries:
+            return
+
+        objectives = objectives.copy()
+        penalties = penalties.copy()
+        entry_size = sys.getsizeof(key) + sys.getsizeof(objectives) + sys.getsizeof(penalties) + sys.getsizeof((None, None, None))
+        self.entries[key] = (objectives, penalties, entry_size)
+        self.size += entry_size
+
+        while self.size > self.max_size and len(self.entries) > 0:
+            _, (_, _, evicted_size) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
@@ -0,0 +1,233 @@
+# Importing the placement model
+from simulation.placement_model import PlacementModel, get_placement_model
+
+# Importing Python libraries
+import numpy as np
+
+# Maximum number of (placement scheme, edge server, layer) entries handled at once while sampling (bounds the memory usage)
+MAX_BATCH_ENTRIES = 2**24
+
+# Number of consecutive batches without new placement schemes after which sampling gives up (small batches near the end of the
+# sampling may be all duplicates by chance even when the scenario admits further placement schemes)
+MAX_EMPTY_BATCHES = 10
+
+
+class PopulationSampler:
+    """Generates feasible placement schemes over the arrays of the placement model, without provisioning services.
+
+    Placement schemes are sampled in batches: at each step, every scheme of the batch hosts the next service of its own random
+    service order on a random edge server or on the edge server closest to the service's user (with equal probability) among those
+    with enough free CPU, memory, and disk (including the layers they lack) to host it. Schemes generated more than once are
+    discarded through a set of their hashes.
+    """
+
+    def __init__(self, model: PlacementModel = None):
+        """Gathers the scenario attributes used to sample placement schemes.
+
+        Args:
+            model (PlacementModel, optional): Placement model of the scenario. Defaults to None (the model of the loaded scenario).
+        """
+        model = get_placement_model() if model is None else model
+
+        # Gathering the free resources of edge servers and the layers they store in the initial state of the scenario
+        self.edge_server_ids = model.edge_server_ids
+        self.edge_server_free_cpu = (model.edge_server_cpu - model.edge_server_cpu_demand).astype(float)
+        self.edge_server_free_memory = (model.edge_server_memory - model.edge_server_memory_demand).astype(float)
+        self.edge_server_free_disk = (model.edge_server_disk - model.edge_server_disk_demand).astype(float)
+        self.cached_layers = model.cached_layers
+        self.layer_size = model.layer_size
+
+        # Gathering the demands and layers of services
+        self.service_cpu_demand = model.service_cpu_demand
+        self.service_memory_demand = model.service_memory_demand
+        self.service_layers = model.image_layers[model.service_image]
+
+        # Ranking edge servers by their delay to the switch of each user that accesses services (applications are accessed by their
+        # first user). Ties keep the order of "EdgeServer.all()"
+        service_switch = model.user_switch[model.application_user[model.service_application]]
+        switches, self.service_switch = np.unique(service_switch, return_inverse=True)
+        delays = model.switch_delays[switches][:, model.edge_server_switch]
+        self.edge_server_rank = np.argsort(np.argsort(delays, axis=1, kind="stable"), axis=1, kind="stable").astype(float)
+
+    def get_state(self, size: int, hosts: np.ndarray = None) -> dict:
+        """Gathers the free resources and layers of edge servers for a batch of placement schemes.
+
+        Args:
+            size (int): Number of placement schemes.
+            hosts (np.ndarray, optional): Index of the edge server that hosts each service. Defaults to None (no service is hosted).
+
+        Returns:
+            state (dict): Free CPU, memory, and disk, and layers of each edge server (one row per placement scheme).
+        """
+        free_cpu = self.edge_server_free_cpu.copy()
+        free_memory = self.edge_server_free_memory.copy()
+        free_disk = self.edge_server_free_disk.copy()
+        layers = self.cached_layers.copy()
+
+        # Provisioning the services of the placement scheme, which download the layers their hosts lack
+        if hosts is not None:
+            np.subtract.at(free_cpu, hosts, self.service_cpu_demand)
+            np.subtract.at(free_memory, hosts, self.service_memory_demand)
+            np.logical_or.at(layers, hosts, self.service_layers)
+            free_disk -= (layers & ~self.cached_layers) @ self.layer_size
+
+        state = {
+            "free_cpu": np.tile(free_cpu, (size, 1)),
+            "free_memory": np.tile(free_memory, (size, 1)),
+            "free_disk": np.tile(free_disk, (size, 1)),
+            "layers": np.tile(layers, (size, 1, 1)),
+        }
+        return state
+
+    def provision(self, rng: np.random.Generator, state: dict, hosts: np.ndarray, service_orders: np.ndarray):
+        """Provisions services in a batch of placement schemes, following the order given for each placement scheme. Each service is
+        hosted by a random edge server or by the edge server closest to its user (with equal probability) among those with enough free
+        resources to host it.
+
+        Args:
+            rng (np.random.Generator): Random number generator.
+            state (dict): Free resources and layers of edge servers (updated as services are provisioned).
+            hosts (np.ndarray): Index of the edge server that hosts each service (updated as services are provisioned).
+            service_orders (np.ndarray): Services provisioned in each placement scheme, in the order they are provisioned.
+        """
+        size, steps = service_orders.shape
+        rows = np.arange(size)
+
+        # Drawing the services that are hosted by random edge servers
+        random_choices = rng.random((size, steps)) > 0.5
+
+        for step in range(steps):
+            services = service_orders[:, step]
+
+            # Calculating the disk demand that would be incurred to each edge server by the layers it lacks to host the service
+            service_layers = self.service_layers[services]
+            additional_disk_demand = (~state["layers"] & service_layers[:, None, :]) @ self.layer_size
+
+            fits = (
+                (state["free_cpu"] >= self.service_cpu_demand[services][:, None])
+                & (state["free_memory"] >= self.service_memory_demand[services][:, None])
+                & (state["free_disk"] >= additional_disk_demand)
+            )
+            if not fits.any(axis=1).all():
+                raise Exception("No edge server has enough free resources to host a service while sampling placement schemes.")
+
+            # Picking a random edge server (or the closest one) among those with enough free resources
+            scores = np.where(
+                random_choices[:, step][:, None],
+                rng.random((size, len(self.edge_server_ids))),
+                self.edge_server_rank[self.service_switch[services]],
+            )
+            scores[~fits] = np.inf
+            edge_servers = np.argmin(scores, axis=1)
+
+            # Provisioning the service on the chosen edge server
+            hosts[rows, services] = edge_servers
+            state["free_cpu"][rows, edge_servers] -= self.service_cpu_demand[services]
+            state["free_memory"][rows, edge_servers] -= self.service_memory_demand[services]
+            state["free_disk"][rows, edge_servers] -= additional_disk_demand[rows, edge_servers]
+            state["layers"][rows, edge_servers] |= service_layers
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Generates a batch of placement schemes (not necessarily distinct).
+
+        Args:
+            rng (np.random.Generator): Random number generator.
+            size (int): Number of placement schemes.
+
+        Returns:
+            hosts (np.ndarray): Index of the edge server that hosts each service (one placement scheme per row).
+        """
+        number_of_services = len(self.service_cpu_demand)
+
+        # Drawing the order in which each placement scheme provisions services
+        service_orders = rng.permuted(np.tile(np.arange(number_of_services), (size, 1)), axis=1)
+
+        hosts = np.empty((size, number_of_services), dtype=int)
+        self.provision(rng=rng, state=self.get_state(size=size), hosts=hosts, service_orders=service_orders)
+
+        return hosts
+
+    def perturb(self, rng: np.random.Generator, hosts: np.ndarray, size: int, rate: float) -> np.ndarray:
+        """Generates a batch of perturbations of a placement scheme (not necessarily distinct), moving a random subset of its services
+        to other edge servers with enough free resources to host them.
+
+        The layers of moved services are kept on their former hosts, so the disk demand of perturbations is overestimated.
+
+        Args:
+            rng (np.random.Generator): Random number generator.
+            hosts (np.ndarray): Index of the edge server that hosts each service in the perturbed placement scheme.
+            size (int): Number of perturbations.
+            rate (float): Share of the services moved by each perturbation (at least one service is moved).
+
+        Returns:
+            perturbations (np.ndarray): Index of the edge server that hosts each service (one placement scheme per row).
+        """
+        number_of_services = len(self.service_cpu_demand)
+        moved_services = max(1, round(rate * number_of_services))
+
+        # Drawing the services moved by each perturbation and releasing the CPU and memory they use
+        service_orders = np.argsort(rng.random((size, number_of_services)), axis=1)[:, :moved_services]
+        state = self.get_state(size=size, hosts=hosts)
+        rows = np.repeat(np.arange(size)[:, None], moved_services, axis=1)
+        np.add.at(state["free_cpu"], (rows, hosts[service_orders]), self.service_cpu_demand[service_orders])
+        np.add.at(state["free_memory"], (rows, hosts[service_orders]), self.service_memory_demand[service_orders])
+
+        perturbations = np.tile(hosts, (size, 1))
+        self.provision(rng=rng, state=state, hosts=perturbations, service_orders=service_orders)
+
+        return perturbations
+
+    def get_population(
+        self, rng: np.random.Generator, size: int, seeds: list = [], seeded_size: int = 0, perturbation_rate: float = 0.1
+    ) -> list:
+        """Generates distinct placement schemes. The population may be seeded with given placement schemes (e.g., those found by
+        heuristics) and their perturbations, whereas the remaining placement schemes are sampled from scratch.
+
+        Args:
+            rng (np.random.Generator): Random number generator.
+            size (int): Number of placement schemes.
+            seeds (list, optional): Index of the edge server that hosts each service in each seed placement scheme. Defaults to [].
+            seeded_size (int, optional): Number of placement schemes given by seeds and their perturbations. Defaults to 0.
+            perturbation_rate (float, optional): Share of the services moved by each perturbation. Defaults to 0.1.
+
+        Returns:
+            population (list): Placement schemes (each one given by the ID of the edge server that hosts each service). Sampling stops
+                after "MAX_EMPTY_BATCHES" consecutive batches yield no new placement scheme, so the population is smaller than
+                requested when the scenario admits fewer distinct feasible placement schemes.
+        """
+        entries_per_scheme = self.cached_layers.size
+        max_batch_size = max(1, MAX_BATCH_ENTRIES // max(1, entries_per_scheme))
+
+        population = []
+        hashes = set()
+
+        def add(placements: np.ndarray, limit: int) -> int:
+            added = 0
+            for placement in self.edge_server_ids[placements]:
+                key = placement.tobytes()
+                if len(population) < limit and key not in hashes:
+                    hashes.add(key)
+                    population.append(placement.tolist())
+                    added += 1
+            return added
+
+        # Seeding the population with the seed placement schemes and their perturbations (perturbations stop being generated once
+        # they repeatedly no longer lead to new placement schemes)
+        seeded_size = min(size, seeded_size)
+        add(placements=np.array(seeds, dtype=int).reshape(-1, len(self.service_cpu_demand)), limit=seeded_size)
+        empty_batches = 0
+        while len(seeds) > 0 and len(population) < seeded_size and empty_batches < MAX_EMPTY_BATCHES:
+            added = 0
+            for hosts in seeds:
+                batch_size = min(-(-(seeded_size - len(population)) // len(seeds)), max_batch_size)
+                perturbations = self.perturb(rng=rng, hosts=np.asarray(hosts), size=batch_size, rate=perturbation_rate)
+                added += add(placements=perturbations, limit=seeded_size)
+            empty_batches = empty_batches + 1 if added == 0 else 0
+
+        empty_batches = 0
+        while len(population) < size and empty_batches < MAX_EMPTY_BATCHES:
+            batch_size = min(size - len(population), max_batch_size)
+            added = add(placements=self.sample(rng=rng, size=batch_size), limit=size)
+            empty_batches = empty_batches + 1 if added == 0 else 0
+
+        return population
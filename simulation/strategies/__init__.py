@@ -1,8 +1,33 @@
 """Automatic Python configuration file."""
 __version__ = "0.1.0"
 
-# Placement strategies
-from .nsgaii import nsgaii
-from .argos import argos
-from .faticanti2020 import faticanti2020
-from .thea import thea
+# Importing Python libraries
+import importlib
+
+# Placement strategies, indexed by name. Each strategy is implemented by a function with the same name as the strategy within the
+# module listed below, which is only imported when the strategy is selected (e.g., Pymoo is only imported when running NSGA-II)
+STRATEGIES = {
+    "nsgaii": ".nsgaii",
+    "argos": ".argos",
+    "faticanti2020": ".faticanti2020",
+    "thea": ".thea",
+}
+
+
+def get_strategy(name: str) -> object:
+    """Gets the function that implements a placement strategy, importing the strategy's module if needed.
+
+    Args:
+        name (str): Name of the placement strategy.
+
+    Raises:
+        Exception: Unknown placement strategy.
+
+    Returns:
+        strategy (object): Function that implements the placement strategy.
+    """
+    if name not in STRATEGIES:
+        raise Exception(f"Unknown placement strategy '{name}'. Valid strategies: {', '.join(STRATEGIES)}.")
+
+    module = importlib.import_module(STRATEGIES[name], package=__name__)
+    return getattr(module, name)
@@ -1,9 +1,10 @@
 # Importing EdgeSimPy components
-from edge_sim_py.components.edge_server import EdgeServer
 from edge_sim_py.components.application import Application
 
 # Importing helper methods
 from simulation.helper_methods import *
+from simulation.instrumentation import INSTRUMENTATION
+from simulation.user_server_index import get_user_server_index
 
 
 def argos(parameters: dict = {}):
@@ -17,41 +18,20 @@ def argos(parameters: dict = {}):
         parameters (dict, optional): Algorithm parameters. Defaults to {}.
     """
     apps = sorted(Application.all(), key=lambda app: app.users[0].delay_slas[str(app.id)])
+    user_server_index = get_user_server_index()
 
     for app in apps:
         user = app.users[0]
         services = sorted(app.services, key=lambda s: (-s.privacy_requirement, -s.cpu_demand))
 
-        edge_servers = sorted(get_host_candidates(user=user), key=lambda s: (-s["trust_degree"], s["delay"]))
+        with INSTRUMENTATION.timer("argos.host_candidates"):
+            # Edge servers ranked by trustworthiness and distance from the user (in terms of delay)
+            edge_servers = user_server_index.get_edge_servers(user=user)
 
         for service in services:
             # Greedily iterating over the list of edge servers to find a host for the service
-            for edge_server_metadata in edge_servers:
-                edge_server = edge_server_metadata["object"]
-
-                if edge_server.has_capacity_to_host(service):
-                    provision(user=user, application=app, service=service, edge_server=edge_server)
-                    break
-
-
-def get_host_candidates(user: object) -> list:
-    """Get list of host candidates for hosting services of a given user.
-
-    Args:
-        user (object): User object.
-
-    Returns:
-        list: List of host candidates.
-    """
-    user_switch = user.base_station.network_switch
-    host_candidates = []
-    for edge_server in EdgeServer.all():
-        host_candidates.append(
-            {
-                "object": edge_server,
-                "delay": calculate_path_delay(origin_network_switch=user_switch, target_network_switch=edge_server.network_switch),
-                "trust_degree": user.providers_trust[str(edge_server.infrastructure_provider)],
-            }
-        )
-
-    return host_candidates
+            with INSTRUMENTATION.timer("argos.host_selection"):
+                for edge_server in edge_servers:
+                    if edge_server.has_capacity_to_host(service):
+                        provision(user=user, application=app, service=service, edge_server=edge_server)
+                        break
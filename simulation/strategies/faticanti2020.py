@@ -1,9 +1,11 @@
 # Importing EdgeSimPy components
-from edge_sim_py.components.edge_server import EdgeServer
+from edge_sim_py.components.application import Application
 from edge_sim_py.components.service import Service
 
 # Importing helper methods
 from simulation.helper_methods import *
+from simulation.instrumentation import INSTRUMENTATION
+from simulation.user_server_index import get_user_server_index
 
 
 def faticanti2020(parameters: dict = {}):
@@ -17,24 +19,21 @@ def faticanti2020(parameters: dict = {}):
         parameters (dict, optional): Algorithm parameters. Defaults to {}.
     """
     # Sorting services based on their positions in their application's service chain
-    services = sorted(Service.all(), key=lambda service: service.application.services.index(service))
+    with INSTRUMENTATION.timer("faticanti2020.service_sorting"):
+        positions = {service: position for app in Application.all() for position, service in enumerate(app.services)}
+        services = sorted(Service.all(), key=lambda service: positions[service])
+
+    user_server_index = get_user_server_index()
 
     for service in services:
         app = service.application
         user = app.users[0]
 
-        # Sorting edge servers by: trustworthiness, distance from user (in terms of delay), and free resources
-        edge_servers = sorted(
-            EdgeServer.all(),
-            key=lambda s: (
-                -(user.providers_trust[str(s.infrastructure_provider)]),
-                calculate_path_delay(origin_network_switch=user.base_station.network_switch, target_network_switch=s.network_switch),
-                s.cpu - s.cpu_demand,
-            ),
-        )
-
-        # Greedily iterating over the list of EdgeNode candidates to find the best node to host the service
-        for edge_server in edge_servers:
-            if edge_server.has_capacity_to_host(service):
-                provision(user=user, application=app, service=service, edge_server=edge_server)
-                break
+        # Greedily iterating over the list of EdgeNode candidates (sorted by: trustworthiness, distance from user in terms of delay,
+        # and free resources) to find the best node to host the service. Edge servers are ranked by trustworthiness and delay
+        # beforehand, so only ties are sorted by free resources as they are visited, and the timer covers both sorting and selection
+        with INSTRUMENTATION.timer("faticanti2020.host_ranking_and_selection"):
+            for edge_server in user_server_index.iterate_by_free_cpu(user=user):
+                if edge_server.has_capacity_to_host(service):
+                    provision(user=user, application=app, service=service, edge_server=edge_server)
+                    break
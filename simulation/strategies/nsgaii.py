@@ -1,59 +1,42 @@
 # Importing EdgeSimPy components
-from edge_sim_py.components.edge_server import EdgeServer
-from edge_sim_py.components.service import Service
+from edge_sim_py.components.topology import Topology
 
 # Importing helper methods
 from simulation.helper_methods import *
+from simulation.placement_model import get_placement_model
+from simulation.instrumentation import INSTRUMENTATION
+from simulation.population_evaluator import PopulationEvaluator, DeltaPopulationEvaluator, FitnessCache
+from simulation.population_sampler import PopulationSampler
+from simulation.strategies import get_strategy
 
 # Importing Pymoo components
 from pymoo.util.display import Display
 from pymoo.core.problem import Problem
 from pymoo.optimize import minimize
 from pymoo.factory import get_crossover, get_mutation
-from pymoo.algorithms.moo.nsga2 import NSGA2
+from pymoo.algorithms.moo.nsga2 import NSGA2, binary_tournament
+from pymoo.operators.selection.tournament import TournamentSelection
+from pymoo.core.duplicate import DefaultDuplicateElimination
+from pymoo.core.mating import Mating
+from pymoo.core.termination import Termination
+from pymoo.core.population import Population
+from pymoo.util.optimum import filter_optimum
+from pymoo.indicators.hv import Hypervolume
 
 # Importing Python libraries
 import numpy as np
-from random import sample, random
+from multiprocessing import Pool, Process, Pipe
+from time import time
+import math
 
 # Variable that defines the NSGA-II algorithm's verbosity
 VERBOSE = True
 
+# Reference point of the hypervolume, defined over objectives normalized by the ideal and nadir points of the initial population
+HYPERVOLUME_REFERENCE_POINT = 1.1
 
-def random_fit() -> list:
-    """Custom algorithm that generates random placement solutions.
-
-    Returns:
-        placement (list): Generated placement solution.
-    """
-    services = sample(Service.all(), Service.count())
-    for service in services:
-        app = service.application
-        user = app.users[0]
-        user_switch = user.base_station.network_switch
-
-        if random() > 0.5:
-            edge_servers = sample(EdgeServer.all(), EdgeServer.count())
-        else:
-            edge_servers = sorted(
-                EdgeServer.all(),
-                key=lambda server: calculate_path_delay(
-                    origin_network_switch=user_switch,
-                    target_network_switch=server.network_switch,
-                ),
-            )
-
-        for edge_server in edge_servers:
-            # Checking if the host would have resources to host the service and its (additional) layers
-            if edge_server.has_capacity_to_host(service=service):
-                provision(user=user, application=app, service=service, edge_server=edge_server)
-                break
-
-    placement = [service.server.id for service in Service.all()]
-
-    reset_placement()
-
-    return placement
+# Evaluator used by worker processes during parallel fitness evaluation (set when each worker starts)
+worker_evaluator = None
 
 
 class TheaDisplay(Display):
@@ -81,12 +64,194 @@ class TheaDisplay(Display):
         self.output.append("Overloaded SVs", overloaded_servers)
 
 
+class ConvergenceTermination(Termination):
+    """Termination criterion that stops the genetic algorithm after a maximum number of generations, after a number of generations
+    without improving its Pareto front, or after a wall-clock budget (whichever comes first).
+
+    The Pareto front improves when the penalty of its least overloaded solution decreases or when its hypervolume grows by more
+    than a tolerance. Hypervolumes are measured over objectives normalized by the ideal and nadir points of the initial population,
+    so that the hypervolumes of different generations are comparable.
+    """
+
+    def __init__(self, n_max_gen: int, patience: int = 0, hv_tolerance: float = 0, max_time: float = 0):
+        """Creates the termination criterion.
+
+        Args:
+            n_max_gen (int): Maximum number of generations.
+            patience (int, optional): Generations without improvement after which the search stops. Defaults to 0 (disabled).
+            hv_tolerance (float, optional): Minimum hypervolume growth regarded as an improvement. Defaults to 0.
+            max_time (float, optional): Wall-clock budget of the search (in seconds). Defaults to 0 (disabled).
+        """
+        super().__init__()
+        self.n_max_gen = n_max_gen
+        self.patience = patience
+        self.hv_tolerance = hv_tolerance
+        self.max_time = max_time
+
+        # Declaring the bounds used to normalize objectives and the best Pareto front found so far
+        self.ideal = None
+        self.nadir = None
+        self.best_penalty = math.inf
+        self.best_hypervolume = -math.inf
+        self.last_improvement = 0
+
+        # Declaring the generation at which the search stopped and the reason why it stopped
+        self.generation = 0
+        self.reason = None
+
+    def _do_continue(self, algorithm: object) -> bool:
+        """Decides whether the genetic algorithm should run another generation.
+
+        Args:
+            algorithm (object): Algorithm being executed.
+
+        Returns:
+            do_continue (bool): Whether the search continues.
+        """
+        self.generation = algorithm.n_gen
+
+        if algorithm.n_gen >= self.n_max_gen:
+            self.reason = "n_gen"
+        elif self.max_time > 0 and time() - algorithm.start_time >= self.max_time:
+            self.reason = "max_time"
+        elif self.patience > 0 and self.get_stagnant_generations(algorithm=algorithm) >= self.patience:
+            self.reason = "stagnation"
+
+        return self.reason is None
+
+    def record_forced_stop(self, algorithm: object):
+        """Records the stop of a search ended by the algorithm itself, which happens when mating cannot generate any new offspring
+        (e.g., without crossover and mutation) and does not consult the termination criterion.
+
+        Args:
+            algorithm (object): Algorithm that was executed.
+        """
+        if self.force_termination and self.reason is None:
+            self.generation = algorithm.n_gen
+            self.reason = "no_offspring"
+
+    def get_stagnant_generations(self, algorithm: object) -> int:
+        """Updates the best Pareto front found so far, counting the generations elapsed since it last improved.
+
+        Args:
+            algorithm (object): Algorithm being executed.
+
+        Returns:
+            stagnant_generations (int): Number of generations without improvement.
+        """
+        if self.ideal is None:
+            objectives = algorithm.pop.get("F")
+            self.ideal = objectives.min(axis=0)
+            self.nadir = objectives.max(axis=0)
+
+        # Normalizing the objectives of the Pareto front (objectives with a single value in the initial population are not scaled)
+        ranges = np.where(self.nadir > self.ideal, self.nadir - self.ideal, 1)
+        objectives = (algorithm.opt.get("F") - self.ideal) / ranges
+
+        penalty = algorithm.opt.get("CV").min()
+        hypervolume = Hypervolume(ref_point=np.full(objectives.shape[1], HYPERVOLUME_REFERENCE_POINT)).do(objectives)
+
+        if penalty < self.best_penalty or (penalty == self.best_penalty and hypervolume > self.best_hypervolume + self.hv_tolerance):
+            self.best_penalty = penalty
+            self.best_hypervolume = hypervolume
+            self.last_improvement = algorithm.n_gen
+
+        return algorithm.n_gen - self.last_improvement
+
+
+def initialize_worker(evaluator: object):
+    """Prepares a worker process to evaluate solutions in parallel.
+
+    Args:
+        evaluator (object): Array-backed evaluator holding the worker's own copy of the scenario.
+    """
+    global worker_evaluator
+    worker_evaluator = evaluator
+
+
+def evaluate_chunk(x: np.ndarray) -> tuple:
+    """Evaluates a chunk of the population inside a worker process (evaluations are deterministic, so results do not depend on the
+    worker that picks up the chunk).
+
+    Args:
+        x (np.ndarray): Solutions that compose the chunk.
+
+    Returns:
+        output (tuple): Fitness scores and penalties of the chunk's solutions.
+    """
+    output = worker_evaluator.evaluate(x=x)
+    return output
+
+
+class ParentTrackingMating(Mating):
+    """Mating procedure that informs the problem's evaluator about the parents of each offspring, enabling delta evaluation."""
+
+    def _do(self, problem: object, pop: object, n_offsprings: int, parents: np.ndarray = None, **kwargs) -> object:
+        """Generates offspring through selection, crossover, and mutation, registering their parents.
+
+        Args:
+            problem (object): Instance of the problem being solved.
+            pop (object): Population from which parents are selected.
+            n_offsprings (int): Number of offspring to be generated.
+            parents (np.ndarray, optional): Indices of the parents of each mating. Defaults to None (parents are selected).
+
+        Returns:
+            off (object): Generated offspring.
+        """
+        if parents is None:
+            n_select = math.ceil(n_offsprings / self.crossover.n_offsprings)
+            parents = self.selection.do(pop, n_select, self.crossover.n_parents, **kwargs)
+
+        off = super()._do(problem, pop, n_offsprings, parents=parents, **kwargs)
+
+        # Crossover lays offspring out as (offspring index, mating index), so the i-th offspring comes from the mating i % matings
+        offspring = off.get("X")
+        candidates = pop.get("X")[parents][np.arange(len(offspring)) % len(parents)]
+        problem.evaluator.register_parents(offspring=offspring, candidates=candidates)
+
+        return off
+
+
 class PlacementProblem(Problem):
     """Describes the application placement as an optimization problem."""
 
-    def __init__(self, **kwargs):
-        """Initializes the problem instance."""
-        super().__init__(n_var=Service.count(), n_obj=3, n_constr=1, xl=1, xu=EdgeServer.count(), type_var=int, **kwargs)
+    def __init__(
+        self,
+        workers: int = 1,
+        delta_evaluation: bool = False,
+        max_cached_states: int = 1000,
+        fitness_cache_size: float = 0,
+        evaluator: object = None,
+        **kwargs,
+    ):
+        """Initializes the problem instance.
+
+        Args:
+            workers (int, optional): Number of worker processes used to evaluate solutions. Defaults to 1.
+            delta_evaluation (bool, optional): Whether offspring are evaluated based on the state of their parents. Defaults to False.
+            max_cached_states (int, optional): Maximum number of states kept for delta evaluation. Defaults to 1000.
+            fitness_cache_size (float, optional): Memory (in megabytes) used to cache fitness scores. Defaults to 0 (disabled).
+            evaluator (object, optional): Evaluator used by the problem. Defaults to None (an evaluator is created).
+        """
+        # Creating an array-backed evaluator that scores solutions without modifying the simulated components (islands running in
+        # their own processes receive a copy of the evaluator, as simulated components are not available there)
+        if evaluator is None:
+            if delta_evaluation:
+                evaluator = DeltaPopulationEvaluator(max_cached_states=max_cached_states)
+            else:
+                evaluator = PopulationEvaluator()
+
+        super().__init__(
+            n_var=evaluator.number_of_services, n_obj=3, n_constr=1, xl=1, xu=len(evaluator.edge_server_cpu), type_var=int, **kwargs
+        )
+        self.evaluator = evaluator
+
+        # Creating a pool of worker processes that receive their own copy of the evaluator once, when they start
+        self.workers = workers
+        self.pool = Pool(processes=workers, initializer=initialize_worker, initargs=(self.evaluator,)) if workers > 1 else None
+
+        # Creating a cache that prevents solutions generated more than once during the search from being evaluated again
+        self.fitness_cache = FitnessCache(max_size=fitness_cache_size) if fitness_cache_size > 0 else None
 
     def _evaluate(self, x, out, *args, **kwargs):
         """Evaluates solutions according to the problem objectives.
@@ -95,47 +260,134 @@ class PlacementProblem(Problem):
             x (list): Solution or set of solutions that solve the problem.
             out (dict): Output of the evaluation function.
         """
-        output = [self.get_fitness_score_and_constraints(solution=solution) for solution in x]
+        if self.fitness_cache is None:
+            out["F"], out["G"] = self.evaluate_population(x=x)
+            return
+
+        # Looking for solutions that were already evaluated, so that only the remaining ones are passed to the evaluator
+        keys = [self.fitness_cache.get_key(solution=solution) for solution in x]
+        entries = [self.fitness_cache.get(key=key) for key in keys]
+        missing = [index for index, entry in enumerate(entries) if entry is None]
 
-        out["F"] = np.array([item[0] for item in output])
-        out["G"] = np.array([item[1] for item in output])
+        if len(missing) > 0:
+            objectives, penalties = self.evaluate_population(x=x[missing])
+            for position, index in enumerate(missing):
+                entries[index] = (objectives[position], penalties[position])
+                self.fitness_cache.put(key=keys[index], objectives=objectives[position], penalties=penalties[position])
 
-    def get_fitness_score_and_constraints(self, solution: list) -> tuple:
-        """Calculates the fitness score and penalties of a solution based on the problem definition.
+        out["F"] = np.array([entry[0] for entry in entries])
+        out["G"] = np.array([entry[1] for entry in entries])
+
+    def evaluate_population(self, x: np.ndarray) -> tuple:
+        """Evaluates a set of solutions, either in this process or in the pool of worker processes.
 
         Args:
-            solution (list): Placement scheme.
+            x (np.ndarray): Set of solutions that solve the problem.
 
         Returns:
-            output (tuple): Output of the evaluation function containing the fitness scores of the solution and its penalties.
+            output (tuple): Fitness scores and penalties of each solution.
         """
-        # Applying the placement scheme suggested by the chromosome
-        apply_placement(solution=solution)
+        INSTRUMENTATION.count("nsgaii.evaluations", len(x))
 
-        # Calculating objectives and penalties
-        output = evaluate_placement()
+        with INSTRUMENTATION.timer("nsgaii.evaluation"):
+            if self.pool is None:
+                return self.evaluator.evaluate(x=x)
 
-        # Resetting the placement scheme suggested by the chromosome
-        reset_placement()
+            # Splitting the population into one chunk per worker (results are gathered in the same order as the chunks)
+            chunks = [chunk for chunk in np.array_split(x, self.workers) if len(chunk) > 0]
+            output = self.pool.map(evaluate_chunk, chunks)
 
-        return output
+        return np.concatenate([item[0] for item in output]), np.concatenate([item[1] for item in output])
 
+    def close(self):
+        """Terminates the worker processes used to evaluate solutions in parallel."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+
+def get_heuristic_placements(strategies: list) -> list:
+    """Runs placement heuristics on the initial state of the scenario, gathering the placement schemes they find. Heuristics that fail
+    or do not host every service are skipped.
+
+    Args:
+        strategies (list): Names of the placement heuristics.
+
+    Returns:
+        placements (list): Index of the edge server that hosts each service in the placement scheme found by each heuristic.
+    """
+    model = get_placement_model()
+
+    placements = []
+    for strategy in strategies:
+        # Heuristics may give up (raising an exception) when they cannot host a service, leaving a partial placement scheme behind
+        try:
+            get_strategy(name=strategy)(parameters={})
+        except Exception as exception:
+            restore_snapshot()
+            print(f"Warm start: skipping {strategy}, as it could not find a placement scheme ({exception})")
+            continue
+
+        hosts = model.read_placement()
+        restore_snapshot()
+
+        if (hosts < 0).any():
+            print(f"Warm start: skipping the placement found by {strategy}, as it does not host every service")
+        else:
+            placements.append(hosts)
+
+    return placements
+
+
+def get_initial_population(
+    pop_size: int, seed_value: int, warm_start: list = [], warm_start_ratio: float = 0, perturbation_rate: float = 0.1
+) -> list:
+    """Generates distinct feasible placement solutions that compose the initial population of the genetic algorithm. Each service is
+    hosted either by a random edge server or by the edge server closest to its user (with equal probability) among those with
+    enough free resources to host it. Part of the population may be seeded with the placement schemes found by heuristics and
+    perturbations of them.
+
+    Args:
+        pop_size (int): Number of solutions.
+        seed_value (int): Seed value of the random number generator used to sample solutions.
+        warm_start (list, optional): Names of the heuristics whose placement schemes seed the population. Defaults to [].
+        warm_start_ratio (float, optional): Share of the population seeded by heuristics. Defaults to 0.
+        perturbation_rate (float, optional): Share of the services moved by each perturbation. Defaults to 0.1.
+
+    Returns:
+        initial_population (list): Generated placement solutions.
+    """
+    seeds = get_heuristic_placements(strategies=warm_start)
+
+    sampler = PopulationSampler()
+    initial_population = sampler.get_population(
+        rng=np.random.default_rng(seed_value),
+        size=pop_size,
+        seeds=seeds,
+        seeded_size=max(len(seeds), round(warm_start_ratio * pop_size)) if len(seeds) > 0 else 0,
+        perturbation_rate=perturbation_rate,
+    )
+
+    if len(initial_population) < pop_size:
+        print(f"Initial population: sampling stopped at {len(initial_population)} distinct placement schemes (fewer than {pop_size})")
+
+    return initial_population
 
-def nsgaii(parameters: dict = {}):
-    # Parsing the NSGA-II parameters
-    pop_size = parameters["pop_size"]
-    n_gen = parameters["n_gen"]
-    cross_prob = parameters["cross_prob"]
-    mut_prob = parameters["mut_prob"]
 
-    # Generating initial population for the NSGA-II algorithm
-    initial_population = []
-    while len(initial_population) < pop_size:
-        placement = random_fit()
-        if placement not in initial_population:
-            initial_population.append(placement)
+def create_algorithm(pop_size: int, initial_population: list, cross_prob: float, mut_prob: float, delta_evaluation: bool) -> object:
+    """Creates the NSGA-II algorithm.
 
-    # Defining the NSGA-II attributes
+    Args:
+        pop_size (int): Population size.
+        initial_population (list): Placement solutions that compose the initial population.
+        cross_prob (float): Crossover probability.
+        mut_prob (float): Mutation probability.
+        delta_evaluation (bool): Whether the parents of offspring are registered, enabling delta evaluation.
+
+    Returns:
+        algorithm (object): NSGA-II algorithm.
+    """
     algorithm = NSGA2(
         pop_size=pop_size,
         sampling=np.array(initial_population),
@@ -143,20 +395,316 @@ def nsgaii(parameters: dict = {}):
         mutation=get_mutation("int_pm", prob=mut_prob),
         eliminate_duplicates=True,
     )
+    if delta_evaluation:
+        algorithm.mating = ParentTrackingMating(
+            selection=TournamentSelection(func_comp=binary_tournament),
+            crossover=algorithm.mating.crossover,
+            mutation=algorithm.mating.mutation,
+            repair=algorithm.repair,
+            eliminate_duplicates=DefaultDuplicateElimination(),
+            n_max_iterations=100,
+        )
+
+    return algorithm
+
+
+def get_elites(population: object, migrants: int) -> np.ndarray:
+    """Selects the elite solutions of an island that migrate to another island, i.e., the solutions of its Pareto front that lie
+    in the least crowded regions of the objective space.
+
+    Args:
+        population (object): Pareto front of the island.
+        migrants (int): Maximum number of migrating solutions.
+
+    Returns:
+        elites (np.ndarray): Migrating solutions (one placement scheme per row).
+    """
+    crowding = population.get("crowding")
+    if crowding is None or len(population) <= migrants:
+        return population.get("X")[:migrants]
+
+    return population.get("X")[np.argsort(-crowding.astype(float), kind="stable")[:migrants]]
+
+
+def receive_immigrants(algorithm: object, immigrants: np.ndarray):
+    """Incorporates solutions received from another island into the population of an island, which then goes through the survival
+    stage of NSGA-II to keep its size.
+
+    Args:
+        algorithm (object): Algorithm being executed by the island.
+        immigrants (np.ndarray): Received solutions (one placement scheme per row).
+    """
+    immigrants = DefaultDuplicateElimination().do(Population.new("X", immigrants), algorithm.pop)
+    if len(immigrants) == 0:
+        return
+
+    algorithm.evaluator.eval(algorithm.problem, immigrants, algorithm=algorithm)
+    population = Population.merge(algorithm.pop, immigrants)
+    algorithm.pop = algorithm.survival.do(algorithm.problem, population, n_survive=algorithm.pop_size, algorithm=algorithm)
+    algorithm._set_optimum()
+
+
+def run_island(connection: object, island: dict):
+    """Runs an island of the island-model NSGA-II inside its own process. Every few generations, the island sends its elite
+    solutions to the coordinator process and waits for the elite solutions of its neighbor island. Once its search stops, the
+    island sends its Pareto front to the coordinator.
+
+    Args:
+        connection (object): Connection with the coordinator process.
+        island (dict): Island parameters (evaluator, initial population, genetic operators, seed value, and termination criteria).
+    """
+    problem = PlacementProblem(evaluator=island["evaluator"], fitness_cache_size=island["fitness_cache_size"])
+    algorithm = create_algorithm(
+        pop_size=island["pop_size"],
+        initial_population=island["initial_population"],
+        cross_prob=island["cross_prob"],
+        mut_prob=island["mut_prob"],
+        delta_evaluation=island["delta_evaluation"],
+    )
+    termination = ConvergenceTermination(
+        n_max_gen=island["n_gen"], patience=island["patience"], hv_tolerance=island["hv_tolerance"], max_time=island["max_time"]
+    )
+
+    algorithm.setup(problem, termination=termination, seed=island["seed"], verbose=False)
+    while algorithm.has_next():
+        algorithm.next()
+        if algorithm.has_next() and algorithm.n_gen % island["migration_interval"] == 0:
+            connection.send(("elites", get_elites(population=algorithm.opt, migrants=island["migrants"])))
+            receive_immigrants(algorithm=algorithm, immigrants=connection.recv())
+
+    termination = algorithm.termination
+    termination.record_forced_stop(algorithm=algorithm)
+
+    front = {
+        "X": algorithm.opt.get("X"),
+        "F": algorithm.opt.get("F"),
+        "CV": algorithm.opt.get("CV"),
+        "elites": get_elites(population=algorithm.opt, migrants=island["migrants"]),
+        "generation": termination.generation,
+        "reason": termination.reason,
+    }
+
+    # Gathering the effectiveness of the island's fitness cache
+    cache = problem.fitness_cache
+    front["hits"] = cache.hits if cache is not None else 0
+    front["misses"] = cache.misses if cache is not None else 0
+    front["evictions"] = cache.evictions if cache is not None else 0
+
+    connection.send(("front", front))
+    connection.close()
+
+
+def run_islands(islands: list) -> list:
+    """Runs the islands of the island-model NSGA-II in separate processes, coordinating their migrations. Islands are arranged in a
+    ring: at each migration, every island receives the elite solutions of the previous island (islands whose search has already
+    stopped keep sending the elite solutions of their final Pareto front).
+
+    Args:
+        islands (list): Parameters of each island.
+
+    Returns:
+        fronts (list): Pareto front of each island.
+    """
+    connections = []
+    processes = []
+    for island in islands:
+        connection, island_connection = Pipe()
+        process = Process(target=run_island, args=(island_connection, island))
+        process.start()
+        island_connection.close()
+        connections.append(connection)
+        processes.append(process)
+
+    try:
+        elites = [None] * len(islands)
+        fronts = [None] * len(islands)
+        running_islands = list(range(len(islands)))
+        while len(running_islands) > 0:
+            # Gathering the elite solutions (or the final Pareto fronts) of islands that were still running
+            for index in running_islands:
+                message, content = connections[index].recv()
+                if message == "front":
+                    fronts[index] = content
+                    elites[index] = content["elites"]
+                else:
+                    elites[index] = content
+
+            # Sending each island that is still running the elite solutions of the previous island in the ring
+            running_islands = [index for index in running_islands if fronts[index] is None]
+            for index in running_islands:
+                connections[index].send(elites[index - 1])
+    finally:
+        for process in processes:
+            process.join()
+
+    return fronts
+
+
+def merge_fronts(fronts: list) -> tuple:
+    """Merges the Pareto fronts of the islands, keeping the solutions that are not dominated by solutions of any island (or the
+    least overloaded solution, if no island found a feasible one).
+
+    Args:
+        fronts (list): Pareto front of each island.
+
+    Returns:
+        front (tuple): Solutions, objectives, and penalties of the merged Pareto front.
+    """
+    solutions = np.concatenate([front["X"] for front in fronts])
+    objectives = np.concatenate([front["F"] for front in fronts])
+    penalties = np.concatenate([front["CV"] for front in fronts])
+
+    # Removing solutions found by more than one island
+    _, indices = np.unique(solutions, axis=0, return_index=True)
+    indices = np.sort(indices)
+
+    population = Population.new(
+        "X", solutions[indices], "F", objectives[indices], "CV", penalties[indices], "feasible", penalties[indices] <= 0
+    )
+    front = filter_optimum(population, least_infeasible=True)
+
+    return front.get("X"), front.get("F"), front.get("CV")
+
+
+def nsgaii(parameters: dict = {}):
+    # Parsing the NSGA-II parameters
+    pop_size = parameters["pop_size"]
+    n_gen = parameters["n_gen"]
+    cross_prob = parameters["cross_prob"]
+    mut_prob = parameters["mut_prob"]
+    workers = parameters.get("workers", 1)
+    seed_value = parameters.get("seed", 1)
+    fitness_cache_size = parameters.get("fitness_cache_size", 0)
+    patience = parameters.get("patience", 0)
+    hv_tolerance = parameters.get("hv_tolerance", 0)
+    max_time = parameters.get("max_time", 0)
+
+    # Parsing the island model parameters (islands use their own crossover and mutation probabilities, if specified)
+    islands = parameters.get("islands", 1)
+    migration_interval = parameters.get("migration_interval", 10)
+    migrants = parameters.get("migrants", 5)
+    island_cross_probs = parameters.get("island_cross_probs") or [cross_prob]
+    island_mut_probs = parameters.get("island_mut_probs") or [mut_prob]
+
+    # Parsing the warm start parameters (heuristics whose placement schemes and perturbations seed part of the initial population)
+    warm_start = parameters.get("warm_start", [])
+    warm_start_ratio = parameters.get("warm_start_ratio", 0.5)
+    perturbation_rate = parameters.get("perturbation_rate", 0.1)
+
+    # Delta evaluation relies on the parents of offspring, which are only known when offspring are evaluated in this process (each
+    # island evaluates its offspring in its own process)
+    delta_evaluation = parameters.get("delta_evaluation", False) and (workers <= 1 or islands > 1)
+
+    if islands > 1:
+        # Generating distinct initial populations for the islands (seeded solutions are spread over islands)
+        with INSTRUMENTATION.timer("nsgaii.initial_population"):
+            initial_population = get_initial_population(
+                pop_size=pop_size * islands,
+                seed_value=seed_value,
+                warm_start=warm_start,
+                warm_start_ratio=warm_start_ratio,
+                perturbation_rate=perturbation_rate,
+            )
 
-    # Running the NSGA-II algorithm
-    problem = PlacementProblem()
-    res = minimize(problem, algorithm, termination=("n_gen", n_gen), seed=1, verbose=VERBOSE, display=TheaDisplay())
+        if delta_evaluation:
+            evaluator = DeltaPopulationEvaluator(max_cached_states=2 * pop_size)
+        else:
+            evaluator = PopulationEvaluator()
+
+        # Running the islands, each with its own seed value, and merging their Pareto fronts
+        with INSTRUMENTATION.timer("nsgaii.optimization"):
+            fronts = run_islands(
+                islands=[
+                    {
+                        "evaluator": evaluator,
+                        "initial_population": initial_population[island::islands],
+                        "pop_size": pop_size,
+                        "cross_prob": island_cross_probs[island % len(island_cross_probs)],
+                        "mut_prob": island_mut_probs[island % len(island_mut_probs)],
+                        "delta_evaluation": delta_evaluation,
+                        "fitness_cache_size": fitness_cache_size,
+                        "seed": seed_value + island,
+                        "n_gen": n_gen,
+                        "patience": patience,
+                        "hv_tolerance": hv_tolerance,
+                        "max_time": max_time,
+                        "migration_interval": migration_interval,
+                        "migrants": migrants,
+                    }
+                    for island in range(islands)
+                ]
+            )
+        X, F, CV = merge_fronts(fronts=fronts)
+
+        # Recording the generation at which the longest search stopped and the reason why
+        for island, front in enumerate(fronts):
+            print(f"Island {island} stopped at generation {front['generation']} ({front['reason']})")
+        last_front = max(fronts, key=lambda front: front["generation"])
+        Topology.first().termination = {"stopping_generation": last_front["generation"], "stopping_reason": last_front["reason"]}
+
+        # Reporting the effectiveness of the fitness caches of the islands
+        if fitness_cache_size > 0:
+            hits, misses, evictions = [sum(front[counter] for front in fronts) for counter in ["hits", "misses", "evictions"]]
+            print(f"Fitness cache: {hits} hits, {misses} misses, {evictions} evictions (across {islands} islands)")
+
+    else:
+        # Generating initial population for the NSGA-II algorithm
+        with INSTRUMENTATION.timer("nsgaii.initial_population"):
+            initial_population = get_initial_population(
+                pop_size=pop_size,
+                seed_value=seed_value,
+                warm_start=warm_start,
+                warm_start_ratio=warm_start_ratio,
+                perturbation_rate=perturbation_rate,
+            )
+
+        # Defining the NSGA-II attributes
+        algorithm = create_algorithm(
+            pop_size=pop_size,
+            initial_population=initial_population,
+            cross_prob=cross_prob,
+            mut_prob=mut_prob,
+            delta_evaluation=delta_evaluation,
+        )
+
+        # Running the NSGA-II algorithm
+        problem = PlacementProblem(
+            workers=workers,
+            delta_evaluation=delta_evaluation,
+            max_cached_states=2 * pop_size,
+            fitness_cache_size=fitness_cache_size,
+        )
+        termination = ConvergenceTermination(n_max_gen=n_gen, patience=patience, hv_tolerance=hv_tolerance, max_time=max_time)
+        try:
+            with INSTRUMENTATION.timer("nsgaii.optimization"):
+                res = minimize(problem, algorithm, termination=termination, seed=seed_value, verbose=VERBOSE, display=TheaDisplay())
+        finally:
+            problem.close()
+        X, F, CV = res.X, res.F, res.CV
+
+        # Recording the generation at which the search stopped and the reason why (the criterion is copied by "minimize"), including
+        # stops forced by the algorithm when mating generates no new offspring
+        termination = res.algorithm.termination
+        termination.record_forced_stop(algorithm=res.algorithm)
+        Topology.first().termination = {"stopping_generation": termination.generation, "stopping_reason": termination.reason}
+        print(f"NSGA-II stopped at generation {termination.generation} ({termination.reason})")
+
+        # Reporting the effectiveness of the fitness cache
+        if problem.fitness_cache is not None:
+            cache = problem.fitness_cache
+            print(
+                f"Fitness cache: {cache.hits} hits, {cache.misses} misses, {cache.evictions} evictions ({len(cache.entries)} entries)"
+            )
 
     # Parsing the NSGA-II's output
     solutions = []
-    for i in range(len(res.X)):
+    for i in range(len(X)):
         solution = {
-            "placement": res.X[i].tolist(),
-            "Delay Violations": res.F[i][0],
-            "Priv. Violations": res.F[i][1],
-            "Power Consumption": res.F[i][2],
-            "overloaded_servers": res.CV[i][0].tolist(),
+            "placement": X[i].tolist(),
+            "Delay Violations": F[i][0],
+            "Priv. Violations": F[i][1],
+            "Power Consumption": F[i][2],
+            "overloaded_servers": CV[i][0].tolist(),
         }
         solutions.append(solution)
 
@@ -165,4 +713,5 @@ def nsgaii(parameters: dict = {}):
         solutions, key=lambda solution: (solution["Delay Violations"], solution["Priv. Violations"], solution["Power Consumption"])
     )[0]["placement"]
 
-    apply_placement(solution=best_solution)
+    model = get_placement_model()
+    model.write_placement(hosts=model.edge_server_index_by_id[best_solution])
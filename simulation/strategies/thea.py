@@ -1,10 +1,16 @@
 # Importing EdgeSimPy components
+from edge_sim_py.components.topology import Topology
 from edge_sim_py.components.edge_server import EdgeServer
 from edge_sim_py.components.application import Application
 from edge_sim_py.components.service import Service
 
 # Importing helper methods
 from simulation.helper_methods import *
+from simulation.placement_model import get_placement_model
+from simulation.instrumentation import INSTRUMENTATION
+
+# Importing Python libraries
+import numpy as np
 
 
 def thea(parameters: dict = {}):
@@ -16,27 +22,34 @@ def thea(parameters: dict = {}):
         parameters (dict, optional): Algorithm parameters. Defaults to {}.
     """
     # Sorting applications according to their delay and privacy scores
-    apps_metadata = []
-    for app in [app for app in Application.all() if not app.provisioned]:
-        app_attrs = {
-            "object": app,
-            "number_of_services": len(app.services),
-            "delay_sla": app.users[0].delay_slas[str(app.id)],
-            "delay_score": get_application_delay_score(app=app),
-            "privacy_score": get_application_privacy_score(app=app),
-        }
-        apps_metadata.append(app_attrs)
+    with INSTRUMENTATION.timer("thea.application_scoring"):
+        apps_metadata = []
+        for app in [app for app in Application.all() if not app.provisioned]:
+            app_attrs = {
+                "object": app,
+                "number_of_services": len(app.services),
+                "delay_sla": app.users[0].delay_slas[str(app.id)],
+                "delay_score": get_application_delay_score(app=app),
+                "privacy_score": get_application_privacy_score(app=app),
+            }
+            apps_metadata.append(app_attrs)
 
     # Gathering the application with the highest delay and privacy score to be provisioned
-    min_and_max = find_minimum_and_maximum(metadata=apps_metadata)
-    apps_metadata = sorted(
-        apps_metadata,
-        key=lambda app: (
-            get_norm(metadata=app, attr_name="delay_score", min=min_and_max["minimum"], max=min_and_max["maximum"])
-            + get_norm(metadata=app, attr_name="privacy_score", min=min_and_max["minimum"], max=min_and_max["maximum"])
-        ),
-        reverse=True,
-    )
+    with INSTRUMENTATION.timer("thea.application_sorting"):
+        min_and_max = find_minimum_and_maximum(metadata=apps_metadata)
+        apps_metadata = sorted(
+            apps_metadata,
+            key=lambda app: (
+                get_norm(metadata=app, attr_name="delay_score", min=min_and_max["minimum"], max=min_and_max["maximum"])
+                + get_norm(metadata=app, attr_name="privacy_score", min=min_and_max["minimum"], max=min_and_max["maximum"])
+            ),
+            reverse=True,
+        )
+
+    # Indexing the services that are not provisioned yet to speed up the calculation of the affected services cost
+    with INSTRUMENTATION.timer("thea.affected_services_index"):
+        affected_services_index = AffectedServicesIndex()
+        scoring_kernel = HostScoringKernel(affected_services_index=affected_services_index)
 
     # Iterating over the sorted list of applications to provision their services
     for app_metadata in apps_metadata:
@@ -45,32 +58,20 @@ def thea(parameters: dict = {}):
 
         # Iterating over the list of services that compose the application
         for service in app.services:
-            # Gathering the list of edge servers candidates for hosting the service
-            edge_servers = get_host_candidates(user=user, service=service)
-
-            # Finding the minimum and maximum values for the edge server attributes
-            min_and_max = find_minimum_and_maximum(metadata=edge_servers)
-
-            # Sorting edge server host candidates based on the number of SLA violations they
-            # would cause to the application and their power consumption and delay costs
-            edge_servers = sorted(
-                edge_servers,
-                key=lambda s: (
-                    s["sla_violations"],
-                    get_norm(metadata=s, attr_name="affected_services_cost", min=min_and_max["minimum"], max=min_and_max["maximum"])
-                    + get_norm(metadata=s, attr_name="power_consumption", min=min_and_max["minimum"], max=min_and_max["maximum"])
-                    + get_norm(metadata=s, attr_name="delay_cost", min=min_and_max["minimum"], max=min_and_max["maximum"]),
-                ),
-            )
-
-            # Greedily iterating over the list of edge servers to find a host for the service
-            for edge_server_metadata in edge_servers:
-                edge_server = edge_server_metadata["object"]
-
-                # Provisioning the service on the best edge server found it it has enough resources
-                if edge_server.has_capacity_to_host(service):
-                    provision(user=user, application=app, service=service, edge_server=edge_server)
-                    break
+            # Scoring edge server host candidates based on the number of SLA violations they would cause to the application and their
+            # power consumption and delay costs
+            with INSTRUMENTATION.timer("thea.host_scoring"):
+                edge_servers = scoring_kernel.get_ranking(user=user, service=service)
+
+            # Greedily iterating over the ranking of edge servers to find a host for the service
+            with INSTRUMENTATION.timer("thea.host_selection"):
+                for edge_server in edge_servers:
+                    # Provisioning the service on the best edge server found it it has enough resources
+                    if edge_server.has_capacity_to_host(service):
+                        provision(user=user, application=app, service=service, edge_server=edge_server)
+                        affected_services_index.remove(service=service)
+                        scoring_kernel.update(edge_server=edge_server)
+                        break
 
         # Setting the application as provisioned once all of its services have been provisioned
         if all([service.server != None for service in app.services]):
@@ -129,63 +130,216 @@ def get_application_privacy_score(app: object):
     return app_privacy_score
 
 
-def get_host_candidates(user: object, service: object) -> list:
-    """Get list of host candidates for hosting services of a given user.
-    Args:
-        user (object): User object.
-    Returns:
-        host_candidates (list): List of host candidates.
-    """
-    chain = list([service.application.users[0]] + service.application.services)
-    prev_item = chain[chain.index(service) - 1]
-    switch_of_previous_item_in_chain = (
-        prev_item.base_station.network_switch if chain.index(service) - 1 == 0 else prev_item.server.network_switch
-    )
-    app_delay = user.delays[str(service.application.id)] if user.delays[str(service.application.id)] is not None else 0
+class AffectedServicesIndex:
+    """Index of the services not provisioned yet that could rely on each edge server regarding the trust degree between their users
+    and the edge server's infrastructure provider.
 
-    host_candidates = []
+    Services are grouped by the network switch of their users and by the edge servers they could rely on, as services in the same
+    group have the same distance cost (1 / delay between the service's user and the edge server) on every edge server. The index keeps
+    the distance costs of each group, whereas the affected services cost of edge servers is recomputed from scratch whenever it is
+    requested, adding the distance costs of non-provisioned services one at a time in the order of "Service.all()". Thus, costs only
+    depend on which services are not provisioned yet (and not on the order in which services were provisioned).
+    """
 
-    for edge_server in EdgeServer.all():
-        additional_delay = calculate_path_delay(
-            origin_network_switch=switch_of_previous_item_in_chain, target_network_switch=edge_server.network_switch
-        )
-        overall_delay = app_delay + additional_delay
-        delay_cost = additional_delay if service == service.application.services[-1] else 0
+    # Maximum number of (service, edge server) distance costs gathered at once while summing the affected services cost
+    MAX_CHUNK_ENTRIES = 2**20
+
+    def __init__(self):
+        """Creates the index based on the services that are not provisioned yet."""
+        model = get_placement_model()
+        self.edge_server_indices = {edge_server: index for index, edge_server in enumerate(EdgeServer.all())}
+
+        # Grouping non-provisioned services by their users' switch and the edge servers of providers their users trust enough
+        groups = {}
+        group_distance_costs = []
+        service_groups = []
+        self.service_indices = {}
+        for service in Service.all():
+            if service.server is None:
+                user = model.user_index_by_id[service.application.users[0].id]
+                trusted_edge_servers = model.user_trust[user, model.edge_server_provider] >= service.privacy_requirement
+                key = (model.user_switch[user].item(), trusted_edge_servers.tobytes())
+
+                if key not in groups:
+                    groups[key] = len(group_distance_costs)
+                    distances = model.switch_delays[model.user_switch[user], model.edge_server_switch]
+                    group_distance_costs.append(np.where(trusted_edge_servers, 1 / np.maximum(1, distances), 0))
+
+                self.service_indices[service] = len(service_groups)
+                service_groups.append(groups[key])
+
+        self.distance_costs = np.array(group_distance_costs).reshape(-1, len(model.edge_server_ids))
+        self.service_groups = np.array(service_groups, dtype=int)
+        self.pending = np.ones(len(service_groups), dtype=bool)
+        self.chunk_size = max(1, self.MAX_CHUNK_ENTRIES // max(1, len(model.edge_server_ids)))
+
+    def get_costs(self, service: object) -> np.ndarray:
+        """Gets the distance cost of the non-provisioned services (except a given service) that could rely on each edge server.
+
+        Args:
+            service (object): Service that must not be considered (i.e., the service being provisioned).
+
+        Returns:
+            costs (np.ndarray): Sum of the distance costs of the non-provisioned services that could rely on each edge server.
+        """
+        pending = self.pending.copy()
+        if service in self.service_indices:
+            pending[self.service_indices[service]] = False
+        groups = self.service_groups[pending]
+
+        # Adding the distance costs of services one at a time (sums over the first axis of an array are sequential), carrying the
+        # partial sum over chunks of services
+        costs = np.zeros(self.distance_costs.shape[1])
+        for start in range(0, len(groups), self.chunk_size):
+            chunk = self.distance_costs[groups[start : start + self.chunk_size]]
+            costs = np.concatenate((costs[None, :], chunk)).sum(axis=0)
+
+        return costs
+
+    def remove(self, service: object):
+        """Removes a service (that has just been provisioned) from the index.
+
+        Args:
+            service (object): Provisioned service.
+        """
+        index = self.service_indices.pop(service, None)
+        if index is not None:
+            self.pending[index] = False
+
+
+class HostScoringKernel:
+    """Scores the edge servers that could host a service as arrays, following the order of "EdgeServer.all()".
+
+    For each service, the number of SLA violations (delay and privacy), the affected services cost, the power consumption cost, and
+    the delay cost of all edge servers are calculated at once and normalized in a single pass (Min-Max normalization, as done by
+    "find_minimum_and_maximum" and "get_norm"). Edge servers are ranked by their SLA violations and the sum of their normalized costs
+    (ties keep the order of "EdgeServer.all()"). As the service is usually hosted by one of the first edge servers of the ranking,
+    the ranking is built in chunks: only the edge servers with the lowest keys are sorted, and further chunks are sorted on demand.
+
+    Costs that are equal for all edge servers are normalized to 1, as done by "get_norm". This is the case of the affected services
+    and delay costs of services that are not the last of their application's chain, which thus add a constant 2 to every score. The
+    constant does not change the ranking by itself, but it is kept so that scores are rounded (and tied) exactly as in "get_norm" sums.
+    """
 
-        # Checking if any of the SLAs (delay or privacy) would be violated by hosting the service on the edge server
-        violates_privacy_sla = 1 if user.providers_trust[str(edge_server.infrastructure_provider)] < service.privacy_requirement else 0
-        violates_delay_sla = 1 if overall_delay > user.delay_slas[str(service.application.id)] else 0
+    # Number of edge servers sorted at once while building rankings
+    CHUNK_SIZE = 16
+
+    def __init__(self, affected_services_index: object):
+        """Gathers the edge server attributes used to score host candidates.
+
+        Args:
+            affected_services_index (object): Index of the services not provisioned yet.
+        """
+        model = get_placement_model()
+        self.affected_services_index = affected_services_index
+        self.edge_servers = EdgeServer.all()
+        self.edge_server_indices = affected_services_index.edge_server_indices
+
+        self.switch_delays = model.switch_delays
+        self.switch_indices = Topology.first().switch_indices
+        self.edge_server_switch = model.edge_server_switch
+        self.edge_server_provider = model.edge_server_provider
+        self.user_trust = model.user_trust
+        self.user_index_by_id = model.user_index_by_id
+
+        # Gathering the power consumption cost of each edge server, whose static part only applies to edge servers hosting no services
+        self.consumption_per_core = model.edge_server_max_power_consumption / model.edge_server_cpu
+        self.static_power_consumption = model.edge_server_static_power_percentage
+        self.idle = np.array([1 - sign(edge_server.cpu_demand) for edge_server in self.edge_servers])
+
+    def update(self, edge_server: object):
+        """Refreshes the power consumption cost of an edge server that has just received a service.
+
+        Args:
+            edge_server (object): Edge server whose CPU demand changed.
+        """
+        self.idle[self.edge_server_indices[edge_server]] = 1 - sign(edge_server.cpu_demand)
+
+    def get_ranking(self, user: object, service: object) -> object:
+        """Ranks the edge servers that could host a service.
+
+        Args:
+            user (object): User of the service's application.
+            service (object): Service being provisioned.
+
+        Returns:
+            ranking (object): Iterator over the edge servers, from the best host candidate to the worst.
+        """
+        app = service.application
+        is_last_service = service == app.services[-1]
+
+        # Gathering the network switch of the previous item in the application's chain (its user or its previous service)
+        position = app.services.index(service)
+        if position == 0:
+            previous_switch = app.users[0].base_station.network_switch
+        else:
+            previous_switch = app.services[position - 1].server.network_switch
+        app_delay = user.delays[str(app.id)] if user.delays[str(app.id)] is not None else 0
+
+        # Checking which edge servers would violate the SLAs (delay or privacy) if they hosted the service
+        additional_delay = self.switch_delays[self.switch_indices[previous_switch], self.edge_server_switch]
+        trust = self.user_trust[self.user_index_by_id[user.id], self.edge_server_provider]
+        violates_privacy_sla = (trust < service.privacy_requirement).astype(int)
+        violates_delay_sla = (app_delay + additional_delay > user.delay_slas[str(app.id)]).astype(int)
         sla_violations = violates_delay_sla + violates_privacy_sla
 
-        # Gathering the edge server's power consumption cost based on its CPU usage
-        static_power_consumption = edge_server.power_model_parameters["static_power_percentage"]
-        consumption_per_core = edge_server.power_model_parameters["max_power_consumption"] / edge_server.cpu
-        power_consumption = consumption_per_core + static_power_consumption * (1 - sign(edge_server.cpu_demand))
-
-        # Gathering the list of non-provisioned services that could possibly rely on the edge server regarding its trust degree
-        affected_services = []
-        for affected_service in Service.all():
-            affected_user = affected_service.application.users[0]
-            trust_on_the_edge_server = affected_user.providers_trust[str(edge_server.infrastructure_provider)]
-            relies_on_the_edge_server = trust_on_the_edge_server >= affected_service.privacy_requirement
-
-            if affected_service.server is None and affected_service != service and relies_on_the_edge_server:
-                distance_to_affected_user = calculate_path_delay(
-                    origin_network_switch=affected_user.base_station.network_switch, target_network_switch=edge_server.network_switch
-                )
-                distance_cost = 1 / max(1, distance_to_affected_user)
-                affected_services.append(distance_cost)
-
-        affected_services_cost = sum(affected_services) if service == service.application.services[-1] else 0
-
-        host_candidates.append(
-            {
-                "object": edge_server,
-                "sla_violations": sla_violations,
-                "affected_services_cost": affected_services_cost,
-                "power_consumption": power_consumption,
-                "delay_cost": delay_cost,
-            }
-        )
+        # Gathering the power consumption cost, and (only for the last service of the application) the affected services cost and
+        # the delay cost of each edge server (both are zero, and thus normalized to 1, for the other services)
+        power_consumption = self.consumption_per_core + self.static_power_consumption * self.idle
+        if is_last_service:
+            affected_services_cost = self.affected_services_index.get_costs(service=service)
+            delay_cost = additional_delay
+        else:
+            affected_services_cost = np.zeros(len(self.edge_servers))
+            delay_cost = np.zeros(len(self.edge_servers))
+
+        scores = normalize(values=affected_services_cost) + normalize(values=power_consumption) + normalize(values=delay_cost)
+
+        return self.iterate_ranking(sla_violations=sla_violations, scores=scores)
+
+    def iterate_ranking(self, sla_violations: np.ndarray, scores: np.ndarray) -> object:
+        """Iterates over edge servers sorted by their SLA violations and scores, sorting a chunk of edge servers at a time. Chunks
+        hold up to "CHUNK_SIZE" edge servers: when the chunk's threshold score is tied, the tied edge servers that come first in the
+        order of "EdgeServer.all()" join the chunk, whereas the others are left for further chunks (as in a stable sort).
+
+        Args:
+            sla_violations (np.ndarray): Number of SLA violations of each edge server.
+            scores (np.ndarray): Sum of the normalized costs of each edge server.
+
+        Yields:
+            edge_server (object): Next edge server of the ranking.
+        """
+        for violations in np.unique(sla_violations):
+            candidates = np.flatnonzero(sla_violations == violations)
+            while len(candidates) > 0:
+                # Selecting the edge servers whose scores are below the chunk's threshold, filling the chunk with the first edge
+                # servers whose scores match the threshold (candidates follow the order of "EdgeServer.all()")
+                if len(candidates) > self.CHUNK_SIZE:
+                    candidate_scores = scores[candidates]
+                    threshold = np.partition(candidate_scores, self.CHUNK_SIZE - 1)[self.CHUNK_SIZE - 1]
+                    selected = candidate_scores < threshold
+                    ties = np.flatnonzero(candidate_scores == threshold)
+                    selected[ties[: self.CHUNK_SIZE - np.count_nonzero(selected)]] = True
+                    chunk, candidates = candidates[selected], candidates[~selected]
+                else:
+                    chunk, candidates = candidates, candidates[:0]
+
+                for index in chunk[np.argsort(scores[chunk], kind="stable")].tolist():
+                    yield self.edge_servers[index]
+
+
+def normalize(values: np.ndarray) -> np.ndarray:
+    """Normalizes values using the Min-Max Normalization method (values are normalized to 1 if they are all equal).
+
+    Args:
+        values (np.ndarray): Values that must be normalized.
+
+    Returns:
+        normalized_values (np.ndarray): Normalized values.
+    """
+    minimum = values.min()
+    maximum = values.max()
+    if minimum == maximum:
+        return np.ones(len(values))
 
-    return host_candidates
+    return (values - minimum) / (maximum - minimum)
@@ -0,0 +1,112 @@
+# Importing EdgeSimPy components
+from edge_sim_py.components.topology import Topology
+from edge_sim_py.components.edge_server import EdgeServer
+
+# Importing the placement model
+from simulation.placement_model import get_placement_model
+
+# Importing Python libraries
+import numpy as np
+
+
+class UserServerIndex:
+    """Edge servers ranked for each user by the user's trust degree on their infrastructure providers (descending) and their delay
+    to the user's base station (ascending), ties keeping the order of "EdgeServer.all()".
+
+    Rankings only depend on the network switch of the user's base station and on the user's trust degrees, so users sharing both
+    share a ranking. Rankings are built once (when first requested) and split into groups of edge servers with the same trust degree
+    and delay, so that dynamic tiebreaks (e.g., free CPU) only sort the members of the groups being visited.
+    """
+
+    def __init__(self):
+        """Creates the (initially empty) index."""
+        model = get_placement_model()
+        self.edge_servers = EdgeServer.all()
+        self.switch_delays = model.switch_delays
+        self.edge_server_switch = model.edge_server_switch
+        self.edge_server_provider = model.edge_server_provider
+        self.user_trust = model.user_trust
+        self.user_switch = model.user_switch
+        self.user_index_by_id = model.user_index_by_id
+
+        # Declaring the rankings (indexed by user switch and trust degrees) and the ranking of each user
+        self.rankings = {}
+        self.user_rankings = {}
+
+    def get_ranking(self, user: object) -> dict:
+        """Gets the ranking of edge servers of a user, building it at the first request.
+
+        Args:
+            user (object): User whose ranking is requested.
+
+        Returns:
+            ranking (dict): Ranked edge servers and the boundaries of the groups of edge servers with the same trust degree and delay.
+        """
+        ranking = self.user_rankings.get(user)
+        if ranking is not None:
+            return ranking
+
+        index = self.user_index_by_id[user.id]
+        trust = self.user_trust[index, self.edge_server_provider]
+        key = (self.user_switch[index].item(), trust.tobytes())
+
+        ranking = self.rankings.get(key)
+        if ranking is None:
+            delays = self.switch_delays[self.user_switch[index], self.edge_server_switch]
+            order = np.lexsort((delays, -trust))
+
+            # Finding where groups of edge servers with the same trust degree and delay begin and end
+            changes = (np.diff(trust[order]) != 0) | (np.diff(delays[order]) != 0)
+            boundaries = [0] + (np.flatnonzero(changes) + 1).tolist() + [len(order)]
+
+            ranking = self.rankings[key] = {
+                "edge_servers": [self.edge_servers[index] for index in order.tolist()],
+                "groups": list(zip(boundaries[:-1], boundaries[1:])),
+            }
+
+        self.user_rankings[user] = ranking
+        return ranking
+
+    def get_edge_servers(self, user: object) -> list:
+        """Gets the edge servers ranked by trust degree and delay for a user.
+
+        Args:
+            user (object): User whose ranking is requested.
+
+        Returns:
+            edge_servers (list): Ranked edge servers.
+        """
+        return self.get_ranking(user=user)["edge_servers"]
+
+    def iterate_by_free_cpu(self, user: object) -> object:
+        """Iterates over the edge servers ranked by trust degree and delay for a user, breaking ties by the free CPU of edge servers
+        (ascending) at the moment each group of tied edge servers is visited.
+
+        Args:
+            user (object): User whose ranking is requested.
+
+        Yields:
+            edge_server (object): Next edge server of the ranking.
+        """
+        ranking = self.get_ranking(user=user)
+        edge_servers = ranking["edge_servers"]
+
+        for start, end in ranking["groups"]:
+            if end - start == 1:
+                yield edge_servers[start]
+            else:
+                yield from sorted(edge_servers[start:end], key=lambda edge_server: edge_server.cpu - edge_server.cpu_demand)
+
+
+def get_user_server_index() -> UserServerIndex:
+    """Gets the index of edge servers ranked for each user of the loaded scenario, which is created at the first call and stored
+    within the network topology.
+
+    Returns:
+        index (UserServerIndex): Index of edge servers ranked for each user.
+    """
+    topology = Topology.first()
+    if not hasattr(topology, "user_server_index"):
+        topology.user_server_index = UserServerIndex()
+
+    return topology.user_server_index
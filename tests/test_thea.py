@@ -0,0 +1,128 @@
+# Importing EdgeSimPy components
+from edge_sim_py import *
+
+# Importing the simulation entry point and the strategy being tested
+from simulation.__main__ import main
+from simulation.strategies import thea
+
+# Importing helper methods
+from simulation.helper_methods import calculate_path_delay, find_minimum_and_maximum, get_norm, sign
+
+# Importing benchmark helpers
+from benchmarks.strategies import create_scenario
+
+# Importing Python libraries
+from contextlib import redirect_stdout
+import unittest
+import tempfile
+import os
+
+
+def get_affected_services_cost(edge_server: object, service: object) -> float:
+    """Calculates the affected services cost of an edge server as done by the original implementation of Thea (i.e., summing the
+    distance costs of the non-provisioned services that could rely on the edge server in the order of "Service.all()").
+
+    Args:
+        edge_server (object): Edge server whose cost is calculated.
+        service (object): Service being provisioned.
+
+    Returns:
+        affected_services_cost (float): Affected services cost of the edge server.
+    """
+    affected_services = []
+    for affected_service in Service.all():
+        affected_user = affected_service.application.users[0]
+        trust_on_the_edge_server = affected_user.providers_trust[str(edge_server.infrastructure_provider)]
+        relies_on_the_edge_server = trust_on_the_edge_server >= affected_service.privacy_requirement
+
+        if affected_service.server is None and affected_service != service and relies_on_the_edge_server:
+            distance_to_affected_user = calculate_path_delay(
+                origin_network_switch=affected_user.base_station.network_switch, target_network_switch=edge_server.network_switch
+            )
+            affected_services.append(1 / max(1, distance_to_affected_user))
+
+    return sum(affected_services) if service == service.application.services[-1] else 0
+
+
+def get_reference_ranking(user: object, service: object) -> list:
+    """Ranks the edge servers that could host a service as done by the original implementation of Thea.
+
+    Args:
+        user (object): User of the service's application.
+        service (object): Service being provisioned.
+
+    Returns:
+        ranking (list): Edge servers, from the best host candidate to the worst.
+    """
+    app = service.application
+    chain = [user] + app.services
+    previous_item = chain[chain.index(service) - 1]
+    previous_switch = previous_item.base_station.network_switch if previous_item == user else previous_item.server.network_switch
+    app_delay = user.delays[str(app.id)] if user.delays[str(app.id)] is not None else 0
+
+    host_candidates = []
+    for edge_server in EdgeServer.all():
+        additional_delay = calculate_path_delay(
+            origin_network_switch=previous_switch, target_network_switch=edge_server.network_switch
+        )
+        violates_privacy_sla = 1 if user.providers_trust[str(edge_server.infrastructure_provider)] < service.privacy_requirement else 0
+        violates_delay_sla = 1 if app_delay + additional_delay > user.delay_slas[str(app.id)] else 0
+
+        static_power_consumption = edge_server.power_model_parameters["static_power_percentage"]
+        consumption_per_core = edge_server.power_model_parameters["max_power_consumption"] / edge_server.cpu
+
+        host_candidates.append(
+            {
+                "object": edge_server,
+                "sla_violations": violates_delay_sla + violates_privacy_sla,
+                "affected_services_cost": get_affected_services_cost(edge_server=edge_server, service=service),
+                "power_consumption": consumption_per_core + static_power_consumption * (1 - sign(edge_server.cpu_demand)),
+                "delay_cost": additional_delay if service == app.services[-1] else 0,
+            }
+        )
+
+    min_and_max = find_minimum_and_maximum(metadata=host_candidates)
+    host_candidates = sorted(
+        host_candidates,
+        key=lambda s: (
+            s["sla_violations"],
+            get_norm(metadata=s, attr_name="affected_services_cost", min=min_and_max["minimum"], max=min_and_max["maximum"])
+            + get_norm(metadata=s, attr_name="power_consumption", min=min_and_max["minimum"], max=min_and_max["maximum"])
+            + get_norm(metadata=s, attr_name="delay_cost", min=min_and_max["minimum"], max=min_and_max["maximum"]),
+        ),
+    )
+
+    return [host_candidate["object"] for host_candidate in host_candidates]
+
+
+class TestHostRanking(unittest.TestCase):
+    """Checks that Thea ranks host candidates exactly as its original implementation while provisioning a generated scenario."""
+
+    def test_rankings_match_the_original_implementation(self):
+        get_ranking = thea.HostScoringKernel.get_ranking
+        rankings = {"checked": 0, "different": []}
+
+        def checked_get_ranking(kernel: object, user: object, service: object) -> object:
+            ranking = list(get_ranking(kernel, user=user, service=service))
+            rankings["checked"] += 1
+            if ranking != get_reference_ranking(user=user, service=service):
+                rankings["different"].append(service)
+            return iter(ranking)
+
+        thea.HostScoringKernel.get_ranking = checked_get_ranking
+        working_directory = os.getcwd()
+        try:
+            with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                dataset = create_scenario(size="medium", directory=directory)
+                os.chdir(directory)
+                main(seed_value=1, algorithm="thea", dataset=dataset)
+        finally:
+            os.chdir(working_directory)
+            thea.HostScoringKernel.get_ranking = get_ranking
+
+        self.assertEqual(rankings["checked"], Service.count())
+        self.assertEqual(rankings["different"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()